@@ -1,38 +1,186 @@
+import ast
+import json
 import os
 from importlib import import_module as m_import
 from config import config
 
+# Bump when the manifest layout changes so old files are rescanned
+_MANIFEST_VERSION = 3
 
-def _get_app_list():
-    """Get list of available apps in specified order."""
-    app_config = config["app"]
+# Module-level functions an app may export
+_APP_HOOKS = ("create", "destroy", "is_running", "on_back", "suspend", "resume")
+
+
+def _read_app_metadata(app_name, app_path, previous=None):
+    """Describe an app file without importing it.
+
+    Args:
+        app_name (str): Name of the app
+        app_path (str): Path to the app's source file
+        previous (dict): Entry from the last manifest, reused if the file
+            hasn't changed
+
+    Returns:
+        dict: Manifest entry for the app
+    """
+    info = {
+        "name": app_name,
+        "path": app_path,
+        "mtime": 0,
+        "size": 0,
+        "hooks": [],
+    }
+    try:
+        stat = os.stat(app_path)
+    except OSError:
+        return info
+
+    if (
+        previous
+        and previous.get("mtime") == stat.st_mtime_ns
+        and previous.get("size") == stat.st_size
+    ):
+        return previous
+
+    info["mtime"] = stat.st_mtime_ns
+    info["size"] = stat.st_size
+    try:
+        with open(app_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=app_path)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"Error reading app '{app_name}': {e}")
+        return info
+
+    info["hooks"] = [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name in _APP_HOOKS
+    ]
+    return info
 
-    specific_order = app_config.APPS_PRIORITY_ORDER
-    list_of_apps = os.listdir(app_config.APPS_DIRECTORY)
-    list_of_apps2 = specific_order.copy()
 
-    for app in list_of_apps:
+def _scan_apps_directory(previous_apps=None):
+    """Scan the apps directory and describe every app found in it."""
+    app_config = config["app"]
+    previous_apps = previous_apps or {}
+
+    apps = {}
+    for app in os.listdir(app_config.APPS_DIRECTORY):
         if app not in app_config.RESTRICTED_FILES:
             app_path = os.path.join(app_config.APPS_DIRECTORY, app)
             if not os.path.isdir(app_path):
                 app_name = app.strip(".py")
-                if app_name not in list_of_apps2:
-                    list_of_apps2.append(app_name)
+                if app_name not in apps:
+                    apps[app_name] = _read_app_metadata(
+                        app_name, app_path, previous_apps.get(app_name)
+                    )
+    return apps
+
+
+def _load_manifest():
+    """Load the app manifest, re-reading only the app files that changed.
+
+    Every entry is keyed on its own file's mtime and size, so editing an app
+    refreshes its hooks and metadata even though the directory's mtime stays
+    the same. Listing the directory and stat-ing each file is cheap; only
+    parsing is skipped for unchanged files.
+
+    Returns:
+        dict: Manifest entries for every discovered app, keyed by name
+    """
+    app_config = config["app"]
+    manifest_file = app_config.APPS_MANIFEST_FILE
+    if not manifest_file:
+        return _scan_apps_directory()
+
+    manifest = None
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if (
+        isinstance(manifest, dict)
+        and manifest.get("version") == _MANIFEST_VERSION
+        and manifest.get("directory") == app_config.APPS_DIRECTORY
+        and isinstance(manifest.get("apps"), dict)
+    ):
+        previous_apps = manifest["apps"]
+    else:
+        previous_apps = None
+
+    apps = _scan_apps_directory(previous_apps)
+    if apps != previous_apps:
+        _save_manifest(
+            manifest_file,
+            {
+                "version": _MANIFEST_VERSION,
+                "directory": app_config.APPS_DIRECTORY,
+                "apps": apps,
+            },
+        )
+    return apps
+
+
+def _save_manifest(manifest_file, manifest):
+    """Write the manifest atomically so a crash never leaves half a file."""
+    temp_file = f"{manifest_file}.tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(temp_file, manifest_file)
+    except OSError as e:
+        print(f"Error saving app manifest: {e}")
+
+
+def _get_app_list():
+    """Get list of available apps in specified order."""
+    app_config = config["app"]
+
+    _app_info.clear()
+    _app_info.update(_load_manifest())
+
+    list_of_apps2 = app_config.APPS_PRIORITY_ORDER.copy()
+    for app_name in _app_info:
+        if app_name not in list_of_apps2:
+            list_of_apps2.append(app_name)
 
     return list_of_apps2
 
 
-def _get_app_modules(app_list):
-    """Import modules for all apps."""
-    modules_of_apps = []
-    for app_import in app_list:
-        modules_of_apps.append(m_import(f"{config['app'].APPS_DIRECTORY}.{app_import}"))
-    return modules_of_apps
+def _set_app_list(app_list):
+    """Replace the ordered app list and rebuild the lookup tables from it.
+
+    Args:
+        app_list (list): App names in display order
+    """
+    global _app_list, _app_index
+    _app_list = app_list
+    _app_index = {app_name: i for i, app_name in enumerate(app_list)}
+    # Drop modules for apps that are no longer listed
+    for app_name in [name for name in _app_modules if name not in _app_index]:
+        del _app_modules[app_name]
+
+
+def _load_app_module(app_name):
+    """Import the module for an app the first time it is needed."""
+    module = _app_modules.get(app_name)
+    if module is None:
+        module = m_import(f"{config['app'].APPS_DIRECTORY}.{app_name}")
+        _app_modules[app_name] = module
+    return module
 
 
-# Module-level initialization (these run once when the module is imported)
-_app_list = _get_app_list()
-_app_modules = _get_app_modules(_app_list)
+# Module-level initialization (these run once when the module is imported).
+# App modules are imported lazily, so only the manifest is read here.
+# _app_list keeps the display order; _app_index (name -> position) and
+# _app_modules (name -> imported module) give constant-time lookups.
+_app_info = {}
+_app_list = []
+_app_index = {}
+_app_modules = {}
+_set_app_list(_get_app_list())
 
 
 class app:
@@ -40,9 +188,9 @@ class app:
 
     def __init__(self, page, code, root):
         self.code = code
-        if code not in _app_list:
+        if code not in _app_index:
             raise ValueError(f"App '{code}' not found in available apps")
-        self.app = _app_modules[_app_list.index(code)]
+        self.app = _load_app_module(code)
         self.app.create(page, root)
 
 
@@ -51,15 +199,90 @@ def list():
     return _app_list
 
 
-def get_app_module(app_name):
+def get_app_module(app_name, load=True):
     """Get the module for a specific app.
 
     Args:
         app_name (str): Name of the app
+        load (bool): Import the module if it hasn't been imported yet. When
+            False, apps that were never opened return None.
 
     Returns:
         module: The app module or None if not found
     """
-    if app_name in _app_list:
-        return _app_modules[_app_list.index(app_name)]
+    if app_name in _app_index:
+        if load:
+            return _load_app_module(app_name)
+        return _app_modules.get(app_name)
     return None
+
+
+def index(app_name):
+    """Get the position of an app in the list returned by list().
+
+    Args:
+        app_name (str): Name of the app
+
+    Returns:
+        int: Index of the app or None if not found
+    """
+    return _app_index.get(app_name)
+
+
+def get_app_info(app_name):
+    """Get the manifest entry for an app without importing it.
+
+    Args:
+        app_name (str): Name of the app
+
+    Returns:
+        dict: Name, path, mtime, size and exported hooks, or None if
+            unknown
+    """
+    return _app_info.get(app_name)
+
+
+def has_hook(app_name, hook):
+    """Check whether an app exports a hook such as ``is_running`` or ``on_back``.
+
+    Apps missing from the manifest are assumed to export it, so callers fall
+    back to inspecting the module itself.
+    """
+    info = _app_info.get(app_name)
+    if info is None:
+        return True
+    return hook in info["hooks"]
+
+
+def warm_up(root, app_names):
+    """Import apps in the background while the Tk event loop is idle.
+
+    One module is imported per idle callback so a slow import never holds up
+    more than a single frame. Apps that are already loaded are skipped.
+
+    Args:
+        root: Tk root used to schedule the imports
+        app_names (list): Names of the apps to import
+    """
+    app_config = config["app"]
+    if not app_config.APPS_WARM_UP:
+        return
+
+    pending = [
+        name
+        for name in app_names
+        if name in _app_index and name not in _app_modules
+    ]
+    if not pending:
+        return
+
+    def import_next():
+        name = pending.pop(0)
+        try:
+            get_app_module(name)
+        except Exception as e:
+            print(f"Error warming up app '{name}': {e}")
+        if pending:
+            root.after_idle(import_next)
+
+    root.after(app_config.APPS_WARM_UP_DELAY, lambda: root.after_idle(import_next))
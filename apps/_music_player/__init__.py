@@ -0,0 +1 @@
+# Music player support modules
@@ -0,0 +1,336 @@
+import hashlib
+import os
+import queue
+import struct
+import threading
+from collections import OrderedDict
+
+# ID3v2 picture type of the front cover
+_FRONT_COVER = 3
+
+
+def _unsynchronise(data):
+    """Undo ID3v2 unsynchronisation, which puts a zero byte after each 0xFF"""
+    return data.replace(b"\xff\x00", b"\xff")
+
+
+def _terminator_end(data, start, encoding):
+    """Find where a null-terminated ID3 string ends, past its terminator"""
+    if encoding in (1, 2):  # UTF-16: two zero bytes, on a character boundary
+        position = start
+        while position + 1 < len(data):
+            if data[position : position + 2] == b"\0\0":
+                return position + 2
+            position += 2
+        return len(data)
+    end = data.find(b"\0", start)
+    return len(data) if end == -1 else end + 1
+
+
+def _read_picture_frame(frame_id, data):
+    """Decode an APIC (or ID3v2.2 PIC) frame into (picture type, image data)"""
+    if len(data) < 4:
+        return None
+    encoding = data[0]
+    if frame_id == b"PIC":
+        picture_type = data[4]
+        image_start = _terminator_end(data, 5, encoding)
+    else:
+        mime_end = _terminator_end(data, 1, 0)
+        picture_type = data[mime_end]
+        image_start = _terminator_end(data, mime_end + 1, encoding)
+    image = data[image_start:]
+    return (picture_type, image) if image else None
+
+
+def read_id3v2_pictures(tag):
+    """Get the pictures embedded in an ID3v2 tag.
+
+    Args:
+        tag (bytes): The tag, starting with its 10-byte ``ID3`` header
+
+    Returns:
+        list: (picture type, image data) pairs, in tag order
+    """
+    if len(tag) < 10 or tag[:3] != b"ID3":
+        return []
+    version, flags = tag[3], tag[5]
+    size = 0
+    for byte in tag[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    body = tag[10 : 10 + size]
+    if flags & 0x80 and version < 4:
+        body = _unsynchronise(body)
+
+    position = 0
+    if flags & 0x40 and len(body) >= 4:  # Skip the extended header
+        if version == 4:
+            for byte in body[:4]:
+                position = (position << 7) | (byte & 0x7F)
+        else:
+            position = struct.unpack(">I", body[:4])[0] + 4
+
+    id_length, header_length = (3, 6) if version == 2 else (4, 10)
+    pictures = []
+    while position + header_length <= len(body):
+        frame_id = body[position : position + id_length]
+        if not frame_id.strip(b"\0"):
+            break  # Padding
+        size_bytes = body[position + id_length : position + 2 * id_length]
+        if version == 4:
+            frame_size = 0
+            for byte in size_bytes:
+                frame_size = (frame_size << 7) | (byte & 0x7F)
+        else:
+            frame_size = int.from_bytes(size_bytes, "big")
+        data_start = position + header_length
+        data = body[data_start : data_start + frame_size]
+        position = data_start + frame_size
+
+        if frame_id not in (b"APIC", b"PIC"):
+            continue
+        if version == 4:
+            format_flags = body[data_start - 1]
+            if format_flags & 0x02:
+                data = _unsynchronise(data)
+            if format_flags & 0x01:  # Data length indicator
+                data = data[4:]
+        picture = _read_picture_frame(frame_id, data)
+        if picture:
+            pictures.append(picture)
+    return pictures
+
+
+def _read_id3v2_tag(f):
+    """Read an ID3v2 tag at the file's current position, or None"""
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return None
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    return header + f.read(size)
+
+
+def _wav_id3_tag(f, end):
+    """Find an ID3v2 tag in the chunks of a RIFF file, looking inside LISTs"""
+    while f.tell() + 8 <= end:
+        chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+        chunk_start = f.tell()
+        if chunk_id in (b"id3 ", b"ID3 "):
+            return _read_id3v2_tag(f)
+        if chunk_id == b"LIST":
+            f.read(4)  # List type
+            tag = _wav_id3_tag(f, chunk_start + chunk_size)
+            if tag:
+                return tag
+        # Chunks are padded to an even length
+        f.seek(chunk_start + chunk_size + chunk_size % 2)
+    return None
+
+
+def extract_art(song_path):
+    """Get the album art embedded in an MP3 or WAV file.
+
+    MP3s carry it in an ID3v2 APIC frame at the start of the file. WAVs
+    carry the same tag in an ``id3 `` chunk, sometimes inside a LIST.
+
+    Returns:
+        bytes: The encoded image, the front cover if there is one, or None
+    """
+    with open(song_path, "rb") as f:
+        start = f.read(12)
+        if start[:4] == b"RIFF" and start[8:12] == b"WAVE":
+            tag = _wav_id3_tag(f, os.fstat(f.fileno()).st_size)
+        else:
+            f.seek(0)
+            tag = _read_id3v2_tag(f)
+    pictures = read_id3v2_pictures(tag) if tag else []
+    for picture_type, image in pictures:
+        if picture_type == _FRONT_COVER:
+            return image
+    return pictures[0][1] if pictures else None
+
+
+def image_type(image):
+    """Guess an image's file type from its first bytes, for decoders"""
+    if image.startswith(b"\x89PNG"):
+        return "png"
+    if image[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    return "jpg"
+
+
+class ArtworkCache:
+    """Album art thumbnails, extracted and scaled once, kept on disk.
+
+    Art is extracted and scaled down on a worker thread, then saved as a
+    small PNG named after the song's path, size and mtime. An empty file
+    records that a song has no art, so it isn't searched again. Once there
+    are more than ``max_files`` thumbnails, the oldest are removed.
+    """
+
+    def __init__(self, cache_dir, size, make_thumbnail, max_files=1000):
+        """Create a cache.
+
+        Args:
+            cache_dir (str): Folder the thumbnails are kept in
+            size (int): Longest side of a thumbnail, in pixels
+            make_thumbnail: Called on the worker thread with the image data,
+                ``size`` and a ``.png`` path to save the thumbnail to
+            max_files (int): Thumbnails to keep on disk
+        """
+        self.cache_dir = cache_dir
+        self.size = size
+        self.make_thumbnail = make_thumbnail
+        self.max_files = max_files
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = set()
+        self.thread = None
+
+    def thumbnail_path(self, song_path):
+        """Get where a song's thumbnail is kept, or None if the song is gone"""
+        try:
+            stat = os.stat(song_path)
+        except OSError:
+            return None
+        key = f"{song_path}|{stat.st_size}|{stat.st_mtime_ns}|{self.size}"
+        name = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.png")
+
+    def cached(self, song_path):
+        """Look a song's thumbnail up on disk, without extracting anything.
+
+        Returns:
+            str: Path of the thumbnail, "" if the song has no art, or None if
+                the song hasn't been looked at yet
+        """
+        thumbnail = self.thumbnail_path(song_path)
+        if thumbnail is None:
+            return ""
+        try:
+            return thumbnail if os.path.getsize(thumbnail) else ""
+        except OSError:
+            return None
+
+    def request(self, song_path):
+        """Extract a song's art in the background unless it's on its way"""
+        if song_path in self.pending:
+            return
+        self.pending.add(song_path)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        self.requests.put(song_path)
+
+    def poll(self):
+        """Collect finished thumbnails. Must be called from the Tk main thread.
+
+        Returns:
+            list: (song path, thumbnail path or "" if it has no art) pairs
+        """
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        for song_path, _ in finished:
+            self.pending.discard(song_path)
+        return finished
+
+    def _run(self):
+        """Worker thread: make the thumbnails that are asked for"""
+        while True:
+            song_path = self.requests.get()
+            self.results.put((song_path, self._make(song_path)))
+
+    def _make(self, song_path):
+        thumbnail = self.thumbnail_path(song_path)
+        if thumbnail is None:
+            return ""
+        if os.path.exists(thumbnail):
+            return thumbnail if os.path.getsize(thumbnail) else ""
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            art = extract_art(song_path)
+        except (OSError, struct.error) as e:
+            print(f"Error reading album art of {song_path}: {e}")
+            return ""
+
+        # Written under a temp name and renamed, so a crash never leaves
+        # half a thumbnail
+        temp_file = f"{thumbnail[:-4]}.tmp.png"
+        made = False
+        if art:
+            try:
+                self.make_thumbnail(art, self.size, temp_file)
+                made = True
+            except Exception as e:
+                print(f"Error scaling album art of {song_path}: {e}")
+        try:
+            if not made:
+                open(temp_file, "wb").close()
+            os.replace(temp_file, thumbnail)
+        except OSError as e:
+            print(f"Error saving album art: {e}")
+            return ""
+        self._prune()
+        return thumbnail if made else ""
+
+    def _prune(self):
+        """Remove the oldest thumbnails once there are too many.
+
+        Runs on the worker between writes, so any temp file still there was
+        left by an interrupted write; those are deleted and not counted.
+        """
+        try:
+            files = []
+            with os.scandir(self.cache_dir) as items:
+                for item in items:
+                    if item.name.endswith(".tmp.png"):
+                        os.remove(item.path)
+                    elif item.name.endswith(".png"):
+                        files.append(item)
+            if len(files) <= self.max_files:
+                return
+            files.sort(key=lambda item: item.stat().st_mtime_ns)
+            for item in files[: len(files) - self.max_files]:
+                os.remove(item.path)
+        except OSError as e:
+            print(f"Error pruning album art: {e}")
+
+
+class ImageCache:
+    """Tk images of recently shown art, evicted oldest first over a byte budget.
+
+    Images are costed at four bytes per pixel, roughly what Tk keeps.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.images = OrderedDict()  # key -> (image, cost), oldest first
+        self.used_bytes = 0
+
+    def get(self, key):
+        """Get an image, or None if it isn't cached"""
+        entry = self.images.get(key)
+        if entry is None:
+            return None
+        self.images.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, image):
+        """Cache an image, evicting the least recently used over budget"""
+        old = self.images.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old[1]
+        cost = image.width() * image.height() * 4
+        self.images[key] = (image, cost)
+        self.used_bytes += cost
+        # The newest image is kept even if it's over budget on its own
+        while self.used_bytes > self.budget_bytes and len(self.images) > 1:
+            _, (_, evicted_cost) = self.images.popitem(last=False)
+            self.used_bytes -= evicted_cost
@@ -0,0 +1,255 @@
+import json
+import os
+import queue
+import threading
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+
+# Bump when the cache layout changes so old files are rebuilt
+_CACHE_VERSION = 1
+
+
+def read_id3v1_tags(song_path):
+    """Read the title, artist and album from an ID3v1 tag, if there is one.
+
+    Args:
+        song_path (str): Path to the song file
+
+    Returns:
+        dict: Tag values that are present, keyed by name
+    """
+    try:
+        with open(song_path, "rb") as f:
+            f.seek(-128, os.SEEK_END)
+            block = f.read(128)
+    except OSError:
+        return {}
+    if len(block) != 128 or block[:3] != b"TAG":
+        return {}
+
+    tags = {}
+    for name, start, end in (("title", 3, 33), ("artist", 33, 63), ("album", 63, 93)):
+        value = block[start:end].split(b"\0", 1)[0].decode("latin-1").strip()
+        if value:
+            tags[name] = value
+    return tags
+
+
+class SongLibrary:
+    """Index of the songs folder, kept in an on-disk cache.
+
+    The cache is keyed by path and modification time, so a rescan only
+    probes files that are new or have changed. Scans run on a worker thread
+    and hand their results over in batches through a queue, which the UI
+    drains from the Tk event loop with ``poll``.
+    """
+
+    def __init__(self, songs_folder, cache_file, probe=None, batch_size=25):
+        """Create a library.
+
+        Args:
+            songs_folder (str): Folder the songs live in
+            cache_file (str): JSON file the index is kept in; None disables it
+            probe: Called with a song path, returns its duration in
+                milliseconds. Runs on the worker thread.
+            batch_size (int): Songs per update handed to the UI
+        """
+        self.songs_folder = songs_folder
+        self.cache_file = cache_file
+        self.probe = probe
+        self.batch_size = batch_size
+        self.entries = {}  # path -> path, size, mtime, duration_ms, bitrate, tags
+        self.updates = queue.Queue()
+        self.scanning = False
+        self.unsaved_gains = 0  # measured since the cache was last written
+
+    def load_cache(self):
+        """Load the index saved by the last scan.
+
+        Returns:
+            list: Paths of the songs in the cache
+        """
+        self.entries = {}
+        if not self.cache_file:
+            return self.paths()
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return self.paths()
+
+        if (
+            isinstance(cache, dict)
+            and cache.get("version") == _CACHE_VERSION
+            and cache.get("folder") == self.songs_folder
+        ):
+            self.entries = {entry["path"]: entry for entry in cache["songs"]}
+        return self.paths()
+
+    def paths(self):
+        """Get the paths of all known songs, sorted by file name."""
+        return sorted(self.entries, key=lambda path: os.path.basename(path).lower())
+
+    def get_duration_ms(self, song_path):
+        """Get a song's duration from the index, or None if it isn't known."""
+        entry = self.entries.get(song_path)
+        if entry and entry["duration_ms"] > 0:
+            return entry["duration_ms"]
+        return None
+
+    def get_gain_db(self, song_path):
+        """Get the gain that brings a song to the target loudness.
+
+        Returns:
+            float: Gain in dB, or None if the song hasn't been measured
+        """
+        entry = self.entries.get(song_path)
+        return entry.get("gain_db") if entry else None
+
+    def unmeasured(self):
+        """Get the paths of the songs whose loudness hasn't been measured."""
+        return [path for path, entry in self.entries.items() if "gain_db" not in entry]
+
+    def set_gains(self, gains):
+        """Record measured gains. Must be called from the Tk main thread.
+
+        Args:
+            gains (list): (song path, gain in dB) pairs. A gain of None means
+                the song couldn't be measured; it plays unchanged.
+        """
+        for song_path, gain_db in gains:
+            entry = self.entries.get(song_path)
+            if entry is not None:
+                # Replaced rather than changed, as a scan may be reading it
+                self.entries[song_path] = dict(entry, gain_db=gain_db or 0.0)
+                self.unsaved_gains += 1
+
+    def save(self):
+        """Write recorded gains to the cache, unless a running scan will."""
+        if self.scanning or not self.unsaved_gains:
+            return
+        self._save_cache(self.entries)
+        self.unsaved_gains = 0
+
+    def start_scan(self):
+        """Rescan the songs folder on a worker thread.
+
+        Returns:
+            bool: False if a scan is already running
+        """
+        if self.scanning:
+            return False
+        self.scanning = True
+        threading.Thread(
+            target=self._scan, args=(dict(self.entries),), daemon=True
+        ).start()
+        return True
+
+    def poll(self):
+        """Apply any results the scanner has handed over.
+
+        Must be called from the Tk main thread.
+
+        Returns:
+            bool: True if songs were added, changed or removed
+        """
+        changed = False
+        while True:
+            try:
+                kind, payload = self.updates.get_nowait()
+            except queue.Empty:
+                return changed
+
+            if kind == "songs":
+                for entry in payload:
+                    self.entries[entry["path"]] = entry
+                changed = True
+            else:
+                for path in payload:
+                    self.entries.pop(path, None)
+                changed = changed or bool(payload)
+                self.scanning = False
+                # The scanner saved what it saw; add gains measured since
+                self.save()
+
+    def _scan(self, known):
+        """Worker thread: describe new and changed songs, batch by batch."""
+        found = {}
+        batch = []
+        dirty = False
+        try:
+            with os.scandir(self.songs_folder) as items:
+                for item in items:
+                    if not item.name.lower().endswith(AUDIO_EXTENSIONS):
+                        continue
+                    if not item.is_file():
+                        continue
+
+                    path = os.path.join(self.songs_folder, item.name)
+                    stat = item.stat()
+                    entry = known.get(path)
+                    if (
+                        entry is None
+                        or entry["mtime"] != stat.st_mtime_ns
+                        or entry["size"] != stat.st_size
+                    ):
+                        entry = self._describe(path, stat)
+                        batch.append(entry)
+                        dirty = True
+                        if len(batch) >= self.batch_size:
+                            self.updates.put(("songs", batch))
+                            batch = []
+                    found[path] = entry
+        except OSError as e:
+            print(f"Error scanning song library: {e}")
+            if batch:
+                self.updates.put(("songs", batch))
+            self.updates.put(("done", []))
+            return
+
+        if batch:
+            self.updates.put(("songs", batch))
+        removed = [path for path in known if path not in found]
+        if dirty or removed:
+            self._save_cache(found)
+        self.updates.put(("done", removed))
+
+    def _describe(self, song_path, stat):
+        """Build the index entry for a song file."""
+        duration_ms = 0
+        if self.probe:
+            try:
+                duration_ms = int(self.probe(song_path) or 0)
+            except Exception as e:
+                print(f"Error reading song length for {song_path}: {e}")
+
+        return {
+            "path": song_path,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "duration_ms": duration_ms,
+            # Average bitrate in kbit/s (bits per millisecond)
+            "bitrate": round(stat.st_size * 8 / duration_ms) if duration_ms else 0,
+            "tags": (
+                read_id3v1_tags(song_path)
+                if song_path.lower().endswith(".mp3")
+                else {}
+            ),
+        }
+
+    def _save_cache(self, entries):
+        """Write the index atomically so a crash never leaves half a file."""
+        if not self.cache_file:
+            return
+        cache = {
+            "version": _CACHE_VERSION,
+            "folder": self.songs_folder,
+            "songs": list(entries.values()),
+        }
+        temp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=1)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Error saving song library: {e}")
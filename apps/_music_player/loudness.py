@@ -0,0 +1,218 @@
+import multiprocessing
+import os
+import queue
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # Songs play at their mastered level without NumPy
+    np = None
+
+# ITU-R BS.1770 K-weighting at 48 kHz: a high shelf, then a high-pass
+# filter, as (b, a) coefficients in powers of z^-1
+_K_WEIGHTING = (
+    (
+        (1.53512485958697, -2.69169618940638, 1.19839281085285),
+        (1.0, -1.69065929318241, 0.73248077421585),
+    ),
+    ((1.0, -2.0, 1.0), (1.0, -1.99004745483398, 0.99007225036621)),
+)
+
+_BLOCK_MS = 400  # Gating blocks, overlapping by 75%
+_STEP_MS = 100
+_ABSOLUTE_GATE_LUFS = -70.0
+_RELATIVE_GATE_LU = -10.0
+
+
+def _k_weighting_power(frequencies):
+    """Power response of the K-weighting filter at some frequencies in Hz"""
+    z = np.exp(-2j * np.pi * np.asarray(frequencies) / 48000)
+    response = np.ones(len(z), complex)
+    for b, a in _K_WEIGHTING:
+        response *= np.polyval(b[::-1], z) / np.polyval(a[::-1], z)
+    return np.abs(response) ** 2
+
+
+def integrated_loudness(samples, sample_rate, chunk_steps=100):
+    """Measure a song's integrated loudness as in ITU-R BS.1770.
+
+    The song is cut into 100 ms steps. Each step's K-weighted power comes
+    from its spectrum, ``chunk_steps`` steps per vectorized FFT call, so
+    memory stays bounded however long the song is. Four steps make a
+    gating block, and quiet blocks are gated out before averaging.
+
+    Args:
+        samples: PCM samples, one row per sample and one column per channel
+        sample_rate (int): Samples per second
+        chunk_steps (int): Steps transformed per FFT call
+
+    Returns:
+        float: Loudness in LUFS, or None if the song is (nearly) silent
+    """
+    pcm = np.asarray(samples)
+    scale = float(np.iinfo(pcm.dtype).max + 1) if pcm.dtype.kind in "iu" else 1.0
+    if pcm.ndim == 1:
+        pcm = pcm[:, None]
+
+    step = sample_rate * _STEP_MS // 1000
+    steps = len(pcm) // step
+    if steps < _BLOCK_MS // _STEP_MS:
+        return None
+    weights = _k_weighting_power(np.fft.rfftfreq(step, 1 / sample_rate))
+
+    # Mean square of every step, summed over channels
+    powers = np.empty(steps)
+    for start in range(0, steps, chunk_steps):
+        stop = min(start + chunk_steps, steps)
+        chunk = pcm[start * step : stop * step].astype(np.float32) / scale
+        # (steps, samples per step, channels)
+        chunk = chunk.reshape(stop - start, step, pcm.shape[1])
+        spectrum = np.abs(np.fft.rfft(chunk, axis=1)) ** 2
+        # Parseval, counting the mirrored half of the spectrum twice
+        spectrum[:, 1 : (step + 1) // 2] *= 2
+        powers[start:stop] = (spectrum * weights[:, None]).sum(axis=(1, 2))
+    powers /= step * step
+
+    blocks_per_gate = _BLOCK_MS // _STEP_MS
+    blocks = np.convolve(powers, np.ones(blocks_per_gate) / blocks_per_gate, "valid")
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(blocks)
+
+    gated = blocks[loudness > _ABSOLUTE_GATE_LUFS]
+    if not len(gated):
+        return None
+    threshold = -0.691 + 10 * np.log10(gated.mean()) + _RELATIVE_GATE_LU
+    gated = blocks[loudness > max(threshold, _ABSOLUTE_GATE_LUFS)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def _init_worker():
+    """Worker process: decode with pygame without opening an audio device"""
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    import pygame
+
+    pygame.mixer.init()
+
+
+def analyze_file(song_path, target_lufs):
+    """Worker process: work out the gain that brings a song to a loudness.
+
+    Returns:
+        float: Gain in dB, or None if the song couldn't be measured
+    """
+    import pygame
+
+    try:
+        sound = pygame.mixer.Sound(song_path)
+        loudness = integrated_loudness(
+            pygame.sndarray.array(sound), pygame.mixer.get_init()[0]
+        )
+    except Exception as e:
+        print(f"Error measuring loudness of {song_path}: {e}")
+        return None
+    return None if loudness is None else round(target_lufs - loudness, 2)
+
+
+class LoudnessAnalyzer:
+    """Measures songs in a pool of worker processes.
+
+    Decoding and measuring take a second or so per song, so they're kept off
+    both the UI and the playback threads, and out of this process. Only a
+    few songs are handed to the pool at a time, so closing the player never
+    waits for more than those. Results are collected with ``poll`` from the
+    Tk main thread.
+    """
+
+    def __init__(self, target_lufs=-18.0, workers=2, analyze=analyze_file):
+        """Create an analyzer.
+
+        Args:
+            target_lufs (float): Loudness every song is brought to
+            workers (int): Worker processes
+            analyze: Called in a worker with a song path and the target,
+                returns the gain in dB. Must be picklable.
+        """
+        self.target_lufs = target_lufs
+        self.workers = workers
+        self.analyze = analyze
+        self.waiting = deque()  # paths not handed to the pool yet
+        self.pending = set()  # waiting or in the pool
+        self.in_flight = set()  # in the pool
+        self.results = queue.Queue()
+        self.executor = None
+
+    @property
+    def busy(self):
+        return bool(self.pending)
+
+    def add(self, song_paths):
+        """Queue songs for measuring; ones already queued are skipped"""
+        for song_path in song_paths:
+            if song_path not in self.pending:
+                self.pending.add(song_path)
+                self.waiting.append(song_path)
+        self._submit()
+
+    def poll(self):
+        """Collect finished measurements and hand the pool more songs.
+
+        Must be called from the Tk main thread.
+
+        Returns:
+            list: (song path, gain in dB or None) pairs
+        """
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                break
+        for song_path, _ in finished:
+            self.pending.discard(song_path)
+            self.in_flight.discard(song_path)
+        self._submit()
+        return finished
+
+    def shutdown(self):
+        """Stop the workers, dropping songs that haven't been started"""
+        self.waiting.clear()
+        self.pending.clear()
+        self.in_flight.clear()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def _submit(self):
+        while self.waiting and len(self.in_flight) < self.workers * 2:
+            if self.executor is None:
+                # Forking a process that runs Tk and audio threads isn't safe
+                self.executor = ProcessPoolExecutor(
+                    self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            song_path = self.waiting.popleft()
+            try:
+                future = self.executor.submit(
+                    self.analyze, song_path, self.target_lufs
+                )
+            except RuntimeError as e:
+                # The pool broke, e.g. a worker crashed; try again next time
+                print(f"Error starting loudness analysis: {e}")
+                self.shutdown()
+                return
+            self.in_flight.add(song_path)
+            future.add_done_callback(
+                lambda done, song_path=song_path: self._finished(song_path, done)
+            )
+
+    def _finished(self, song_path, future):
+        """Pool thread: pass a result over to ``poll``"""
+        try:
+            gain_db = None if future.cancelled() else future.result()
+        except Exception as e:
+            print(f"Error measuring loudness of {song_path}: {e}")
+            gain_db = None
+        self.results.put((song_path, gain_db))
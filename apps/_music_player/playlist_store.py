@@ -0,0 +1,154 @@
+import json
+import os
+
+
+class PlaylistStore:
+    """Saved playlists: a snapshot file plus an append-only journal.
+
+    Each change is appended to the journal as one JSON line, so saving costs
+    the same however many playlists there are. Once the journal gets long it
+    is folded into a new snapshot, written to a temp file and renamed over
+    the old one so a crash never leaves half a file. Replaying a journal
+    over a snapshot that already contains it gives the same playlists, so a
+    crash between the two steps of a compaction loses nothing.
+
+    The snapshot keeps the original ``playlists.txt`` layout: a ``[name]``
+    line followed by one song file name per line, with a blank line between
+    playlists.
+    """
+
+    def __init__(self, snapshot_file, compact_every=100):
+        """Create a store.
+
+        Args:
+            snapshot_file (str): Path of the playlists snapshot
+            compact_every (int): Journal entries to collect before they are
+                folded into a new snapshot
+        """
+        self.snapshot_file = snapshot_file
+        self.journal_file = f"{snapshot_file}.journal"
+        self.compact_every = compact_every
+        # name -> {song file name: None}; dicts keep insertion order, so
+        # each one is an ordered set and every journal entry applies in O(1)
+        self.playlists = {}
+        self.journal_entries = 0
+
+    def load(self):
+        """Read the snapshot, replay the journal on top and compact if it's long.
+
+        Returns:
+            dict: Song file names of every saved playlist, in order, keyed
+                by name
+        """
+        self.playlists = {}
+        self.journal_entries = 0
+        try:
+            with open(self.snapshot_file, "r") as f:
+                self._read_snapshot(f)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error loading playlists: {e}")
+
+        try:
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A half-written last line from a crash
+                        break
+                    self._apply(entry)
+                    self.journal_entries += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error loading playlist changes: {e}")
+
+        # A journal that grew long without a compaction, e.g. because the
+        # app was closed first, is folded in now instead of replayed again
+        # on every start
+        if self.journal_entries >= self.compact_every:
+            self.compact()
+        return {name: list(songs) for name, songs in self.playlists.items()}
+
+    def create(self, name):
+        """Record a new, empty playlist"""
+        self._record(["create", name])
+
+    def delete(self, name):
+        """Record that a playlist was deleted"""
+        self._record(["delete", name])
+
+    def add(self, name, song_file):
+        """Record a song added to the end of a playlist"""
+        self._record(["add", name, song_file])
+
+    def remove(self, name, song_file):
+        """Record a song removed from a playlist"""
+        self._record(["remove", name, song_file])
+
+    def compact(self):
+        """Write every playlist to a new snapshot and empty the journal.
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        temp_file = f"{self.snapshot_file}.tmp"
+        try:
+            with open(temp_file, "w") as f:
+                for name, song_files in self.playlists.items():
+                    f.write(f"[{name}]\n")
+                    for song_file in song_files:
+                        f.write(f"{song_file}\n")
+                    f.write("\n")  # Empty line between playlists
+            os.replace(temp_file, self.snapshot_file)
+            # Only now is everything in the journal also in the snapshot
+            with open(self.journal_file, "w"):
+                pass
+        except OSError as e:
+            print(f"Error saving playlists: {e}")
+            return False
+        self.journal_entries = 0
+        return True
+
+    def _read_snapshot(self, lines):
+        current = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                current = None
+            elif line.startswith("[") and line.endswith("]"):
+                current = self.playlists.setdefault(line[1:-1], {})
+            elif current is not None:
+                current[line] = None
+
+    def _apply(self, entry):
+        """Apply a journal entry. Entries that are already applied are no-ops."""
+        action, name = entry[0], entry[1]
+        if action == "create":
+            self.playlists.setdefault(name, {})
+        elif action == "delete":
+            self.playlists.pop(name, None)
+        elif action == "add":
+            self.playlists.setdefault(name, {}).setdefault(entry[2])
+        elif action == "remove":
+            song_files = self.playlists.get(name)
+            if song_files is not None:
+                song_files.pop(entry[2], None)
+
+    def _record(self, entry):
+        """Apply a change and append it to the journal"""
+        self._apply(entry)
+        try:
+            with open(self.journal_file, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print(f"Error saving playlist change: {e}")
+            return
+        self.journal_entries += 1
+        if self.journal_entries >= self.compact_every:
+            self.compact()
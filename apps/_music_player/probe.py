@@ -0,0 +1,226 @@
+import os
+import struct
+
+# Bitrates in kbit/s, indexed by [MPEG-1?][layer][bitrate index]
+_BITRATES = {
+    True: {
+        1: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    },
+    False: {
+        1: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        3: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    },
+}
+
+# Sample rates indexed by [version bits][sample rate index]
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),  # MPEG-2.5
+    2: (22050, 24000, 16000),  # MPEG-2
+    3: (44100, 48000, 32000),  # MPEG-1
+}
+
+# How far into the file to look for the first MP3 frame
+_SYNC_SEARCH_LIMIT = 64 * 1024
+
+# path -> (mtime, size, duration in ms)
+_durations = {}
+
+
+def song_duration_ms(song_path, fallback=None):
+    """Get a song's duration, reading only its headers where possible.
+
+    Results are remembered per file until its size or mtime changes.
+
+    Args:
+        song_path (str): Path to an MP3 or WAV file
+        fallback: Called with the path when the headers can't be parsed,
+            e.g. to fully decode the file. Returns milliseconds.
+
+    Returns:
+        int: Duration in milliseconds, or None if it couldn't be determined
+    """
+    try:
+        stat = os.stat(song_path)
+    except OSError:
+        stat = None
+
+    if stat is not None:
+        cached = _durations.get(song_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+    duration_ms = None
+    if stat is not None:
+        try:
+            duration_ms = probe_duration_ms(song_path)
+        except (OSError, struct.error) as e:
+            print(f"Error probing {song_path}: {e}")
+    if duration_ms is None and fallback is not None:
+        duration_ms = fallback(song_path)
+        duration_ms = int(duration_ms) if duration_ms else None
+
+    if stat is not None and duration_ms is not None:
+        _durations[song_path] = (stat.st_mtime_ns, stat.st_size, duration_ms)
+    return duration_ms
+
+
+def probe_duration_ms(song_path):
+    """Work out a song's duration from its headers without decoding it.
+
+    Args:
+        song_path (str): Path to an MP3 or WAV file
+
+    Returns:
+        int: Duration in milliseconds, or None if the format isn't recognised
+    """
+    with open(song_path, "rb") as f:
+        start = f.read(12)
+        f.seek(0)
+        if start[:4] == b"RIFF" and start[8:12] == b"WAVE":
+            return _wav_duration_ms(f)
+        return _mp3_duration_ms(f, os.fstat(f.fileno()).st_size)
+
+
+def _wav_duration_ms(f):
+    """Read the duration from the fmt and data chunks of a RIFF/WAVE file."""
+    f.seek(12)
+    byte_rate = None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            byte_rate = struct.unpack_from("<I", fmt, 8)[0]
+            if chunk_size % 2:
+                f.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            return chunk_size * 1000 // byte_rate
+        else:
+            # Chunks are padded to an even length
+            f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+
+def _parse_frame_header(header):
+    """Decode a 4-byte MP3 frame header.
+
+    Returns:
+        tuple: (frame length in bytes, samples per frame, sample rate,
+            MPEG-1?, mono?) or None if it isn't a valid header
+    """
+    if len(header) < 4:
+        return None
+    value = int.from_bytes(header, "big")
+    if (value >> 21) & 0x7FF != 0x7FF:
+        return None
+
+    version = (value >> 19) & 3
+    layer = 4 - ((value >> 17) & 3)
+    bitrate_index = (value >> 12) & 0xF
+    rate_index = (value >> 10) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[mpeg1][layer][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (value >> 9) & 1
+    mono = (value >> 6) & 3 == 3
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or mpeg1 else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return length, samples, sample_rate, mpeg1, mono
+
+
+def _skip_id3v2(f):
+    """Return the offset of the audio data after an ID3v2 tag, if any."""
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b"ID3":
+        # Sizes are syncsafe: 7 bits per byte
+        size = 0
+        for byte in header[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+def _find_first_frame(f, offset):
+    """Find the first frame header that is followed by another valid one."""
+    f.seek(offset)
+    data = f.read(_SYNC_SEARCH_LIMIT)
+    position = data.find(b"\xff")
+    while position != -1 and position + 4 <= len(data):
+        frame = _parse_frame_header(data[position : position + 4])
+        if frame:
+            next_header = data[position + frame[0] : position + frame[0] + 4]
+            # Near the end of the buffer there's nothing to confirm against
+            if len(next_header) < 4 or _parse_frame_header(next_header):
+                return offset + position, frame
+        position = data.find(b"\xff", position + 1)
+    return None, None
+
+
+def iter_frames(f, file_size, start=None):
+    """Walk an MP3 file's frames, reading only their 4-byte headers.
+
+    Args:
+        f: The file, opened in binary mode
+        file_size (int): Size of the file in bytes
+        start (int): Offset of the first frame; by default it is looked for
+            after any ID3v2 tag
+
+    Yields:
+        tuple: (byte offset, (frame length in bytes, samples per frame,
+            sample rate, MPEG-1?, mono?)) of each frame, up to the first
+            invalid header
+    """
+    if start is None:
+        f.seek(0)
+        start, frame = _find_first_frame(f, _skip_id3v2(f))
+        if frame is None:
+            return
+    position = start
+    while position + 4 <= file_size:
+        f.seek(position)
+        frame = _parse_frame_header(f.read(4))
+        if frame is None:
+            return
+        yield position, frame
+        position += frame[0]
+
+
+def _mp3_duration_ms(f, file_size):
+    """Read the duration from a Xing/Info/VBRI header, or walk the frames."""
+    start, frame = _find_first_frame(f, _skip_id3v2(f))
+    if frame is None:
+        return None
+    length, samples, sample_rate, mpeg1, mono = frame
+
+    # VBR encoders (and LAME for CBR) put the frame count in the first frame
+    f.seek(start)
+    first_frame = f.read(max(length, 64))
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = 4 + side_info
+    if first_frame[xing : xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack_from(">I", first_frame, xing + 4)[0]
+        if flags & 1:
+            frames = struct.unpack_from(">I", first_frame, xing + 8)[0]
+            return frames * samples * 1000 // sample_rate
+    if first_frame[36:40] == b"VBRI":
+        frames = struct.unpack_from(">I", first_frame, 50)[0]
+        return frames * samples * 1000 // sample_rate
+
+    # No summary header: count the frames
+    total_samples = sum(frame[1] for _, frame in iter_frames(f, file_size, start))
+    return total_samples * 1000 // sample_rate
@@ -0,0 +1,110 @@
+import heapq
+from collections import Counter
+from operator import itemgetter
+
+
+def _trigrams(text):
+    """Get the distinct three-character slices of a string"""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SongSearchIndex:
+    """Fuzzy search over song names, built once per song list.
+
+    Names are indexed by their trigrams and by the first one and two
+    characters of every word. Short queries read a prefix's matches, which
+    are ranked when the index is built; longer ones gather the names sharing
+    the query's trigrams, so only likely matches are ever compared with it;
+    of those, only the ``candidate_limit`` sharing the most are ranked.
+    Results are ranked by how well they match: names starting with the query
+    first, then a word starting with it, then names containing it. Only when
+    no name contains the query are the names sharing most of its trigrams
+    returned instead, which forgives typos.
+    """
+
+    def __init__(self, names=(), candidate_limit=300):
+        """Create an index.
+
+        Args:
+            names (list): Song names; results are positions in this list
+            candidate_limit (int): Most names ranked per query; a common
+                query's other matches are dropped unranked
+        """
+        self.candidate_limit = candidate_limit
+        self.names = []
+        self._folded = []
+        self._trigrams = {}  # trigram -> positions of the names containing it
+        self._word_prefixes = {}  # 1-2 leading characters of a word -> ranked
+        self.rebuild(names)
+
+    def rebuild(self, names):
+        """Index a new list of names"""
+        self.names = list(names)
+        self._folded = [name.lower() for name in self.names]
+        self._trigrams = {}
+        prefixes = {}
+        for position, folded in enumerate(self._folded):
+            for trigram in _trigrams(folded):
+                self._trigrams.setdefault(trigram, []).append(position)
+            words = folded.replace("_", " ").replace("-", " ").split()
+            for prefix in {word[:length] for word in words for length in (1, 2)}:
+                prefixes.setdefault(prefix, []).append(position)
+
+        # A prefix query's answer never changes, so rank it up front
+        self._word_prefixes = {
+            prefix: sorted(
+                positions, key=lambda position: self._rank(position, prefix)
+            )
+            for prefix, positions in prefixes.items()
+        }
+
+    def search(self, query, limit=50):
+        """Find the names that best match a query.
+
+        Args:
+            query (str): Text typed by the user
+            limit (int): Most results to return
+
+        Returns:
+            list: Positions of the matching names, best match first
+        """
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+
+        if len(query) < 3:
+            return self._word_prefixes.get(query, [])[:limit]
+
+        query_trigrams = _trigrams(query)
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        # Substring matches share every trigram; a typo breaks up to three,
+        # so a third of them is enough to keep a name
+        needed = max(1, len(query_trigrams) // 3)
+        candidates = [item for item in shared.items() if item[1] >= needed]
+        if len(candidates) > self.candidate_limit:
+            # Ranking costs far more than counting, so keep it bounded
+            candidates = heapq.nlargest(
+                self.candidate_limit, candidates, key=itemgetter(1)
+            )
+        ranked = [
+            (self._rank(position, query), -count, position)
+            for position, count in candidates
+        ]
+        # Only fall back to near misses when nothing contains the query
+        exact = [result for result in ranked if result[0][0] < 3]
+        return [result[-1] for result in heapq.nsmallest(limit, exact or ranked)]
+
+    def _rank(self, position, query):
+        """Order matches: prefix, word start, substring, then fuzzy"""
+        folded = self._folded[position]
+        found = folded.find(query)
+        if found == 0:
+            return 0, len(folded)
+        if found > 0 and not folded[found - 1].isalnum():
+            return 1, len(folded)
+        if found > 0:
+            return 2, len(folded)
+        return 3, len(folded)
@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import threading
+from array import array
+from bisect import bisect_right
+
+from apps._music_player.probe import iter_frames
+
+# Bump when the cache layout changes so old files are rebuilt
+_CACHE_VERSION = 2
+
+
+class SeekTable:
+    """Byte offsets of an MP3 file's frames against their start times.
+
+    One entry is kept every ``interval_ms`` or so, each pointing at the start
+    of a frame, so a seek lands on a frame boundary at an exactly known time.
+    """
+
+    __slots__ = ("times", "offsets", "duration_ms", "mtime", "size")
+
+    def __init__(self, times, offsets, duration_ms, mtime, size):
+        self.times = times  # array('I') of milliseconds
+        self.offsets = offsets  # array('Q') of byte offsets
+        self.duration_ms = duration_ms
+        self.mtime = mtime
+        self.size = size
+
+    def lookup(self, position_ms):
+        """Find the last frame that starts at or before a position.
+
+        Returns:
+            tuple: (start time in ms, byte offset) of the frame
+        """
+        index = max(0, bisect_right(self.times, position_ms) - 1)
+        return self.times[index], self.offsets[index]
+
+    def to_json(self):
+        return {
+            "mtime": self.mtime,
+            "size": self.size,
+            "duration_ms": self.duration_ms,
+            "times": self.times.tolist(),
+            "offsets": self.offsets.tolist(),
+        }
+
+    @classmethod
+    def from_json(cls, entry):
+        return cls(
+            array("I", entry["times"]),
+            array("Q", entry["offsets"]),
+            entry["duration_ms"],
+            entry["mtime"],
+            entry["size"],
+        )
+
+
+def build_seek_table(song_path, interval_ms=250):
+    """Walk an MP3 file's frame headers and record where its frames start.
+
+    Only the four header bytes of each frame are read, never the audio.
+
+    Args:
+        song_path (str): Path to an MP3 file
+        interval_ms (int): Time between entries in the table
+
+    Returns:
+        SeekTable: The table, or None if no MP3 frames were found
+    """
+    times = array("I")
+    offsets = array("Q")
+    sample_rate = None
+    total_samples = 0
+    next_entry_ms = 0
+    with open(song_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        for position, frame in iter_frames(f, stat.st_size):
+            if sample_rate is None:
+                sample_rate = frame[2]
+            time_ms = total_samples * 1000 // sample_rate
+            if time_ms >= next_entry_ms:
+                times.append(time_ms)
+                offsets.append(position)
+                next_entry_ms = time_ms + interval_ms
+            total_samples += frame[1]
+    if sample_rate is None:
+        return None
+
+    return SeekTable(
+        times,
+        offsets,
+        total_samples * 1000 // sample_rate,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+class TrackReader:
+    """Read-only file object that starts part way into a song file.
+
+    The mixer sees the file as if it began at ``start``, so it decodes from
+    that frame on without seeking through the audio before it.
+    """
+
+    def __init__(self, song_path, start):
+        self.file = open(song_path, "rb")
+        self.start = start
+        self.file.seek(start)
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            offset += self.start
+        return self.file.seek(offset, whence) - self.start
+
+    def tell(self):
+        return self.file.tell() - self.start
+
+    def close(self):
+        self.file.close()
+
+
+class SeekIndex:
+    """Seek tables for the songs that have been played, kept on disk.
+
+    Tables are built on a worker thread the first time a song is prepared
+    and checked against the file's size and mtime before use, so an edited
+    file is indexed again rather than seeked into at the wrong place. Each
+    table has its own file in the cache directory, read the first time its
+    song is looked up, so indexing a song writes only that song's table.
+    """
+
+    def __init__(self, cache_dir, interval_ms=250):
+        """Create an index.
+
+        Args:
+            cache_dir (str): Directory the tables are kept in; None disables it
+            interval_ms (int): Time between entries in each table
+        """
+        self.cache_dir = cache_dir
+        self.interval_ms = interval_ms
+        self.tables = {}  # path -> SeekTable
+        self.building = set()  # paths with a build in progress
+        self.looked_up = set()  # paths whose cache file has been read
+        self.lock = threading.Lock()
+
+    def cache_path(self, song_path):
+        """Get the file a song's table is kept in"""
+        name = hashlib.sha1(song_path.encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def get(self, song_path):
+        """Get the seek table of a song, or None if it isn't built or is stale"""
+        self._load(song_path)
+        with self.lock:
+            table = self.tables.get(song_path)
+        if table is None:
+            return None
+        try:
+            stat = os.stat(song_path)
+        except OSError:
+            return None
+        if table.mtime != stat.st_mtime_ns or table.size != stat.st_size:
+            return None
+        return table
+
+    def prepare(self, song_path):
+        """Build a song's seek table in the background if it's missing.
+
+        Returns:
+            bool: True if a build was started
+        """
+        if not song_path.lower().endswith(".mp3") or self.get(song_path):
+            return False
+        with self.lock:
+            if song_path in self.building:
+                return False
+            self.building.add(song_path)
+        threading.Thread(target=self._build, args=(song_path,), daemon=True).start()
+        return True
+
+    def _build(self, song_path):
+        """Worker thread: index one song and save its table."""
+        try:
+            table = build_seek_table(song_path, self.interval_ms)
+        except OSError as e:
+            print(f"Error building seek table for {song_path}: {e}")
+            table = None
+        if table is not None:
+            with self.lock:
+                self.tables[song_path] = table
+            self._save(song_path, table)
+        with self.lock:
+            self.building.discard(song_path)
+
+    def _load(self, song_path):
+        """Read a song's table from the cache the first time it's looked up."""
+        with self.lock:
+            if song_path in self.looked_up:
+                return
+            self.looked_up.add(song_path)
+        if not self.cache_dir:
+            return
+        try:
+            with open(self.cache_path(song_path), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != _CACHE_VERSION
+            or entry.get("path") != song_path
+        ):
+            return
+        try:
+            table = SeekTable.from_json(entry)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return
+        with self.lock:
+            # A table built while the file was being read is newer
+            self.tables.setdefault(song_path, table)
+
+    def _save(self, song_path, table):
+        """Write a table atomically so a crash never leaves half a file."""
+        if not self.cache_dir:
+            return
+        cache_path = self.cache_path(song_path)
+        temp_file = f"{cache_path}.tmp"
+        entry = {"version": _CACHE_VERSION, "path": song_path, **table.to_json()}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_file, cache_path)
+        except OSError as e:
+            print(f"Error saving seek table: {e}")
@@ -0,0 +1,94 @@
+import os
+from array import array
+from collections.abc import Sequence
+
+
+def _display_name(song_path):
+    """Get the name a song is shown under: its file name without extension"""
+    return os.path.splitext(os.path.basename(song_path))[0]
+
+
+class TrackColumn(Sequence):
+    """Read-only view of one track table column, for a sequence of track IDs.
+
+    Length and indexing are O(1) and nothing is copied, so playlists can
+    hand out their paths or names without building a list.
+    """
+
+    __slots__ = ("_values", "_ids")
+
+    def __init__(self, values, ids):
+        self._values = values
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._values[track_id] for track_id in self._ids[index]]
+        return self._values[self._ids[index]]
+
+    def __eq__(self, other):
+        if isinstance(other, (str, bytes)) or not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"TrackColumn({list(self)!r})"
+
+
+class TrackTable:
+    """Every song the player knows about, stored once, column by column.
+
+    A track's ID is its row number. Playlists hold ``array('I')`` sequences
+    of IDs instead of their own path and name strings, so memory grows with
+    the library rather than with the library times the number of playlists.
+    Rows are never removed, which keeps IDs stable for the whole session.
+    """
+
+    def __init__(self):
+        self.paths = []
+        self.names = []
+        self.durations = array("I")  # milliseconds, 0 if not known yet
+        self._ids = {}  # path -> track ID
+        self._file_ids = {}  # file name -> track ID
+
+    def __len__(self):
+        return len(self.paths)
+
+    def add(self, song_path, duration_ms=0):
+        """Get the ID of a song, adding it to the table if it's new.
+
+        Args:
+            song_path (str): Path of the song
+            duration_ms (int): Length of the song, if known
+
+        Returns:
+            int: The song's track ID
+        """
+        track_id = self._ids.get(song_path)
+        if track_id is None:
+            track_id = len(self.paths)
+            self._ids[song_path] = track_id
+            # The newest path wins, so a song that moved is found where it is now
+            self._file_ids[os.path.basename(song_path)] = track_id
+            self.paths.append(song_path)
+            self.names.append(_display_name(song_path))
+            self.durations.append(0)
+        if duration_ms:
+            self.durations[track_id] = int(duration_ms)
+        return track_id
+
+    def id_of(self, song_path):
+        """Get the ID of a song by path, or None if it isn't in the table"""
+        return self._ids.get(song_path)
+
+    def duration_of(self, song_path):
+        """Get a song's length in milliseconds, or 0 if it isn't known"""
+        track_id = self._ids.get(song_path)
+        return 0 if track_id is None else self.durations[track_id]
+
+    def id_of_file(self, file_name):
+        """Get the ID of a song by file name, or None if it isn't in the table"""
+        return self._file_ids.get(file_name)
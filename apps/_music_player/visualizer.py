@@ -0,0 +1,471 @@
+import hashlib
+import os
+import queue
+import threading
+import wave
+from collections import OrderedDict
+
+from apps._music_player.seek_index import build_seek_table
+
+try:
+    import numpy as np
+except ImportError:  # The player works without NumPy, minus the visualizer
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Spectrum levels below this are drawn as empty bars
+_FLOOR_DB = -60.0
+
+
+class TrackAnalysis:
+    """What the visualizer draws for one song, worked out ahead of time.
+
+    ``levels`` has one row of bar heights (0-255) per ``frame_ms`` of audio,
+    so drawing a frame is a row lookup. ``peaks`` is the waveform outline,
+    the loudest sample (0-1) in each of a fixed number of slices of the song.
+    """
+
+    __slots__ = ("levels", "peaks", "frame_ms")
+
+    def __init__(self, levels, peaks, frame_ms):
+        self.levels = levels
+        self.peaks = peaks
+        self.frame_ms = frame_ms
+
+    def levels_at(self, position_ms):
+        """Get the bar heights for a position in the song"""
+        index = min(max(0, int(position_ms // self.frame_ms)), len(self.levels) - 1)
+        return self.levels[index]
+
+
+def _mono_float32(block):
+    """Mix a block of PCM samples down to one float32 channel in -1..1"""
+    pcm = np.asarray(block)
+    if pcm.ndim > 1:
+        # Averaging straight into float32 avoids a float copy of every channel
+        mono = pcm.mean(axis=1, dtype=np.float32)
+    else:
+        mono = pcm.astype(np.float32)
+    if np.issubdtype(pcm.dtype, np.integer):
+        mono *= np.float32(1 / (np.iinfo(pcm.dtype).max + 1))
+    return mono
+
+
+def analyze_track(samples, sample_rate, block_frames=256, **settings):
+    """Work out the spectrum bars and waveform peaks of samples in memory.
+
+    The samples are handed to ``analyze_blocks`` in slices, so no float copy
+    of the whole song is made. Takes the same settings as ``analyze_blocks``.
+    """
+    pcm = np.asarray(samples)
+    frame_ms = settings.get("frame_ms", 33)
+    step = max(1, sample_rate * frame_ms // 1000) * block_frames
+    blocks = (pcm[start : start + step] for start in range(0, len(pcm), step))
+    return analyze_blocks(blocks, sample_rate, block_frames=block_frames, **settings)
+
+
+def analyze_blocks(
+    blocks,
+    sample_rate,
+    frame_ms=33,
+    bars=32,
+    peak_count=300,
+    fft_size=2048,
+    block_frames=256,
+):
+    """Work out a song's spectrum bars and waveform peaks, a block at a time.
+
+    There is one FFT window per visualizer frame, centred on the frame's
+    start time, and windows are transformed ``block_frames`` at a time with
+    one vectorized FFT call. Only the samples that windows still need are
+    kept between blocks, so memory stays bounded however long the song is.
+
+    Args:
+        blocks: PCM sample blocks in order, each with one row per sample and
+            one column per channel
+        sample_rate (int): Samples per second
+        frame_ms (int): Time between visualizer frames
+        bars (int): Number of spectrum bars, spaced logarithmically
+        peak_count (int): Number of slices in the waveform outline
+        fft_size (int): Samples per FFT window
+        block_frames (int): Windows transformed per FFT call
+
+    Returns:
+        TrackAnalysis: The analysis, or None if there are no samples
+    """
+    hop = max(1, sample_rate * frame_ms // 1000)
+
+    # Bars cover 40 Hz up to 16 kHz on a log scale. Each bar gets at least
+    # one FFT bin, so low bars are never empty.
+    top = min(16000, sample_rate // 2) * fft_size // sample_rate
+    edges = np.geomspace(max(1, 40 * fft_size // sample_rate), top, bars + 1)
+    edges = np.maximum(edges.astype(np.intp), np.arange(bars + 1) + 1)
+    taper = np.hanning(fft_size).astype(np.float32)
+    # A full scale sine through a Hann window peaks at fft_size / 4
+    scale = np.float32(4.0 / fft_size)
+
+    levels = []  # uint8 rows of bar heights, one array per FFT call
+    hop_peaks = []  # the loudest sample in each hop-long slice of the song
+    # The song with fft_size // 2 zeros in front, as the windows see it.
+    # Only the part from the next window on is kept.
+    pending = np.zeros(fft_size // 2, np.float32)
+    pending_start = 0  # where pending starts, counted in the padded song
+    frames_done = 0
+    total = 0  # samples read so far
+
+    def transform(frame_stop):
+        nonlocal pending, pending_start, frames_done
+        if frame_stop > frames_done:
+            first = frames_done * hop - pending_start
+            windows = np.lib.stride_tricks.sliding_window_view(
+                pending[first:], fft_size
+            )[::hop][: frame_stop - frames_done]
+            for start in range(0, len(windows), block_frames):
+                batch = windows[start : start + block_frames] * taper
+                magnitude = np.abs(np.fft.rfft(batch, axis=1))[:, : edges[-1]]
+                bands = np.maximum.reduceat(magnitude * scale, edges[:-1], axis=1)
+                decibels = 20 * np.log10(np.maximum(bands, 1e-9))
+                levels.append(
+                    np.clip((decibels - _FLOOR_DB) * (255 / -_FLOOR_DB), 0, 255)
+                    .astype(np.uint8)
+                )
+            frames_done = frame_stop
+        drop = frames_done * hop - pending_start
+        pending = pending[drop:]
+        pending_start += drop
+
+    for block in blocks:
+        mono = _mono_float32(block)
+        if not len(mono):
+            continue
+
+        # Peaks of whole hop-long slices, finishing one the last block began
+        magnitude = np.abs(mono)
+        head = min((-total) % hop, len(magnitude))
+        if head:
+            hop_peaks[-1] = max(hop_peaks[-1], float(magnitude[:head].max()))
+        if head < len(magnitude):
+            slices = np.arange(head, len(magnitude), hop)
+            hop_peaks.extend(np.maximum.reduceat(magnitude, slices).tolist())
+        total += len(mono)
+
+        pending = np.concatenate([pending, mono])
+        # Frames whose window is complete, and that start inside the song
+        ready = (pending_start + len(pending) - fft_size) // hop + 1
+        transform(min(ready, (total - 1) // hop + 1))
+
+    if not total:
+        return None
+    # The last windows run past the end of the song into silence
+    pending = np.concatenate([pending, np.zeros(fft_size, np.float32)])
+    transform((total - 1) // hop + 1)
+
+    # Waveform: the loudest sample in each of peak_count slices
+    hop_peaks = np.array(hop_peaks, np.float32)
+    peak_count = min(peak_count, len(hop_peaks))
+    starts = np.linspace(0, len(hop_peaks), peak_count + 1).astype(np.intp)[:-1]
+    peaks = np.maximum.reduceat(hop_peaks, starts)
+    return TrackAnalysis(np.concatenate(levels), peaks, frame_ms)
+
+
+def _pcm_to_float32(data, width):
+    """Convert little-endian PCM bytes from a WAV file to floats in -1..1"""
+    if width == 1:  # 8-bit WAVs are unsigned
+        return (np.frombuffer(data, np.uint8).astype(np.float32) - 128) / 128
+    if width == 3:
+        raw = np.frombuffer(data, np.uint8).reshape(-1, 3).astype(np.int32)
+        value = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        value = (value << 8) >> 8  # Sign-extend from 24 bits
+        return value.astype(np.float32) / (1 << 23)
+    dtype = {2: "<i2", 4: "<i4"}[width]
+    return np.frombuffer(data, dtype).astype(np.float32) / (1 << (8 * width - 1))
+
+
+def _wav_blocks(wav, block_ms):
+    with wav:
+        width, channels = wav.getsampwidth(), wav.getnchannels()
+        block = max(1, wav.getframerate() * block_ms // 1000)
+        while True:
+            data = wav.readframes(block)
+            data = data[: len(data) - len(data) % (width * channels)]
+            if not data:
+                break
+            yield _pcm_to_float32(data, width).reshape(-1, channels)
+
+
+def _mp3_blocks(song_path, offsets, decode):
+    with open(song_path, "rb") as f:
+        for index, start in enumerate(offsets):
+            f.seek(start)
+            if index + 1 < len(offsets):
+                yield decode(f.read(offsets[index + 1] - start))
+            else:
+                yield decode(f.read())
+
+
+def read_song_blocks(song_path, decode, sample_rate, block_ms=10000):
+    """Read a song's PCM samples a few seconds at a time.
+
+    WAVs are read straight from the file. MP3s are cut at frame boundaries
+    into pieces of about ``block_ms`` and each piece is decoded on its own,
+    so only one piece's samples are in memory at once. A piece's first
+    frame may lack its bit reservoir and decode as a few ms of silence,
+    which doesn't show at visualizer resolution. Anything else, e.g. a WAV
+    that isn't plain PCM, is decoded whole.
+
+    Args:
+        song_path (str): Path to the song
+        decode: Called with (part of) an encoded file, returns its PCM
+            samples at ``sample_rate``
+        sample_rate (int): Rate ``decode`` returns samples at
+        block_ms (int): Length of each block
+
+    Returns:
+        tuple: (iterator of sample blocks, sample rate of the blocks)
+    """
+    try:
+        wav = wave.open(song_path, "rb")
+    except (wave.Error, EOFError):
+        wav = None
+    if wav is not None:
+        if wav.getsampwidth() in (1, 2, 3, 4):
+            return _wav_blocks(wav, block_ms), wav.getframerate()
+        wav.close()
+
+    table = build_seek_table(song_path, block_ms)
+    if table is None:
+        with open(song_path, "rb") as f:
+            return iter([decode(f.read())]), sample_rate
+    return _mp3_blocks(song_path, table.offsets, decode), sample_rate
+
+
+class TrackAnalyzer:
+    """Analyses songs for the visualizer on a worker thread.
+
+    Results are kept in memory for the most recently used songs and on disk,
+    keyed by the song's path, size and mtime and the analysis settings, so a
+    song is only decoded again once it changes. When songs are requested
+    faster than they can be analysed, only the newest request is worked on
+    and the rest are dropped; they're asked for again if shown.
+    """
+
+    def __init__(
+        self, decode, cache_size=8, cache_dir=None, max_files=1000, **settings
+    ):
+        """Create an analyzer.
+
+        Args:
+            decode: Called with a song path on the worker thread, returns
+                (iterator of sample blocks, sample rate)
+            cache_size (int): Songs to keep analyses for in memory
+            cache_dir (str): Folder analyses are kept in; None disables it
+            max_files (int): Analyses to keep on disk
+            settings: Passed on to ``analyze_blocks``
+        """
+        self.decode = decode
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self.settings = settings
+        self.analyses = OrderedDict()  # path -> TrackAnalysis, oldest first
+        self.requests = queue.Queue()
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def get(self, song_path):
+        """Get a song's analysis, or None if it isn't ready"""
+        with self.lock:
+            analysis = self.analyses.get(song_path)
+            if analysis is not None:
+                self.analyses.move_to_end(song_path)
+            return analysis
+
+    def request(self, song_path):
+        """Analyse a song in the background unless it's done or on its way"""
+        with self.lock:
+            if song_path in self.analyses or song_path in self.pending:
+                return
+            self.pending.add(song_path)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        self.requests.put(song_path)
+
+    def cache_path(self, song_path):
+        """Get where a song's analysis is kept, or None if it isn't kept"""
+        if not self.cache_dir:
+            return None
+        try:
+            stat = os.stat(song_path)
+        except OSError:
+            return None
+        settings = ",".join(f"{k}={v}" for k, v in sorted(self.settings.items()))
+        key = f"{song_path}|{stat.st_size}|{stat.st_mtime_ns}|{settings}"
+        name = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.npz")
+
+    def _run(self):
+        """Worker thread: analyse the newest requested song, drop the rest"""
+        while True:
+            song_path = self.requests.get()
+            stale = []
+            while True:
+                try:
+                    newer = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                stale.append(song_path)
+                song_path = newer
+
+            cache_file = self.cache_path(song_path)
+            analysis = self._load(cache_file)
+            if analysis is None:
+                try:
+                    blocks, sample_rate = self.decode(song_path)
+                    analysis = analyze_blocks(blocks, sample_rate, **self.settings)
+                except Exception as e:
+                    print(f"Error analysing {song_path}: {e}")
+                    analysis = None
+                if analysis is not None:
+                    self._save(cache_file, analysis)
+
+            with self.lock:
+                self.pending.difference_update(stale)
+                self.pending.discard(song_path)
+                if analysis is None:
+                    continue
+                self.analyses[song_path] = analysis
+                while len(self.analyses) > self.cache_size:
+                    self.analyses.popitem(last=False)
+
+    def _load(self, cache_file):
+        """Read an analysis from disk, or None if it isn't there"""
+        if cache_file is None:
+            return None
+        try:
+            with np.load(cache_file) as saved:
+                return TrackAnalysis(
+                    saved["levels"], saved["peaks"], int(saved["frame_ms"])
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error reading visualizer cache: {e}")
+            return None
+
+    def _save(self, cache_file, analysis):
+        """Write an analysis to disk, under a temp name and then renamed"""
+        if cache_file is None:
+            return
+        temp_file = f"{cache_file}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_file, "wb") as f:
+                np.savez(
+                    f,
+                    levels=analysis.levels,
+                    peaks=analysis.peaks,
+                    frame_ms=analysis.frame_ms,
+                )
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"Error saving visualizer cache: {e}")
+            return
+        self._prune()
+
+    def _prune(self):
+        """Remove the oldest analyses once there are too many"""
+        try:
+            with os.scandir(self.cache_dir) as items:
+                files = [item for item in items if item.name.endswith(".npz")]
+            if len(files) <= self.max_files:
+                return
+            files.sort(key=lambda item: item.stat().st_mtime_ns)
+            for item in files[: len(files) - self.max_files]:
+                os.remove(item.path)
+        except OSError as e:
+            print(f"Error pruning visualizer cache: {e}")
+
+
+class SpectrumView:
+    """Draws spectrum bars and a waveform with a playhead on one Canvas.
+
+    Every item is created once. A frame only moves the bars whose height
+    changed and the playhead, so drawing allocates no Tk items at all; the
+    waveform outline is only recomputed when the song or canvas size changes.
+    """
+
+    def __init__(self, canvas, bars=32, color="lime green", dim_color="dark grey"):
+        self.canvas = canvas
+        self.bar_items = [
+            canvas.create_rectangle(0, 0, 0, 0, fill=color, width=0)
+            for _ in range(bars)
+        ]
+        self.waveform_item = canvas.create_polygon(
+            0, 0, 0, 0, 0, 0, fill=dim_color, outline=""
+        )
+        self.playhead_item = canvas.create_line(0, 0, 0, 0, fill=color)
+        self.heights = [0] * bars
+        self.analysis = None
+        self.width = 0
+        self.height = 0
+
+    def resize(self, width, height):
+        """Lay the items out for a new canvas size"""
+        self.width, self.height = max(1, width), max(1, height)
+        self.heights = [-1] * len(self.bar_items)  # Redraw every bar
+        self._draw_waveform()
+
+    def show(self, analysis):
+        """Switch to another song's analysis, or None to clear the view"""
+        if analysis is self.analysis:
+            return
+        self.analysis = analysis
+        self._draw_waveform()
+        if analysis is None:
+            self.draw(0)
+
+    def draw(self, position_ms):
+        """Draw one frame for a position in the current song"""
+        if self.analysis is None:
+            levels = None
+            playhead_x = 0
+        else:
+            levels = self.analysis.levels_at(position_ms)
+            duration_ms = len(self.analysis.levels) * self.analysis.frame_ms
+            playhead_x = min(1.0, position_ms / duration_ms) * self.width
+
+        # Bars use the top two thirds, the waveform the bottom third
+        bar_area = self.height * 2 // 3
+        bar_width = self.width / len(self.bar_items)
+        for index, item in enumerate(self.bar_items):
+            height = 0 if levels is None else int(levels[index]) * bar_area // 255
+            if height == self.heights[index]:
+                continue
+            self.heights[index] = height
+            x = index * bar_width
+            self.canvas.coords(
+                item, x + 1, bar_area - height, x + bar_width - 1, bar_area
+            )
+        self.canvas.coords(
+            self.playhead_item, playhead_x, bar_area, playhead_x, self.height
+        )
+
+    def _draw_waveform(self):
+        """Fit the waveform outline of the current song to the canvas"""
+        if self.analysis is None or not self.width:
+            self.canvas.coords(self.waveform_item, 0, 0, 0, 0, 0, 0)
+            return
+
+        peaks = self.analysis.peaks
+        bar_area = self.height * 2 // 3
+        middle = (bar_area + self.height) / 2
+        half = (self.height - bar_area) / 2
+        xs = np.linspace(0, self.width, len(peaks))
+        top = np.column_stack([xs, middle - peaks * half])
+        bottom = np.column_stack([xs, middle + peaks * half])[::-1]
+        self.canvas.coords(
+            self.waveform_item, *np.concatenate([top, bottom]).ravel().tolist()
+        )
@@ -18,6 +18,7 @@ class BlockoidApp:
         self.landscape_y = []
         self.frames = []
         self.filler_frames = []
+        self.clouds_task = None
 
         # General config
         self.CLOUD_COLOR = "dark red"
@@ -196,8 +197,29 @@ class BlockoidApp:
             else:
                 self.cloud1x = 0
             self.cloud1.place(x=self.cloud1x, y=self.cloud1y)
-            num = randint(600, 1100)
-            self.root.after(num, self.clouds)
+            self._schedule_clouds(randint(600, 1100))
+        elif self.clouds_task:
+            self.clouds_task.cancel()
+            self.clouds_task = None
+
+    def _schedule_clouds(self, delay):
+        """Move the clouds once more after ``delay`` milliseconds.
+
+        Each move picks a new random delay, so the task is replaced rather
+        than kept at a fixed period.
+        """
+        if self.clouds_task:
+            self.clouds_task.cancel()
+        self.clouds_task = self.page.schedule(delay, self.clouds)
+
+    def suspend(self):
+        """Ignore key presses while hidden; the clouds pause on their own."""
+        self.root.unbind("<Key>")
+
+    def resume(self):
+        """Restore key handling if a game is in progress."""
+        if self.running:
+            self.root.bind("<Key>", self.key_pressed)
 
     def play(self, btn, lbl):
         btn.destroy()
@@ -338,7 +360,7 @@ class BlockoidApp:
         loading_screen_text.destroy()
         self.page.page_frame.update()
         self.root.bind("<Key>", self.key_pressed)
-        self.root.after(100, self.clouds)
+        self._schedule_clouds(100)
 
     def create_widgets(self, page):
         self.running = False
@@ -368,6 +390,10 @@ class BlockoidApp:
         play_btn.place(relx=0.5, rely=0.5, anchor="center")
 
     def destroy_app(self):
+        self.suspend()
+        if self.clouds_task:
+            self.clouds_task.cancel()
+            self.clouds_task = None
         if self.running:
             with open("apps/_blockoid/world.txt", "w") as f:
                 f.write("")
@@ -391,6 +417,16 @@ def create(_page, _root):
     _blockoid_instance.create_widgets(_page)
 
 
+def suspend(page, root):
+    if _blockoid_instance:
+        _blockoid_instance.suspend()
+
+
+def resume(page, root):
+    if _blockoid_instance:
+        _blockoid_instance.resume()
+
+
 def destroy(page, root):
     global _blockoid_instance
     if _blockoid_instance:
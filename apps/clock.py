@@ -11,8 +11,13 @@ class ClockApp:
         self.am_pm = None
         self.format_ = None
         self.root = None
-        self.running = False
+        self.page = None
+        self.update_task = None
         self.time_format = 12
+        self.low_power = False
+        # Text currently shown in each label, so unchanged ones are skipped
+        self.shown = {}
+        self.shown_day = None
 
         # Get configuration
         class ui_config(config["ui"], config["clock"]):
@@ -39,22 +44,47 @@ class ClockApp:
 
     def update(self):
         """Update the clock display."""
-        if self.running:
-            if self.time_format == 12:
-                time_string = time.strftime("%I:%M")
-                self.am_pm.configure(text=time.strftime("%p"))
-            else:
-                time_string = time.strftime("%H:%M")
-                self.am_pm.configure(text="")
-
-            seconds_string = time.strftime("%S")
-            date_string = time.strftime("%A, %B %d, %G")
-
-            self.time_lbl.configure(text=time_string)
-            self.seconds_lbl.configure(text=seconds_string)
-            self.date_lbl.configure(text=date_string)
+        now = time.localtime()
+        if self.time_format == 12:
+            self.set_text(self.time_lbl, time.strftime("%I:%M", now))
+            self.set_text(self.am_pm, time.strftime("%p", now))
+        else:
+            self.set_text(self.time_lbl, time.strftime("%H:%M", now))
+            self.set_text(self.am_pm, "")
+
+        if not self.low_power:
+            self.set_text(self.seconds_lbl, f"{now.tm_sec:02d}")
+
+        # The date only needs formatting when the day changes
+        if (now.tm_year, now.tm_yday) != self.shown_day:
+            self.shown_day = (now.tm_year, now.tm_yday)
+            self.set_text(self.date_lbl, time.strftime("%A, %B %d, %G", now))
+
+    def set_text(self, label, text):
+        """Configure a label only if its text has changed."""
+        if self.shown.get(label) != text:
+            label.configure(text=text)
+            self.shown[label] = text
+
+    def set_low_power(self, enabled):
+        """Hide the seconds and wake once a minute, or go back to every second.
+
+        Args:
+            enabled (bool): Whether low-power mode should be on
+        """
+        self.low_power = enabled
+        if enabled:
+            self.seconds_lbl.place_forget()
+            interval = self.ui_config.CLOCK_LOW_POWER_INTERVAL
+        else:
+            self.seconds_lbl.place(**self.seconds_lbl_place)
+            interval = self.ui_config.CLOCK_UPDATE_INTERVAL
 
-            self.root.after(self.ui_config.CLOCK_UPDATE_INTERVAL, self.update)
+        if self.update_task:
+            self.update_task.cancel()
+        # Wake on whole seconds (or minutes), right after the display changes
+        self.update_task = self.page.schedule(interval, self.update, align=True)
+        self.update()
 
     def change_format(self):
         """Toggle between 12h and 24h format."""
@@ -64,9 +94,11 @@ class ClockApp:
         else:
             self.time_format = 12
             self.format_.configure(text="12h")
+        self.update()
 
     def create_widgets(self, page):
         """Create all clock widgets."""
+        self.page = page
         page.page_frame.configure(bg=self.ui_config.BACKGROUND_COLOR)
 
         # Load settings
@@ -100,7 +132,8 @@ class ClockApp:
             justify="left",
             anchor="w",
         )
-        self.seconds_lbl.place(relx=0.78, rely=0.424, width=45, relheight=0.2)
+        self.seconds_lbl_place = dict(relx=0.78, rely=0.424, width=45, relheight=0.2)
+        self.seconds_lbl.place(**self.seconds_lbl_place)
         self.seconds_lbl.configure(font=self.font_for_other)
 
         # Date label
@@ -141,12 +174,14 @@ class ClockApp:
         self.format_.configure(font=self.font_for_other)
         self.format_.place(relx=0, rely=1, relheight=0.18, relwidth=0.21, anchor="sw")
 
-        self.running = True
-        self.root.after(self.ui_config.CLOCK_STARTUP_DELAY, self.update)
+        # The scheduler pauses updates by itself while the page is hidden
+        self.set_low_power(self.ui_config.CLOCK_LOW_POWER)
 
     def destroy_app(self, page):
         """Clean up when app is closed."""
-        self.running = False
+        if self.update_task:
+            self.update_task.cancel()
+            self.update_task = None
         page.page_frame.destroy()
         with open("apps/_clock/settings.txt", "w") as f:
             self.root.update_idletasks()
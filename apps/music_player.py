@@ -1,16 +1,88 @@
 import tkinter as d3
+import io
 import os
+import queue
+import threading
+from array import array
 import pygame
-import time
 from config import config
+from timing import timer
+from apps._music_player.artwork import ArtworkCache, ImageCache, image_type
+from apps._music_player.library import SongLibrary
+from apps._music_player.loudness import LoudnessAnalyzer
+from apps._music_player.playlist_store import PlaylistStore
+from apps._music_player.search import SongSearchIndex
+from apps._music_player.seek_index import SeekIndex, TrackReader
+from apps._music_player.tracks import TrackColumn, TrackTable
+from apps._music_player.visualizer import (
+    HAVE_NUMPY,
+    SpectrumView,
+    TrackAnalyzer,
+    read_song_blocks,
+)
+from apps._music_player.probe import song_duration_ms
 
 # Define constants
-SONG_END_CHECK_INTERVAL_MS = 1000
+SONG_END_CHECK_INTERVAL_MS = 1000  # retry interval when the song length is unknown
+SONG_END_MARGIN_MS = 20  # look this long after a song is due to end
+# Set the queued song's volume this long before it starts; a volume change
+# is heard about one mixer buffer later
+SONG_GAIN_LEAD_MS = 10
 PROGRESS_UPDATE_INTERVAL_MS = 250
+SONG_ROW_HEIGHT = 30  # pixels per row in the song list
+SONG_ROW_OVERSCAN = 2  # rows kept ready above and below the visible ones
+SEARCH_RESULT_LIMIT = 50
+VISUALIZER_FRAME_MS = 33  # redraw the visualizer about 30 times a second
+VISUALIZER_BARS = 32
+VISUALIZER_CACHE_SIZE = 8  # songs to keep visualizer analyses for in memory
+VISUALIZER_DECODE_BLOCK_MS = 10000  # audio decoded at a time for the analysis
+ARTWORK_SIZE = 36  # pixels, longest side of the album art
+ARTWORK_POLL_INTERVAL_MS = 100
 TIME_DISPLAY_FORMAT = "{current_min}:{current_sec:02d} / {total_min}:{total_sec:02d}"
 
-# Module-level instance
+# Module-level instances; the playback service outlives the player page
 _music_player_instance = None
+_playback_service = None
+
+
+def _decode_song_length(song_path):
+    """Get a song's duration in milliseconds by decoding the whole file"""
+    return pygame.mixer.Sound(song_path).get_length() * 1000
+
+
+def _decode_song_piece(data):
+    """Decode part of a song to PCM samples at the mixer's rate"""
+    # A view of the Sound's buffer, so the samples aren't copied again
+    return pygame.sndarray.samples(pygame.mixer.Sound(file=io.BytesIO(data)))
+
+
+def _decode_song_blocks(song_path):
+    """Decode a song a few seconds at a time, for the visualizer"""
+    return read_song_blocks(
+        song_path,
+        _decode_song_piece,
+        pygame.mixer.get_init()[0],
+        VISUALIZER_DECODE_BLOCK_MS,
+    )
+
+
+def _make_thumbnail(image_data, size, thumbnail_path):
+    """Scale album art down to a PNG thumbnail, on the artwork worker thread"""
+    image = pygame.image.load(io.BytesIO(image_data), image_type(image_data))
+    width, height = image.get_size()
+    scale = size / max(width, height)
+    thumbnail_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    # Only 24 and 32-bit images can be scaled smoothly
+    if image.get_bitsize() >= 24:
+        thumbnail = pygame.transform.smoothscale(image, thumbnail_size)
+    else:
+        thumbnail = pygame.transform.scale(image, thumbnail_size)
+    pygame.image.save(thumbnail, thumbnail_path)
+
+
+def _probe_song_length(song_path):
+    """Get a song's duration in milliseconds, decoding only if headers fail"""
+    return song_duration_ms(song_path, fallback=_decode_song_length) or 0
 
 
 class PlaybackState:
@@ -19,28 +91,25 @@ class PlaybackState:
     def __init__(self):
         self.is_playing = False
         self.song_paused = False
-        self.is_seeking = False
         self.current_song_index = 0
         self.current_song_length = 0
-        self.song_start_time = 0
         self.seek_offset = 0
-        self.pause_time = 0
+        # Position in the current song, on the monotonic clock
+        self.timer = timer()
 
     def pause(self):
         self.is_playing = False
         self.song_paused = True
-        self.pause_time = time.time()
+        self.timer.pause()
 
     def resume(self):
         self.is_playing = True
-        if self.song_paused:
-            pause_duration = time.time() - self.pause_time
-            self.song_start_time += pause_duration
-            self.pause_time = 0
-            self.song_paused = False
+        self.song_paused = False
+        self.timer.start()
 
     def start_new_song(self):
-        self.song_start_time = time.time()
+        self.timer.reset()
+        self.timer.start()
         self.seek_offset = 0
         self.song_paused = False
         self.is_playing = True
@@ -50,69 +119,140 @@ class PlaybackState:
             return 0
 
         new_position_seconds = max(0, (position_percent / 100) * (song_length / 1000))
-        self.song_start_time = time.time() - new_position_seconds
-        self.seek_offset = new_position_seconds * 1000  # Convert to milliseconds
-
+        self.seek_to_ms(new_position_seconds * 1000)
         return new_position_seconds
 
+    def seek_to_ms(self, position_ms):
+        self.timer.seek(int(position_ms * 1_000_000))
+        self.seek_offset = position_ms
+
+    def get_elapsed_time_ms(self):
+        if not self.is_playing and not self.song_paused:
+            return 0
+
+        return self.timer.elapsed_ms()
+
+
+class PlaybackSnapshot:
+    """Read-only copy of the playback state, published by the service worker.
+
+    The page reads a snapshot instead of the live state, which only the
+    worker changes. Each snapshot has its own copy of the timer, so the
+    position keeps counting between snapshots.
+    """
+
+    __slots__ = (
+        "is_playing",
+        "song_paused",
+        "current_song_index",
+        "current_song_length",
+        "song_path",
+        "timer",
+    )
+
+    def __init__(self, state, song_path):
+        self.is_playing = state.is_playing
+        self.song_paused = state.song_paused
+        self.current_song_index = state.current_song_index
+        self.current_song_length = state.current_song_length
+        self.song_path = song_path
+        self.timer = state.timer.copy()
+
     def get_elapsed_time_ms(self):
         if not self.is_playing and not self.song_paused:
             return 0
 
-        return (time.time() - self.song_start_time) * 1000  # ms
+        return self.timer.elapsed_ms()
 
 
 class Playlist:
-    """Class to represent a single playlist"""
+    """Class to represent a single playlist
 
-    def __init__(self, name, songs=None):
+    Songs are kept in order as track IDs into a shared ``TrackTable``, with
+    a set of the IDs alongside for membership checks. Paths and display
+    names are read straight from the table's columns.
+    """
+
+    def __init__(self, name, songs=None, tracks=None):
         self.name = name
-        self.song_paths = [] if songs is None else songs
-        self.display_names = []
-        self._update_display_names()
+        self.tracks = TrackTable() if tracks is None else tracks
+        self.version = 0  # Bumped on every change, for views derived from it
+        self.set_songs([] if songs is None else songs)
+
+    def __contains__(self, song_path):
+        return self.tracks.id_of(song_path) in self._id_set
+
+    @property
+    def song_paths(self):
+        """Paths of the songs, in order"""
+        return TrackColumn(self.tracks.paths, self.track_ids)
+
+    @property
+    def display_names(self):
+        """Names to show for the songs, in order"""
+        return TrackColumn(self.tracks.names, self.track_ids)
+
+    def set_songs(self, song_paths):
+        """Replace the songs in the playlist
+
+        Args:
+            song_paths (list): Song paths, in order
+        """
+        self.set_track_ids(self.tracks.add(path) for path in song_paths)
 
-    def _update_display_names(self):
-        """Update display names from song paths"""
-        self.display_names = []
-        for path in self.song_paths:
-            filename = os.path.basename(path)
-            self.display_names.append(os.path.splitext(filename)[0])
+    def set_track_ids(self, track_ids):
+        """Replace the songs in the playlist with tracks already in the table"""
+        self.track_ids = array("I", track_ids)
+        self._id_set = set(self.track_ids)
+        self.version += 1
 
     def add_song(self, song_path):
         """Add a song to the playlist"""
-        if song_path not in self.song_paths:
-            self.song_paths.append(song_path)
-            self._update_display_names()
+        track_id = self.tracks.add(song_path)
+        if track_id not in self._id_set:
+            self.track_ids.append(track_id)
+            self._id_set.add(track_id)
+            self.version += 1
             return True
         return False
 
     def remove_song(self, index):
         """Remove a song from the playlist"""
-        if 0 <= index < len(self.song_paths):
-            self.song_paths.pop(index)
-            self._update_display_names()
+        if 0 <= index < len(self.track_ids):
+            self._id_set.discard(self.track_ids.pop(index))
+            self.version += 1
             return True
         return False
 
     def has_songs(self):
         """Check if the playlist has any songs"""
-        return bool(self.song_paths)
+        return bool(self.track_ids)
+
+    def index_of_track(self, track_id):
+        """Get the position of a track in the playlist, or None if it isn't in it"""
+        if track_id not in self._id_set:
+            return None
+        return self.track_ids.index(track_id)
 
     def get_song_path(self, index):
         """Get the path of a song by index"""
-        if not self.song_paths or index >= len(self.song_paths):
+        if not self.track_ids or index >= len(self.track_ids):
             return None
-        return self.song_paths[index]
+        return self.tracks.paths[self.track_ids[index]]
 
     def get_song_name(self, index):
         """Get the display name of a song by index"""
-        if not self.display_names or index >= len(self.display_names):
+        if not self.track_ids or index >= len(self.track_ids):
             return "No song selected"
-        return self.display_names[index]
+        return self.tracks.names[self.track_ids[index]]
 
 
 class PlaylistManager:
-    """Class to manage playlist operations"""
+    """Class to manage playlist operations
+
+    Every song is stored once in ``tracks``; the library and each playlist
+    are arrays of track IDs into it.
+    """
 
     def __init__(
         self,
@@ -121,20 +261,35 @@ class PlaylistManager:
     ):
         self.songs_folder = songs_folder
         self.playlists_file = playlists_file
-        self.available_songs = []  # All songs in the songs folder
-        self.available_song_names = []  # Display names for all available songs
+        self.tracks = TrackTable()  # Every song seen this session
+        self.available_ids = array("I")  # Songs in the songs folder
         self.playlists = []  # List of Playlist objects
         self.current_playlist_index = 0
         self.songs_loaded = False
+        self.store = PlaylistStore(playlists_file)
+        # Playlist name -> (playlist, its version, tuple of full song paths)
+        self._resolved_paths = {}
+        self._search_index = None  # Built on the first search after a change
 
         # Make sure directories exist
         os.makedirs(os.path.dirname(songs_folder), exist_ok=True)
         os.makedirs(os.path.dirname(playlists_file), exist_ok=True)
 
+    @property
+    def available_songs(self):
+        """Paths of all songs in the songs folder"""
+        return TrackColumn(self.tracks.paths, self.available_ids)
+
+    @property
+    def available_song_names(self):
+        """Display names for all available songs"""
+        if not self.available_ids:
+            return ["No songs found"]
+        return TrackColumn(self.tracks.names, self.available_ids)
+
     def load_songs(self):
         """Load songs from the songs folder"""
-        self.available_songs = []
-        self.available_song_names = []
+        self.available_ids = array("I")
 
         # Ensure directories exist
         os.makedirs(os.path.dirname(self.songs_folder), exist_ok=True)
@@ -142,40 +297,85 @@ class PlaylistManager:
 
         if not os.path.isdir(self.songs_folder):
             print(f"Songs folder not found: {self.songs_folder}")
-            self.available_song_names = ["No songs found"]
             self.songs_loaded = True
             return
 
-        for filename in os.listdir(self.songs_folder):
-            if filename.endswith((".mp3", ".wav")):
-                full_path = os.path.join(self.songs_folder, filename)
-                self.available_songs.append(full_path)
-                self.available_song_names.append(os.path.splitext(filename)[0])
+        self._set_available_songs(
+            [
+                os.path.join(self.songs_folder, filename)
+                for filename in os.listdir(self.songs_folder)
+                if filename.endswith((".mp3", ".wav"))
+            ]
+        )
+        self.load_playlists()
+        self.songs_loaded = True
 
-        if not self.available_songs:
-            self.available_song_names = ["No songs found"]
+    def update_songs(self, song_paths, get_duration_ms=None):
+        """Replace the available songs with a list from the song library
+
+        Args:
+            song_paths (list): Paths of the songs in the library
+            get_duration_ms: Called with a path to fill in the duration
+                column, e.g. ``SongLibrary.get_duration_ms``
+        """
+        self._set_available_songs(song_paths, get_duration_ms)
+        if not self.songs_loaded:
+            self.load_playlists()
+            self.songs_loaded = True
+        elif self.playlists and self.playlists[0].name == "All Songs":
+            self.playlists[0].set_track_ids(self.available_ids)
+            # Songs the scan just found may belong to saved playlists
+            available = set(self.available_ids)
+            for playlist in self.playlists[1:]:
+                playlist.set_track_ids(
+                    self._resolve_saved_songs(playlist.name, available)
+                )
 
-        # Create a default "All Songs" playlist if we have songs
-        if self.available_songs and not self.playlists:
-            all_songs_playlist = Playlist("All Songs", self.available_songs.copy())
-            self.playlists.append(all_songs_playlist)
+    def _set_available_songs(self, song_paths, get_duration_ms=None):
+        add = self.tracks.add
+        if get_duration_ms is None:
+            self.available_ids = array("I", (add(path) for path in song_paths))
+        else:
+            self.available_ids = array(
+                "I", (add(path, get_duration_ms(path) or 0) for path in song_paths)
+            )
+        self._search_index = None
 
-        self.load_playlists()
-        self.songs_loaded = True
+        # Create a default "All Songs" playlist if we have songs
+        if self.available_ids and not self.playlists:
+            self.playlists.append(self._all_songs_playlist())
+
+    def _all_songs_playlist(self):
+        """Create the "All Songs" playlist over the available songs"""
+        playlist = Playlist("All Songs", tracks=self.tracks)
+        playlist.set_track_ids(self.available_ids)
+        return playlist
+
+    def search_songs(self, query, limit=SEARCH_RESULT_LIMIT):
+        """Find available songs by name, forgiving typos.
+
+        Meant to be called on every keystroke: the index is built once per
+        song list, and each search only looks at names that share part of
+        the query.
+
+        Args:
+            query (str): Text typed by the user
+            limit (int): Most results to return
+
+        Returns:
+            list: Indices into available_songs, best match first
+        """
+        if self._search_index is None:
+            self._search_index = SongSearchIndex(
+                TrackColumn(self.tracks.names, self.available_ids)
+            )
+        return self._search_index.search(query, limit)
 
     def get_current_song_path(self, index):
-        if not self.playlists or self.current_playlist_index >= len(self.playlists):
+        playlist_files = self.playlist_files
+        if not 0 <= index < len(playlist_files):
             return None
-        song_path = self.playlists[self.current_playlist_index].get_song_path(index)
-
-        # If path doesn't include the songs folder, add it
-        if (
-            song_path
-            and not os.path.isabs(song_path)
-            and not song_path.startswith(self.songs_folder)
-        ):
-            return os.path.join(self.songs_folder, song_path)
-        return song_path
+        return playlist_files[index]
 
     def get_current_song_name(self, index):
         if not self.playlists or self.current_playlist_index >= len(self.playlists):
@@ -198,17 +398,17 @@ class PlaylistManager:
             if playlist.name.lower() == name.lower():
                 return False
 
-        self.playlists.append(Playlist(name))
-        self.save_playlists()
+        self.playlists.append(Playlist(name, tracks=self.tracks))
+        self.store.create(name)
         return True
 
     def delete_playlist(self, index):
         """Delete a playlist by index"""
         if 0 <= index < len(self.playlists):
-            self.playlists.pop(index)
+            playlist = self.playlists.pop(index)
             if self.current_playlist_index >= len(self.playlists) and self.playlists:
                 self.current_playlist_index = len(self.playlists) - 1
-            self.save_playlists()
+            self.store.delete(playlist.name)
             return True
         return False
 
@@ -224,101 +424,100 @@ class PlaylistManager:
         if (
             self.playlists
             and self.current_playlist_index < len(self.playlists)
-            and 0 <= song_index < len(self.available_songs)
+            and 0 <= song_index < len(self.available_ids)
         ):
             song_path = self.available_songs[song_index]
+            playlist = self.playlists[self.current_playlist_index]
 
-            # For custom playlists, store only the filename, not the full path
-            if self.playlists[self.current_playlist_index].name != "All Songs":
-                song_path = os.path.basename(song_path)
+            # "All Songs" follows the songs folder and isn't saved
+            if playlist.name == "All Songs":
+                return playlist.add_song(song_path)
 
-            return self.playlists[self.current_playlist_index].add_song(song_path)
+            # For custom playlists, save only the filename, not the full path
+            if playlist.add_song(song_path):
+                self.store.add(playlist.name, os.path.basename(song_path))
+                return True
         return False
 
     def remove_song_from_current_playlist(self, song_index):
         """Remove a song from current playlist"""
         if self.playlists and self.current_playlist_index < len(self.playlists):
-            result = self.playlists[self.current_playlist_index].remove_song(song_index)
-            if result:
-                self.save_playlists()
+            playlist = self.playlists[self.current_playlist_index]
+            song_path = playlist.get_song_path(song_index)
+            result = playlist.remove_song(song_index)
+            if result and playlist.name != "All Songs":
+                self.store.remove(playlist.name, os.path.basename(song_path))
             return result
         return False
 
     def save_playlists(self):
-        """Save playlists to file"""
-        try:
-            with open(self.playlists_file, "w") as f:
-                for playlist in self.playlists:
-                    # Skip the "All Songs" playlist as it's generated automatically
-                    if playlist.name == "All Songs":
-                        continue
-
-                    f.write(f"[{playlist.name}]\n")
-                    for song_path in playlist.song_paths:
-                        # Save only the filename, not the full path
-                        filename = os.path.basename(song_path)
-                        f.write(f"{filename}\n")
-                    f.write("\n")  # Empty line between playlists
-            return True
-        except Exception as e:
-            print(f"Error saving playlists: {e}")
-            return False
+        """Write a full snapshot of the saved playlists.
+
+        Changes are already journaled as they happen, so this is only needed
+        to fold the journal into the snapshot early.
+        """
+        return self.store.compact()
 
     def load_playlists(self):
-        """Load playlists from file"""
-        if not os.path.exists(self.playlists_file):
+        """Load the saved playlists, keeping the songs the library knows about"""
+        saved = self.store.load()
+        if not saved:
             # Create an "All Songs" playlist if we have no saved playlists
-            if self.available_songs and not self.playlists:
-                all_songs_playlist = Playlist("All Songs", self.available_songs.copy())
-                self.playlists = [all_songs_playlist]
-            return
-
-        try:
-            # Create an "All Songs" playlist first
-            all_songs_playlist = Playlist("All Songs", self.available_songs.copy())
-            playlists = [all_songs_playlist]
-
-            current_playlist = None
-            with open(self.playlists_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        current_playlist = None
-                        continue
-
-                    if line.startswith("[") and line.endswith("]"):
-                        playlist_name = line[1:-1]
-                        current_playlist = Playlist(playlist_name)
-                        playlists.append(current_playlist)
-                    elif current_playlist is not None:
-                        # This is a song filename, not a full path
-                        # Check if the song file exists
-                        filename = line
-                        full_path = os.path.join(self.songs_folder, filename)
-                        if os.path.exists(full_path):
-                            # Only add the filename, not the full path
-                            current_playlist.add_song(filename)
-
-            self.playlists = playlists
-            self.current_playlist_index = 0
+            if self.available_ids and not self.playlists:
+                self.playlists = [self._all_songs_playlist()]
             return True
-        except Exception as e:
-            print(f"Error loading playlists: {e}")
-            return False
+
+        # Create an "All Songs" playlist first
+        playlists = [self._all_songs_playlist()]
+        available = set(self.available_ids)
+        for name in saved:
+            playlist = Playlist(name, tracks=self.tracks)
+            playlist.set_track_ids(self._resolve_saved_songs(name, available))
+            playlists.append(playlist)
+
+        self.playlists = playlists
+        self.current_playlist_index = 0
+        return True
+
+    def _resolve_saved_songs(self, name, available):
+        """Get the track IDs of a saved playlist's songs that are in the library
+
+        Args:
+            name (str): Name of the saved playlist
+            available (set): Track IDs of the available songs
+        """
+        track_ids = []
+        for song_file in self.store.playlists.get(name, []):
+            track_id = self.tracks.id_of_file(song_file)
+            if track_id in available:
+                track_ids.append(track_id)
+        return track_ids
 
     @property
     def playlist_files(self):
-        """Get song paths from current playlist (for backward compatibility)"""
+        """Get full song paths of the current playlist.
+
+        The tuple is kept per playlist until the playlist changes, so reading
+        it, its length or one of its songs doesn't rebuild it.
+        """
         if not self.playlists or self.current_playlist_index >= len(self.playlists):
-            return []
+            return ()
+
+        playlist = self.playlists[self.current_playlist_index]
+        cached = self._resolved_paths.get(playlist.name)
+        if cached and cached[0] is playlist and cached[1] == playlist.version:
+            return cached[2]
 
         # Need to convert relative paths to full paths
-        full_paths = []
-        for path in self.playlists[self.current_playlist_index].song_paths:
-            if not os.path.isabs(path) and not path.startswith(self.songs_folder):
-                full_paths.append(os.path.join(self.songs_folder, path))
-            else:
-                full_paths.append(path)
+        full_paths = tuple(
+            (
+                os.path.join(self.songs_folder, path)
+                if not os.path.isabs(path) and not path.startswith(self.songs_folder)
+                else path
+            )
+            for path in playlist.song_paths
+        )
+        self._resolved_paths[playlist.name] = (playlist, playlist.version, full_paths)
         return full_paths
 
     @property
@@ -329,14 +528,338 @@ class PlaylistManager:
         return self.playlists[self.current_playlist_index].display_names
 
 
+class PlaybackService:
+    """Headless playback that keeps going without the player page.
+
+    A worker thread owns the pygame mixer, the play queue and the playback
+    state. The page only sends it commands and reads ``snapshot``, a copy
+    of the state the worker publishes after each command, so it can come
+    and go without touching audio. Between commands the worker sleeps until
+    the current song is due to end. Until ``start`` is called, commands run
+    on the caller's thread instead.
+    """
+
+    def __init__(self):
+        self.state = PlaybackState()
+        self.songs = ()  # Play queue: song paths of the current playlist
+        self.song_path = None
+        self.queued_song_path = None
+        self.queued_gain_applied = False  # Whether the volume is the queued song's
+        self.library = None  # Song library, used for measured gains
+        self.tracks = None  # Track table, used for song lengths from the scan
+        self.seek_index = None  # MP3 seek tables, for seeking by byte offset
+        self.commands = queue.Queue()
+        self.thread = None
+        self.snapshot = PlaybackSnapshot(self.state, None)
+
+    def start(self):
+        """Start the worker thread if it isn't running yet"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def set_songs(self, songs, index=None):
+        """Replace the play queue, optionally moving the current song's index.
+
+        For when the list changes around the current song; use ``select``
+        to pick another song.
+        """
+        self._submit(self._set_songs, tuple(songs), index)
+
+    def select(self, songs, index):
+        """Replace the play queue and make another song the current one.
+
+        A paused song is let go of, so resuming starts the new one.
+        """
+        self._submit(self._select, tuple(songs), index)
+
+    def play(self, song_path, index, songs):
+        """Play a song from the start.
+
+        Args:
+            song_path (str): Path of the song to play
+            index (int): Position of the song in ``songs``
+            songs (tuple): Song paths to carry on with once it ends
+        """
+        self._submit(self._play, song_path, index, tuple(songs))
+
+    def pause(self):
+        """Pause the current song"""
+        self._submit(self._pause)
+
+    def unpause(self):
+        """Carry on with a paused song"""
+        self._submit(self._unpause)
+
+    def stop(self):
+        """Stop playback"""
+        self._submit(self._stop)
+
+    def seek(self, position_percent):
+        """Play the current song from a position given in percent"""
+        self._submit(self._seek, position_percent)
+
+    def _submit(self, command, *args):
+        if self.thread is None:
+            command(*args)
+            self._publish()
+        else:
+            self.commands.put((command, args))
+
+    def _publish(self):
+        """Hand the page a new snapshot; replacing the attribute is atomic"""
+        self.snapshot = PlaybackSnapshot(self.state, self.song_path)
+
+    def _run(self):
+        """Worker thread: run commands, and wake up when a song is due to end"""
+        self._init_mixer()
+        while True:
+            try:
+                command, args = self.commands.get(timeout=self._time_to_song_end())
+            except queue.Empty:
+                command, args = self._check_song_finished, ()
+            try:
+                command(*args)
+            except Exception as e:
+                print(f"Error in playback service: {e}")
+            self._publish()
+
+    def _time_to_song_end(self):
+        """Seconds until the current song is due to end, or None if idle"""
+        if not self.state.is_playing:
+            return None
+        if self.state.current_song_length <= 0:
+            return SONG_END_CHECK_INTERVAL_MS / 1000
+        remaining_ms = self.state.current_song_length - self.state.get_elapsed_time_ms()
+        if self.queued_song_path and not self.queued_gain_applied:
+            # Wake just before the queued song starts to set its volume
+            return max(0, remaining_ms - SONG_GAIN_LEAD_MS) / 1000
+        return (max(0, remaining_ms) + SONG_END_MARGIN_MS) / 1000
+
+    def _init_mixer(self):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+    def _set_songs(self, songs, index):
+        self.songs = songs
+        if index is not None:
+            self.state.current_song_index = index
+        if self.state.is_playing or self.state.song_paused:
+            self._queue_next_song()
+
+    def _select(self, songs, index):
+        self.songs = songs
+        self.state.current_song_index = index
+        self.state.seek_offset = 0
+        self.state.song_paused = False
+        if self.state.is_playing:
+            self._queue_next_song()
+
+    def _play(self, song_path, index, songs):
+        self._init_mixer()
+        self.songs = songs
+        self.state.current_song_index = index
+        self._load(song_path)
+        pygame.mixer.music.play()
+        self.song_path = song_path
+        self.state.start_new_song()
+        self._load_song_length(song_path)
+        self._queue_next_song()
+        if self.seek_index:
+            self.seek_index.prepare(song_path)
+
+    def _pause(self):
+        pygame.mixer.music.pause()
+        self.state.pause()
+
+    def _unpause(self):
+        pygame.mixer.music.unpause()
+        self.state.resume()
+
+    def _stop(self):
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.state.is_playing = False
+        self.state.song_paused = False
+        self.state.current_song_length = 0
+        self.queued_song_path = None
+
+    def _seek(self, position_percent):
+        if not self.song_path:
+            return
+        if self.state.current_song_length == 0:
+            self._load_song_length(self.song_path)
+
+        try:
+            table = self.seek_index.get(self.song_path) if self.seek_index else None
+            if table:
+                # Start the mixer at the frame the table points to, and put
+                # the clock at that frame's exact start time
+                self.state.current_song_length = table.duration_ms
+                frame_ms, offset = table.lookup(
+                    max(0, position_percent / 100 * table.duration_ms)
+                )
+                self._load(self.song_path, TrackReader(self.song_path, offset))
+                pygame.mixer.music.play()
+                self.state.seek_to_ms(frame_ms)
+            else:
+                new_position_seconds = self.state.seek_to_position(
+                    position_percent, self.state.current_song_length
+                )
+                self._load(self.song_path)
+                pygame.mixer.music.play(start=new_position_seconds)
+        except Exception as e:
+            print(f"Error seeking: {e}")
+            # Fall back to playing the song from the beginning
+            self._load(self.song_path)
+            pygame.mixer.music.play()
+            self.state.start_new_song()
+        self._queue_next_song()
+        self.state.resume()
+
+    def _load(self, song_path, source=None):
+        """Load a song into the mixer and set its volume.
+
+        Loading resets the volume, so it's set again before the song plays.
+
+        Args:
+            song_path (str): Path of the song
+            source: MP3 file object to load instead, e.g. a ``TrackReader``
+        """
+        if source is None:
+            pygame.mixer.music.load(song_path)
+        else:
+            pygame.mixer.music.load(source, "mp3")
+        self._apply_gain(song_path)
+
+    def _apply_gain(self, song_path):
+        """Set the volume that brings a song to the target loudness.
+
+        The gain was measured ahead of time and is read from the library
+        index. The mixer can only turn songs down, so songs quieter than
+        the target play at full volume.
+        """
+        gain_db = self.library.get_gain_db(song_path) if self.library else None
+        pygame.mixer.music.set_volume(min(1.0, 10 ** ((gain_db or 0) / 20)))
+
+    def _load_song_length(self, song_path):
+        """Set the current song length, preferring the indexes we already have"""
+        # A seek table counts every frame, so its length is exact
+        table = self.seek_index.get(song_path) if self.seek_index else None
+        if table:
+            self.state.current_song_length = table.duration_ms
+            return
+
+        # Use the length the scanner put in the track table when it has one
+        duration_ms = self.tracks.duration_of(song_path) if self.tracks else 0
+        if duration_ms:
+            self.state.current_song_length = duration_ms
+            return
+
+        try:
+            self.state.current_song_length = _probe_song_length(song_path)
+        except Exception as e:
+            print(f"Error getting song length: {e}")
+            self.state.current_song_length = 0
+
+    def _queue_next_song(self):
+        """Hand the mixer the next song so it starts without a gap.
+
+        The mixer drops its queue whenever a song is loaded, so this is
+        called again after every load.
+        """
+        self.queued_song_path = None
+        self.queued_gain_applied = False
+        if not self.songs:
+            return
+
+        next_index = (self.state.current_song_index + 1) % len(self.songs)
+        try:
+            pygame.mixer.music.queue(self.songs[next_index])
+            self.queued_song_path = self.songs[next_index]
+        except Exception as e:
+            print(f"Error queueing next song: {e}")
+
+    def _advance_to_queued_song(self):
+        """Catch the playback state up after the mixer moved to the queued song"""
+        overrun_ms = max(
+            0, self.state.get_elapsed_time_ms() - self.state.current_song_length
+        )
+        if self.queued_song_path in self.songs:
+            self.state.current_song_index = self.songs.index(self.queued_song_path)
+        else:
+            self.state.current_song_index = (self.state.current_song_index + 1) % len(
+                self.songs
+            )
+
+        # The new song has been playing since the old one ended
+        self.song_path = self.queued_song_path
+        if not self.queued_gain_applied:
+            self._apply_gain(self.song_path)
+        self.state.start_new_song()
+        self.state.timer.seek(int(overrun_ms) * 1_000_000)
+        self._load_song_length(self.queued_song_path)
+        self._queue_next_song()
+        if self.seek_index:
+            self.seek_index.prepare(self.song_path)
+
+    def _check_song_finished(self):
+        """Move on to the next song if the current one has finished.
+
+        Song ends are found from the clock and ``get_busy`` rather than the
+        mixer's end event: pygame only delivers events once its video
+        system is up, which this app never starts, and its event queue
+        belongs to the main thread. The worker wakes just before the song is
+        due to end and again just after (see ``_time_to_song_end``), and
+        song lengths come from seek tables and headers, so this is accurate
+        to a few milliseconds.
+        """
+        if not self.state.is_playing or not self.songs or not pygame.mixer.get_init():
+            return
+
+        if pygame.mixer.music.get_busy():
+            # The mixer moves on to the queued song by itself, so only its
+            # volume and the playback state have to follow it. The volume is
+            # set just before the old song's time is up, so the queued song
+            # is never heard at the old one's volume.
+            remaining_ms = (
+                self.state.current_song_length - self.state.get_elapsed_time_ms()
+            )
+            if self.state.current_song_length <= 0 or not self.queued_song_path:
+                return
+            if not self.queued_gain_applied and remaining_ms <= SONG_GAIN_LEAD_MS:
+                self._apply_gain(self.queued_song_path)
+                self.queued_gain_applied = True
+            if remaining_ms <= 0:
+                self._advance_to_queued_song()
+        else:
+            # Nothing was queued, so start the next song
+            index = (self.state.current_song_index + 1) % len(self.songs)
+            try:
+                self._play(self.songs[index], index, self.songs)
+            except Exception as e:
+                print(f"Error loading next song: {e}")
+                self._stop()
+
+
+def get_playback_service():
+    """Get the playback service, creating it the first time"""
+    global _playback_service
+    if _playback_service is None:
+        _playback_service = PlaybackService()
+    return _playback_service
+
+
 class MusicPlayer:
     ICON_PLAY = "⏵"
     ICON_PAUSE = "⏸"
 
     def __init__(self):
-        # State objects
-        self.state = PlaybackState()
+        # Playback runs in the shared service; the page reads its snapshots
+        self.service = get_playback_service()
         self.playlist = PlaylistManager()
+        self.service.tracks = self.playlist.tracks
+        self.is_seeking = False  # Whether the progress slider is being dragged
 
         # UI elements
         self.root = None
@@ -354,7 +877,17 @@ class MusicPlayer:
         self.playlist_container = None
         self.canvas = None
         self.scrollbar = None
-        self.scrollable_frame = None
+        self.song_rows = []  # Recycled [button, canvas window, song index] rows
+        self.song_names = []
+        self.song_list_message = None  # Label shown instead of an empty list
+        self.song_list_message_window = None
+        self.search_entry = None
+        self.search_results = None  # Available song indices while searching
+        self.visualizer_canvas = None
+        self.visualizer = None
+        self.art_label = None
+        self.art_image = None  # Keeps the shown image alive
+        self.art_song_path = None
         self.loading_label_main_ui = None
 
         # Playlist UI elements
@@ -376,75 +909,77 @@ class MusicPlayer:
         self.notification_timer = None
 
         # Timers and checkers
-        self.song_end_check_id = None
-        self.progress_update_id = None
+        self.progress_task = None
+        self.visualizer_task = None
+        self.library = None
+        self.library_task = None
+        self.loudness = None  # Measures songs for volume normalization
+        self.loudness_task = None
+        self.artwork = None  # Album art thumbnails on disk
+        self.art_images = None  # Tk images of recently shown art
+        self.artwork_task = None
+        self.shown_song_index = None
+        self.followed_song_index = None  # Current song of the snapshot shown
+        self.resume_after_seek = False
 
         # Scroll event bindings
         self.wheel_bindings = []
 
+        # Spectrum and waveform analysis for the visualizer, created with the
+        # library; needs NumPy
+        self.analyzer = None
+
     def play(self):
         """Toggle play/pause state and update button icon"""
         if not self.ui_built or not self.playlist.has_songs():
             return
 
-        if self.state.is_playing:
+        if self.service.snapshot.is_playing:
             self._pause_playback()
         else:
             self._resume_playback()
 
     def _pause_playback(self):
         """Pause the current playback and update UI"""
-        pygame.mixer.music.pause()
+        self.service.pause()
         self.pause_play.configure(text=self.ICON_PLAY)
-        self.state.pause()
         self._stop_progress_updates()
 
     def _resume_playback(self):
         """Resume playback from paused state or start new playback"""
-        if self.state.song_paused:
-            pygame.mixer.music.unpause()
-            self.state.resume()
-        elif not pygame.mixer.music.get_busy() or pygame.mixer.music.get_pos() < 0:
-            self._start_current_song()
+        playback = self.service.snapshot
+        if playback.song_paused:
+            self.service.unpause()
+        else:
+            self._start_current_song(playback.current_song_index)
 
         self._update_playing_state_ui()
-        self.state.is_playing = True
 
-    def _start_current_song(self):
-        """Load and play the current song, resetting necessary states"""
-        song_path = self.playlist.get_current_song_path(self.state.current_song_index)
+    def _start_current_song(self, index=None):
+        """Have the playback service play a song, by default the current one"""
+        if index is None:
+            index = self.service.snapshot.current_song_index
+        song_path = self.playlist.get_current_song_path(index)
         if not song_path:
             return
 
-        pygame.mixer.music.load(song_path)
-        pygame.mixer.music.play()
-        self.state.start_new_song()
-
-        try:
-            sound = pygame.mixer.Sound(song_path)
-            self.state.current_song_length = (
-                sound.get_length() * 1000
-            )  # Convert to milliseconds
-        except Exception as e:
-            print(f"Error getting song length: {e}")
-            self.state.current_song_length = 0
+        self.service.play(song_path, index, self.playlist.playlist_files)
 
     def _change_song(self, direction):
         """Change to the next or previous song"""
         if not self.ui_built or not self.playlist.has_songs():
             return
 
-        was_playing = self.state.is_playing
-        self.state.current_song_index = (
-            self.state.current_song_index + direction
-        ) % len(self.playlist.playlist_files)
+        playback = self.service.snapshot
+        playlist_files = self.playlist.playlist_files
+        index = (playback.current_song_index + direction) % len(playlist_files)
+        self.service.select(playlist_files, index)
 
         # Reset state for new song
-        self.state.current_song_length = 0
-        self.reset_state()
+        self.reset_state(index)
         # Start playback if it was playing before
-        if was_playing:
-            self._start_current_song()
+        if playback.is_playing:
+            self._start_current_song(index)
             self._update_playing_state_ui()
 
     def next_song(self):
@@ -464,31 +999,91 @@ class MusicPlayer:
         ):
             return
 
-        self.state.current_song_index = index
-        self.state.current_song_length = 0
-        self.reset_state()
-        self._start_current_song()
-        self.state.is_playing = True
+        self.reset_state(index)
+        self._start_current_song(index)
         self._update_playing_state_ui()
 
-    def reset_state(self):
-        self.state.seek_offset = 0
-        self.state.song_paused = False
+    def reset_state(self, index=None):
+        """Show the start of a newly selected song"""
         if self.progress_slider:
             self.progress_slider.set(0)
         self._update_time_display(0)
-        self._update_song_display()
+        self._update_song_display(index)
 
-    def _update_song_display(self):
-        """Update the song title display"""
+    def _update_song_display(self, index=None):
+        """Update the song title display.
+
+        Args:
+            index (int): Song to show, for songs just sent to the service
+                that its snapshot doesn't have yet; defaults to the
+                snapshot's current song
+        """
         if not self.ui_built:
             if self.loading_label_main_ui:
                 self.loading_label_main_ui.configure(text="Loading Songs...")
             return
 
-        song_name = self.playlist.get_current_song_name(self.state.current_song_index)
+        if index is None:
+            index = self.service.snapshot.current_song_index
+            self.followed_song_index = index
+        self.shown_song_index = index
+        song_name = self.playlist.get_current_song_name(self.shown_song_index)
         if self.song_label:
             self.song_label.configure(text=song_name)
+        self._update_artwork()
+
+    def _update_artwork(self):
+        """Show the current song's album art.
+
+        Only thumbnails already scaled down by the artwork worker are loaded
+        here; songs not looked at yet are handed to the worker, and their art
+        is shown when it's ready.
+        """
+        if not self.art_label or not self.artwork:
+            return
+        song_path = self.playlist.get_current_song_path(self.shown_song_index)
+        self.art_song_path = song_path
+        image = self.art_images.get(song_path) if song_path else None
+        if image is None and song_path:
+            thumbnail = self.artwork.cached(song_path)
+            if thumbnail:
+                image = self._load_artwork(song_path, thumbnail)
+            elif thumbnail is None:
+                self.artwork.request(song_path)
+                self._start_artwork_updates()
+        self.art_image = image
+        self.art_label.configure(image=image or "")
+
+    def _load_artwork(self, song_path, thumbnail):
+        """Load a thumbnail into a Tk image and keep it in the image cache"""
+        try:
+            image = d3.PhotoImage(file=thumbnail)
+        except Exception as e:
+            print(f"Error loading album art: {e}")
+            return None
+        self.art_images.put(song_path, image)
+        return image
+
+    def _start_artwork_updates(self):
+        """Wait for the artwork worker to finish the requested thumbnails"""
+        if not self.artwork_task:
+            self.artwork_task = self.page.schedule(
+                ARTWORK_POLL_INTERVAL_MS, self._poll_artwork
+            )
+
+    def _poll_artwork(self):
+        """Show the current song's art once the worker has made it"""
+        for song_path, thumbnail in self.artwork.poll():
+            if thumbnail and song_path == self.art_song_path:
+                self._update_artwork()
+        if not self.artwork.pending:
+            self._stop_artwork_updates()
+
+    def _stop_artwork_updates(self):
+        """Stop waiting for the artwork worker"""
+        if self.artwork_task:
+            self.artwork_task.cancel()
+            self.artwork_task = None
 
     def create_widgets(self, page):
         """Create the initial UI and schedule full UI build"""
@@ -510,14 +1105,16 @@ class MusicPlayer:
         self.root.after(config["animation"].TWEEN_DURATION, self._initialize_player)
 
     def _initialize_player(self):
-        """Initialize pygame mixer, load songs, and build the full UI"""
-        # Initialize pygame mixer
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        """Start the playback service, load songs, and build the full UI"""
+        # The service thread sets up the mixer
+        self.service.start()
 
-        # Load songs if needed
+        # Load songs if needed, or pick up background work the last page
+        # left unfinished
         if not self.playlist.songs_loaded:
-            self.playlist.load_songs()
+            self._load_library()
+        else:
+            self._resume_library_work()
 
         # Remove loading label
         if self.loading_label_main_ui:
@@ -538,26 +1135,165 @@ class MusicPlayer:
             self.delete_playlist_btn.config(state="disabled")
 
         # Update UI for current state
-        if self.state.is_playing:
+        playback = self.service.snapshot
+        if playback.is_playing:
             self.pause_play.configure(text=self.ICON_PAUSE)
         else:
             self.pause_play.configure(text=self.ICON_PLAY)
 
         # Update progress if needed
-        if pygame.mixer.get_init() and (
-            self.state.is_playing or self.state.song_paused
-        ):
+        if playback.is_playing or playback.song_paused:
             self._update_progress()
 
-        # Ensure checkers are active if playing
-        if (
-            self.state.is_playing
-            and self.playlist.has_songs()
-            and pygame.mixer.music.get_busy()
-        ):
-            self._start_song_end_checker()
+        # Follow the song that is already playing
+        if playback.is_playing and self.playlist.has_songs():
             self._start_progress_updates()
 
+    def _load_library(self):
+        """Show the songs known from the library cache, then rescan in the background"""
+        music_config = config["music"]
+        self.library = SongLibrary(
+            self.playlist.songs_folder,
+            music_config.LIBRARY_CACHE_FILE,
+            probe=_probe_song_length,
+            batch_size=music_config.LIBRARY_BATCH_SIZE,
+        )
+        self.service.library = self.library
+        if self.service.seek_index is None:
+            self.service.seek_index = SeekIndex(
+                music_config.SEEK_INDEX_DIR, music_config.SEEK_INDEX_INTERVAL
+            )
+        if self.artwork is None:
+            self.artwork = ArtworkCache(
+                music_config.ARTWORK_CACHE_DIR,
+                ARTWORK_SIZE,
+                _make_thumbnail,
+                music_config.ARTWORK_CACHE_FILES,
+            )
+            self.art_images = ImageCache(music_config.ARTWORK_MEMORY_BUDGET)
+        if self.analyzer is None and HAVE_NUMPY:
+            self.analyzer = TrackAnalyzer(
+                _decode_song_blocks,
+                VISUALIZER_CACHE_SIZE,
+                music_config.VISUALIZER_CACHE_DIR,
+                music_config.VISUALIZER_CACHE_FILES,
+                frame_ms=VISUALIZER_FRAME_MS,
+                bars=VISUALIZER_BARS,
+            )
+        self.playlist.update_songs(
+            self.library.load_cache(), self.library.get_duration_ms
+        )
+
+        if not os.path.isdir(self.playlist.songs_folder):
+            print(f"Songs folder not found: {self.playlist.songs_folder}")
+            return
+        if self.library.start_scan():
+            self.library_task = self.page.schedule(
+                music_config.LIBRARY_POLL_INTERVAL,
+                self._poll_library,
+                background=True,
+            )
+
+    def _poll_library(self):
+        """Merge finished scan batches into the playlists and refresh the UI"""
+        if self.library.poll():
+            current_path = self.playlist.get_current_song_path(
+                self.service.snapshot.current_song_index
+            )
+            self.playlist.update_songs(
+                self.library.paths(), self.library.get_duration_ms
+            )
+
+            # Keep pointing at the same song if the list shifted around it
+            playlist_files = self.playlist.playlist_files
+            index = (
+                playlist_files.index(current_path)
+                if current_path in playlist_files
+                else None
+            )
+            self.service.set_songs(playlist_files, index)
+
+            if self.ui_built:
+                # Search results point into the old song list
+                if self.search_results is not None:
+                    self.search_results = self.playlist.search_songs(
+                        self.search_entry.get()
+                    )
+                self._create_playlist_items()
+                self._update_song_display(index)
+
+        if not self.library.scanning:
+            self._stop_library_updates()
+            self._start_loudness_analysis()
+
+    def _resume_library_work(self):
+        """Pick up scanning and loudness work left over from a closed page.
+
+        Destroying the page only stops the polling; scan batches and gains
+        that weren't collected yet are still queued, and songs whose gain
+        wasn't measured are still listed as unmeasured.
+        """
+        if not self.library:
+            return
+        if self.library.scanning:
+            if not self.library_task:
+                self.library_task = self.page.schedule(
+                    config["music"].LIBRARY_POLL_INTERVAL,
+                    self._poll_library,
+                    background=True,
+                )
+        else:
+            self._start_loudness_analysis()
+
+    def _stop_library_updates(self):
+        """Stop polling the library scanner"""
+        if self.library_task:
+            self.library_task.cancel()
+            self.library_task = None
+
+    def _start_loudness_analysis(self):
+        """Measure the loudness of songs the library has no gain for yet"""
+        if not HAVE_NUMPY or not self.library:
+            return
+        unmeasured = self.library.unmeasured()
+        if not unmeasured:
+            return
+
+        music_config = config["music"]
+        if self.loudness is None:
+            self.loudness = LoudnessAnalyzer(
+                music_config.LOUDNESS_TARGET_LUFS, music_config.LOUDNESS_WORKERS
+            )
+        self.loudness.add(unmeasured)
+        if not self.loudness_task:
+            self.loudness_task = self.page.schedule(
+                music_config.LOUDNESS_POLL_INTERVAL,
+                self._poll_loudness,
+                background=True,
+            )
+
+    def _poll_loudness(self):
+        """Record measured gains in the library, saving them now and then"""
+        gains = self.loudness.poll()
+        if gains:
+            self.library.set_gains(gains)
+        if not self.loudness.busy:
+            self.library.save()
+            self.loudness_task.cancel()
+            self.loudness_task = None
+        elif self.library.unsaved_gains >= config["music"].LIBRARY_BATCH_SIZE:
+            self.library.save()
+
+    def _stop_loudness_analysis(self):
+        """Stop measuring, keeping the gains measured so far"""
+        if self.loudness_task:
+            self.loudness_task.cancel()
+            self.loudness_task = None
+        if self.loudness:
+            self.loudness.shutdown()
+        if self.library:
+            self.library.save()
+
     def _build_full_ui(self):
         """Build the main UI components"""
         ui_config = config["ui"]
@@ -650,6 +1386,19 @@ class MusicPlayer:
         )
         self.remove_song_btn.pack(side="left", padx=2)
 
+        # Search box; while it has text the song list shows library matches
+        self.search_entry = d3.Entry(
+            self.page.page_frame,
+            font=(ui_config.FONT_FAMILY, 10),
+            bg=ui_config.BACKGROUND_COLOR,
+            fg=ui_config.PRIMARY_COLOR,
+            insertbackground=ui_config.PRIMARY_COLOR,
+        )
+        # Its own row, just below the 30 pixel playlist bar
+        self.search_entry.place(relx=0.1, rely=0.05, y=32, relwidth=0.8, height=22)
+        self.search_entry.bind("<KeyRelease>", self._on_search_changed)
+        self.search_entry.bind("<Escape>", lambda e: self._clear_search())
+
         # Song title label
         self.song_label = d3.Label(
             self.page.page_frame,
@@ -660,6 +1409,15 @@ class MusicPlayer:
         )
         self.song_label.place(relx=0.5, rely=0.7, anchor="center")
 
+        # Album art, in the free corner left of the control buttons, clear of
+        # the visualizer, the song title and the progress slider
+        self.art_label = d3.Label(
+            self.page.page_frame,
+            bg=ui_config.BACKGROUND_COLOR,
+            bd=0,
+        )
+        self.art_label.place(x=6, rely=0.92, anchor="w")
+
         # Progress slider
         self.progress_slider = d3.Scale(
             self.page.page_frame,
@@ -697,6 +1455,9 @@ class MusicPlayer:
         # Playlist container
         self._create_playlist_container(ui_config)
 
+        # Spectrum and waveform of the playing song
+        self._create_visualizer(ui_config)
+
         # Create notification frame for messages
         self._create_notification_frame(ui_config)
 
@@ -732,8 +1493,15 @@ class MusicPlayer:
             bg=ui_config.BACKGROUND_COLOR,
             highlightthickness=0,
         )
+        # Below the playlist bar and the search box, down to the visualizer
         self.playlist_container.place(
-            relx=0.1, rely=0.2, relwidth=0.8, relheight=0.45, anchor="nw"
+            relx=0.1,
+            rely=0.05,
+            y=58,
+            relwidth=0.8,
+            relheight=0.52,
+            height=-58,
+            anchor="nw",
         )
 
         self.canvas = d3.Canvas(
@@ -748,57 +1516,68 @@ class MusicPlayer:
             command=self.canvas.yview,
             width=10,
         )
-        self.scrollable_frame = d3.Frame(
-            self.canvas,
-            bg=ui_config.BACKGROUND_COLOR,
-            highlightthickness=0,
-            bd=0,
-        )
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
+        # Rows are laid out on the canvas itself; scrolling moves the view
+        # and the visible rows are refilled from a small pool of buttons
+        self.song_rows = []
+        self.song_list_message = None
+        self.song_list_message_window = None
+        self.canvas.configure(
+            yscrollcommand=self._on_song_list_scrolled,
+            yscrollincrement=SONG_ROW_HEIGHT,
         )
+        self.canvas.bind("<Configure>", self._on_song_list_resized)
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Simple direct bindings for Windows and Linux
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel_windows)  # Windows
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel_linux_up)  # Linux up
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel_linux_down)  # Linux down
+        self._bind_scroll_events()
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+    def _create_visualizer(self, ui_config):
+        """Create the visualizer canvas below the song list"""
+        if self.analyzer is None:
+            return
+        self.visualizer_canvas = d3.Canvas(
+            self.page.page_frame,
+            bg=ui_config.BACKGROUND_COLOR,
+            highlightthickness=0,
+            bd=0,
+        )
+        self.visualizer_canvas.place(relx=0.1, rely=0.58, relwidth=0.8, relheight=0.08)
+        self.visualizer = SpectrumView(
+            self.visualizer_canvas,
+            VISUALIZER_BARS,
+            color=ui_config.PRIMARY_COLOR,
+            dim_color=ui_config.ACTIVE_BACKGROUND_COLOR,
+        )
+        self.visualizer_canvas.bind(
+            "<Configure>", lambda e: self.visualizer.resize(e.width, e.height)
+        )
+
     def _on_playlist_selected(self, selected_playlist):
         """Handle playlist selection from dropdown"""
         playlist_names = self.playlist.get_playlist_display_names()
         if selected_playlist in playlist_names:
             index = playlist_names.index(selected_playlist)
             if self.playlist.switch_playlist(index):
-                # Stop any currently playing music
-                if self.state.is_playing:
-                    pygame.mixer.music.stop()
-
-                # Reset playback state
-                self.state.is_playing = False
-                self.state.song_paused = False
-                self.state.current_song_index = 0
-                self.state.current_song_length = 0
-                self.reset_state()
+                # Stop any currently playing music and start the new list
+                self.service.stop()
+                self.service.select(self.playlist.playlist_files, 0)
+                self.reset_state(0)
 
                 # Update button icons
                 if self.pause_play:
                     self.pause_play.configure(text=self.ICON_PLAY)
 
                 # Stop timers
-                self._stop_song_end_checker()
                 self._stop_progress_updates()
 
-                # Update UI
+                # Update UI, leaving any search
+                if self.search_entry:
+                    self.search_entry.delete(0, "end")
+                self.search_results = None
                 self._create_playlist_items()
-                self._update_song_display()
+                self._update_song_display(0)
 
                 # Enable/disable delete button (don't allow deleting "All Songs")
                 self.delete_playlist_btn.config(
@@ -830,71 +1609,70 @@ class MusicPlayer:
         if current_selection not in playlist_names and playlist_names:
             self.playlist_selector_var.set(playlist_names[0])
 
-    def _start_song_end_checker(self):
-        """Start checking for song completion"""
-        if not self.ui_built or not self.root:
-            return
-
-        self._stop_song_end_checker()  # Cancel any existing checker
-        is_background = not self.ui_built
-        self.song_end_check_id = self.root.after(
-            SONG_END_CHECK_INTERVAL_MS,
-            lambda: self._check_song_finished(is_background_mode=is_background),
-        )
-
-    def _stop_song_end_checker(self):
-        """Stop the song end checker"""
-        if self.song_end_check_id and self.root:
-            self.root.after_cancel(self.song_end_check_id)
-            self.song_end_check_id = None
-
     def _start_progress_updates(self):
         """Start updating the progress slider"""
         if not self.ui_built or not self.root or not self.progress_slider:
             return
 
         self._stop_progress_updates()  # Cancel any existing updates
-        self.progress_update_id = self.root.after(
+        # Tied to the page, so the scheduler skips it while the page is hidden
+        self.progress_task = self.page.schedule(
             PROGRESS_UPDATE_INTERVAL_MS, self._update_progress
         )
+        if self.visualizer:
+            self.visualizer_task = self.page.schedule(
+                VISUALIZER_FRAME_MS, self._update_visualizer
+            )
 
     def _stop_progress_updates(self):
         """Stop progress slider updates"""
-        if self.progress_update_id and self.root:
-            self.root.after_cancel(self.progress_update_id)
-            self.progress_update_id = None
+        if self.progress_task:
+            self.progress_task.cancel()
+            self.progress_task = None
+        if self.visualizer_task:
+            self.visualizer_task.cancel()
+            self.visualizer_task = None
+
+    def _update_visualizer(self):
+        """Draw one visualizer frame at the current playback position.
+
+        Each frame is a lookup in the song's precomputed analysis, which is
+        requested from the analyzer thread the first time the song shows up.
+        """
+        if not self.ui_built or not self.visualizer:
+            return
+        playback = self.service.snapshot
+        song_path = playback.song_path
+        analysis = self.analyzer.get(song_path) if song_path else None
+        if analysis is None and song_path:
+            self.analyzer.request(song_path)
+        self.visualizer.show(analysis)
+        if analysis is not None and not self.is_seeking:
+            self.visualizer.draw(playback.get_elapsed_time_ms())
 
     def _update_progress(self):
         """Update the progress slider to match current song position"""
-        if (
-            not self.ui_built
-            or not self.state.is_playing
-            or not pygame.mixer.get_init()
-            or self.state.is_seeking
-        ):
-            # Reschedule only if needed
-            if (
-                self.progress_update_id
-                and self.state.is_playing
-                and not self.state.is_seeking
-            ):
-                self.progress_update_id = self.root.after(
-                    PROGRESS_UPDATE_INTERVAL_MS, self._update_progress
-                )
+        if not self.ui_built:
+            return
+        # The service moves on to the next song by itself
+        playback = self.service.snapshot
+        if playback.current_song_index != self.followed_song_index:
+            self._update_song_display()
+        if not playback.is_playing or self.is_seeking:
             return
 
         try:
             # Get current position
-            elapsed_time = self.state.get_elapsed_time_ms()
+            elapsed_time = playback.get_elapsed_time_ms()
 
             # Update slider and time display
             if elapsed_time < 0:
                 self.progress_slider.set(0)
                 self._update_time_display(0)
-            elif self.state.current_song_length > 0:
+            elif playback.current_song_length > 0:
                 position_percent = min(
                     100,
-                    max(0, (elapsed_time / self.state.current_song_length) * 100),
+                    max(0, (elapsed_time / playback.current_song_length) * 100),
                 )
 
                 # Only update if significant change to prevent flicker
@@ -908,28 +1686,14 @@ class MusicPlayer:
         except Exception as e:
             print(f"Error updating progress: {e}")
 
-        # Reschedule update
-        if (
-            self.root
-            and self.ui_built
-            and self.state.is_playing
-            and not self.state.is_seeking
-        ):
-            self.progress_update_id = self.root.after(
-                PROGRESS_UPDATE_INTERVAL_MS, self._update_progress
-            )
-
     def _update_time_display(self, current_seconds):
         """Update the time display label"""
         if not self.time_display_label:
             return
 
         current_seconds = int(current_seconds)
-        total_seconds = (
-            int(self.state.current_song_length / 1000)
-            if self.state.current_song_length > 0
-            else 0
-        )
+        song_length = self.service.snapshot.current_song_length
+        total_seconds = int(song_length / 1000) if song_length > 0 else 0
 
         current_min, current_sec = divmod(current_seconds, 60)
         total_min, total_sec = divmod(total_seconds, 60)
@@ -944,136 +1708,50 @@ class MusicPlayer:
 
     def _on_slider_press(self, event):
         """Handle slider press for seeking"""
-        if not self.state.is_playing or not self.playlist.has_songs():
+        if not self.service.snapshot.is_playing or not self.playlist.has_songs():
             return
 
-        self.state.is_seeking = True
-        pygame.mixer.music.pause()  # Pause during seeking
+        self.is_seeking = True
+        self.resume_after_seek = True
+        self.service.pause()  # Pause during seeking
 
     def _on_slider_release(self, event):
         """Handle slider release after seeking"""
-        was_playing = self.state.is_playing
-
+        self.is_seeking = False
         if (
-            not was_playing
+            not self.resume_after_seek
             or not self.playlist.has_songs()
             or not self.ui_built
-            or not pygame.mixer.get_init()
         ):
-            self.state.is_seeking = False
-            return
-
-        try:
-            self._seek_to_slider_position()
-        except Exception as e:
-            print(f"Error seeking: {e}")
-            try:
-                self._restart_song()
-            except Exception:
-                pass
-
-        self.state.is_seeking = False
-
-        # Resume playback if it was playing before
-        if was_playing:
-            pygame.mixer.music.unpause()
-            self._start_progress_updates()
-            self._start_song_end_checker()
-
-    def _restart_song(self):
-        """Restart the current song from the beginning"""
-        song_path = self.playlist.get_current_song_path(self.state.current_song_index)
-        if not song_path:
             return
 
-        pygame.mixer.music.load(song_path)
-        pygame.mixer.music.play()
-        self.progress_slider.set(0)
-        self._update_time_display(0)
-        self.state.start_new_song()
+        self.resume_after_seek = False
+        self._seek_to_slider_position()
+        self._update_playing_state_ui()
 
     def _seek_to_slider_position(self):
         """Seek to the position indicated by the slider"""
         position_percent = float(self.progress_slider.get())
-
-        # Get song length if needed
-        if self.state.current_song_length == 0:
-            song_path = self.playlist.get_current_song_path(
-                self.state.current_song_index
-            )
-            if not song_path:
-                return
-
-            try:
-                sound = pygame.mixer.Sound(song_path)
-                self.state.current_song_length = sound.get_length() * 1000
-            except Exception as e:
-                print(f"Error getting song length for seeking: {e}")
-                return
-        # Calculate new position and apply seek
-        new_position_seconds = self.state.seek_to_position(
-            position_percent, self.state.current_song_length
-        )
-
-        # Reload and play from new position
-        song_path = self.playlist.get_current_song_path(self.state.current_song_index)
-        if not song_path:
-            return
-
-        pygame.mixer.music.load(song_path)
-        pygame.mixer.music.play(start=new_position_seconds)
+        self.service.seek(position_percent)
 
         # Update slider and time display
         self.progress_slider.set(position_percent)
-        self._update_time_display(new_position_seconds)
+        self._update_time_display(
+            position_percent / 100 * self.service.snapshot.current_song_length / 1000
+        )
 
     def _on_slider_change(self, value):
         """Update slider visually during dragging"""
-        if self.state.is_seeking:
+        if self.is_seeking:
             try:
                 position = float(value)
                 self.progress_slider.set(position)
             except Exception:
                 pass
 
-    def _check_song_finished(self, is_background_mode=False):
-        """Check if song has finished and play next if needed"""
-        if should_advance := (
-            self.state.is_playing
-            and self.playlist.has_songs()
-            and pygame.mixer.get_init()
-            and not pygame.mixer.music.get_busy()
-            and not self.state.is_seeking
-        ):
-            if not is_background_mode and self.ui_built:
-                # Full UI mode - use next_song() for complete state management
-                self.next_song()
-            else:
-                # Background mode - simpler handling
-                self.state.current_song_index = (
-                    self.state.current_song_index + 1
-                ) % len(self.playlist.playlist_files)
-                try:
-                    self._start_current_song()
-                    if self.ui_built and self.song_label:
-                        self._update_song_display()
-                except Exception as e:
-                    print(f"Error loading next song in background: {e}")
-
-        # Reschedule if still playing
-        if self.root and self.state.is_playing and self.song_end_check_id is not None:
-            current_mode_is_background = is_background_mode or not self.ui_built
-            self.song_end_check_id = self.root.after(
-                SONG_END_CHECK_INTERVAL_MS,
-                lambda: self._check_song_finished(
-                    is_background_mode=current_mode_is_background
-                ),
-            )
-
     def _update_playing_state_ui(self):
         """Update UI elements for playing state"""
         self.pause_play.configure(text=self.ICON_PAUSE)
-        self._start_song_end_checker()
         self._start_progress_updates()
 
     def _show_notification(self, message, duration=500, notification_type="info"):
@@ -1176,6 +1854,13 @@ class MusicPlayer:
         self.canvas.yview_scroll(1, "units")
         return "break"
 
+    def _bind_scroll_events(self):
+        """Bind scroll wheel events to the playlist canvas"""
+        # Simple direct bindings for Windows and Linux
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel_windows)  # Windows
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel_linux_up)  # Linux up
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel_linux_down)  # Linux down
+
     def _unbind_scroll_events(self):
         """Unbind scroll wheel events to prevent conflicts"""
         if hasattr(self, "canvas") and self.canvas:
@@ -1187,68 +1872,176 @@ class MusicPlayer:
                 pass
 
     def _create_playlist_items(self):
-        """Create the playlist item buttons"""
-        ui_config = config["ui"]
-
-        # Clear existing items
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        """Show the current playlist in the song list.
+
+        Only the rows that fit in the visible part of the canvas exist as
+        widgets, so this costs the same however long the playlist is.
+        """
+        if self.search_results is not None:
+            message = None if self.search_results else "No matching songs"
+        elif not self.playlist.songs_loaded:
+            message = "Loading playlist..."
+        elif not self.playlist.has_songs() or self.playlist.playlist_display_names == [
+            "No songs found"
+        ]:
+            message = "No songs found in the current playlist"
+        else:
+            message = None
+
+        self._show_song_list_message(message)
+        if message:
+            self.song_names = []
+        elif self.search_results is not None:
+            self.song_names = [
+                self.playlist.available_song_names[index]
+                for index in self.search_results
+            ]
+        else:
+            self.song_names = self.playlist.playlist_display_names
 
-        if not self.playlist.songs_loaded:
-            loading_label = d3.Label(
-                self.scrollable_frame,
-                text="Loading playlist...",
-                font=(ui_config.FONT_FAMILY, 12),
-                bg=ui_config.BACKGROUND_COLOR,
-                fg=ui_config.PRIMARY_COLOR,
-                anchor="w",
-            )
-            loading_label.pack(fill="x", pady=2)
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, len(self.song_names) * SONG_ROW_HEIGHT)
+        )
+        # Every row has to be refilled for the new list
+        for row in self.song_rows:
+            row[2] = None
+        self._update_song_rows()
+
+    def _show_song_list_message(self, message):
+        """Show a message in place of the song list, or hide it if None.
+
+        The label and its canvas window are made once and reused, so typing
+        in the search box doesn't pile up canvas items.
+        """
+        if message is None:
+            if self.song_list_message is not None:
+                self.canvas.itemconfigure(self.song_list_message_window, state="hidden")
             return
 
-        if not self.playlist.has_songs() or self.playlist.playlist_display_names == [
-            "No songs found"
-        ]:
-            no_songs_label = d3.Label(
-                self.scrollable_frame,
-                text="No songs found in the current playlist",
+        if self.song_list_message is None:
+            ui_config = config["ui"]
+            self.song_list_message = d3.Label(
+                self.canvas,
                 font=(ui_config.FONT_FAMILY, 12),
                 bg=ui_config.BACKGROUND_COLOR,
                 fg=ui_config.PRIMARY_COLOR,
                 anchor="w",
             )
-            no_songs_label.pack(fill="x", pady=2)
-            return
+            self.song_list_message_window = self.canvas.create_window(
+                (5, 5), window=self.song_list_message, anchor="nw"
+            )
+        self.song_list_message.configure(text=message)
+        self.canvas.itemconfigure(self.song_list_message_window, state="normal")
 
-        # Frame to hold all song buttons
-        playlist_inner = d3.Frame(
-            self.scrollable_frame,
+    def _create_song_row(self):
+        """Create a row for the song list pool"""
+        ui_config = config["ui"]
+        button = d3.Button(
+            self.canvas,
+            font=(ui_config.FONT_FAMILY, 12),
             bg=ui_config.BACKGROUND_COLOR,
+            fg=ui_config.PRIMARY_COLOR,
+            activebackground=ui_config.ACTIVE_BACKGROUND_COLOR,
+            activeforeground=ui_config.PRIMARY_COLOR,
+            anchor="w",
+            relief="flat",
             padx=5,
-            pady=5,
-            highlightthickness=0,
+            pady=2,
+        )
+        window = self.canvas.create_window(
+            (0, 0),
+            window=button,
+            anchor="nw",
+            height=SONG_ROW_HEIGHT - 4,
+            state="hidden",
         )
-        playlist_inner.pack(fill="both", expand=True)
+        return [button, window, None]
+
+    def _on_song_list_resized(self, event):
+        """Refill every row, since their width and the number needed change"""
+        for row in self.song_rows:
+            row[2] = None
+        self._update_song_rows()
+
+    def _on_song_list_scrolled(self, first, last):
+        """Keep the scrollbar in step and refill the rows that came into view"""
+        self.scrollbar.set(first, last)
+        self._update_song_rows()
+
+    def _update_song_rows(self):
+        """Fill the visible part of the song list from the row pool.
+
+        Song i always goes in row i % pool size, so scrolling only relabels
+        the rows whose song changed.
+        """
+        if not self.canvas:
+            return
 
-        # Create song buttons
-        for i, song_name in enumerate(self.playlist.playlist_display_names):
-            song_btn = d3.Button(
-                playlist_inner,
-                text=song_name,
-                font=(ui_config.FONT_FAMILY, 12),
-                command=lambda x=i: self.select_song(x),
-                bg=ui_config.BACKGROUND_COLOR,
-                fg=ui_config.PRIMARY_COLOR,
-                activebackground=ui_config.ACTIVE_BACKGROUND_COLOR,
-                activeforeground=ui_config.PRIMARY_COLOR,
-                anchor="w",
-                relief="flat",
-                wraplength=300,
-                justify="left",
-                padx=5,
-                pady=2,
+        visible_rows = int(self.canvas.winfo_height()) // SONG_ROW_HEIGHT + 1
+        pool_size = min(len(self.song_names), visible_rows + 2 * SONG_ROW_OVERSCAN)
+        while len(self.song_rows) < pool_size:
+            self.song_rows.append(self._create_song_row())
+        if not self.song_rows:
+            return
+
+        width = max(0, int(self.canvas.winfo_width()) - 10)
+        first_index = max(
+            0, int(self.canvas.canvasy(0)) // SONG_ROW_HEIGHT - SONG_ROW_OVERSCAN
+        )
+        for index in range(first_index, first_index + len(self.song_rows)):
+            row = self.song_rows[index % len(self.song_rows)]
+            if index >= len(self.song_names):
+                if row[2] is not None:
+                    self.canvas.itemconfigure(row[1], state="hidden")
+                    row[2] = None
+                continue
+            if row[2] == index:
+                continue
+
+            row[0].configure(
+                text=self.song_names[index],
+                command=lambda x=index: self._on_song_row_clicked(x),
             )
-            song_btn.pack(fill="x", pady=2)
+            self.canvas.coords(row[1], 5, index * SONG_ROW_HEIGHT + 2)
+            self.canvas.itemconfigure(row[1], width=width, state="normal")
+            row[2] = index
+
+    def _on_song_row_clicked(self, index):
+        """Play the song in a row of the song list"""
+        if self.search_results is None:
+            self.select_song(index)
+            return
+
+        # Search results come from the whole library, so play from "All Songs"
+        track_id = self.playlist.available_ids[self.search_results[index]]
+        self._clear_search()
+        if self.playlist.current_playlist_index != 0:
+            self.playlist_selector_var.set("All Songs")
+            self._on_playlist_selected("All Songs")
+        song_index = self.playlist.playlists[0].index_of_track(track_id)
+        if song_index is not None:
+            self.select_song(song_index)
+
+    def _on_search_changed(self, event=None):
+        """Show the library songs matching the search box as the user types"""
+        query = self.search_entry.get()
+        if not query.strip():
+            if self.search_results is not None:
+                self.search_results = None
+                self._create_playlist_items()
+            return
+
+        self.search_results = self.playlist.search_songs(query)
+        self.canvas.yview_moveto(0)
+        self._create_playlist_items()
+
+    def _clear_search(self):
+        """Empty the search box and go back to the current playlist"""
+        if self.search_entry:
+            self.search_entry.delete(0, "end")
+        if self.search_results is not None:
+            self.search_results = None
+            self._create_playlist_items()
 
     def _show_create_playlist_dialog(self):
         """Show dialog to create a new playlist"""
@@ -1544,18 +2337,14 @@ class MusicPlayer:
         song_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=song_listbox.yview)
 
-        # Populate the listbox with available songs
+        # Populate the listbox with available songs that aren't in the playlist,
+        # remembering which available song each row is
+        current_playlist = self.playlist.playlists[self.playlist.current_playlist_index]
+        listed_songs = []
         for idx, song_name in enumerate(self.playlist.available_song_names):
-            song_path = self.playlist.available_songs[idx]
-            # For custom playlists, store only the filename, not the full path
-            song_path = os.path.basename(song_path)
-            if (
-                song_path
-                not in self.playlist.playlists[
-                    self.playlist.current_playlist_index
-                ].song_paths
-            ):
+            if self.playlist.available_songs[idx] not in current_playlist:
                 song_listbox.insert("end", song_name)
+                listed_songs.append(idx)
 
         # Buttons frame
         btn_frame = d3.Frame(
@@ -1579,13 +2368,12 @@ class MusicPlayer:
 
             songs_added = 0
             for i in selected_indices:
-                if self.playlist.add_song_to_current_playlist(
-                    self.playlist.available_song_names.index(song_listbox.get(i))
-                ):
+                if self.playlist.add_song_to_current_playlist(listed_songs[i]):
                     songs_added += 1
 
             if songs_added > 0:
-                self.playlist.save_playlists()
+                # The service carries on through the longer list
+                self.service.set_songs(self.playlist.playlist_files)
                 self._create_playlist_items()
                 cancel_dialog()
                 self._show_notification(
@@ -1631,12 +2419,13 @@ class MusicPlayer:
             return
 
         # Check if a song is currently selected
-        if self.state.current_song_index is None or not self.playlist.has_songs():
+        index = self.service.snapshot.current_song_index
+        if index is None or not self.playlist.has_songs():
             self._show_notification("No song selected", notification_type="info")
             return
 
         # Get current song name
-        song_name = self.playlist.get_current_song_name(self.state.current_song_index)
+        song_name = self.playlist.get_current_song_name(index)
 
         if self.dialog_active:
             return
@@ -1698,34 +2487,30 @@ class MusicPlayer:
 
         def remove_song():
             # Stop playback if this song is playing
-            was_playing = self.state.is_playing
+            was_playing = self.service.snapshot.is_playing
             if was_playing:
-                pygame.mixer.music.stop()
-                self.state.is_playing = False
-                self.state.song_paused = False
+                self.service.stop()
 
             # Remove the song
-            if self.playlist.remove_song_from_current_playlist(
-                self.state.current_song_index
-            ):
+            if self.playlist.remove_song_from_current_playlist(index):
+                playlist_files = self.playlist.playlist_files
                 # Reset state if no songs left
                 if not self.playlist.has_songs():
-                    self.state.current_song_index = 0
-                    self.state.current_song_length = 0
-                    self.reset_state()
+                    new_index = 0
+                    self.service.select(playlist_files, new_index)
+                    self.reset_state(new_index)
                 # Handle index if we removed the last song
-                elif self.state.current_song_index >= len(self.playlist.playlist_files):
-                    self.state.current_song_index = (
-                        len(self.playlist.playlist_files) - 1
-                    )
+                else:
+                    new_index = min(index, len(playlist_files) - 1)
+                    self.service.set_songs(playlist_files, new_index)
 
                 # Update UI
                 self._create_playlist_items()
-                self._update_song_display()
+                self._update_song_display(new_index)
 
                 # Resume playback if needed
                 if was_playing and self.playlist.has_songs():
-                    self._start_current_song()
+                    self._start_current_song(new_index)
                     self._update_playing_state_ui()
 
                 cancel_dialog()
@@ -1755,6 +2540,24 @@ class MusicPlayer:
             width=8,
         ).pack(side="right")
 
+    def suspend(self):
+        """Release scroll bindings while the page is hidden; playback carries on"""
+        self._unbind_scroll_events()
+
+    def resume(self):
+        """Bring the UI back in sync with playback when the page is shown"""
+        if not self.ui_built:
+            return
+        if self.canvas:
+            self._bind_scroll_events()
+        self._update_song_display()
+        playback = self.service.snapshot
+        self.pause_play.configure(
+            text=self.ICON_PAUSE if playback.is_playing else self.ICON_PLAY
+        )
+        if playback.is_playing:
+            self._update_progress()
+
     def _remove_current_song(self):
         """Remove the currently selected song from the playlist - replaced by confirmation dialog"""
         self._confirm_remove_song()
@@ -1773,6 +2576,18 @@ def create(page, root):
     _music_player_instance.create_widgets(page)
 
 
+def suspend(page, root):
+    """Pause UI updates while the player page is hidden"""
+    if _music_player_instance:
+        _music_player_instance.suspend()
+
+
+def resume(page, root):
+    """Resume UI updates when the player page is shown again"""
+    if _music_player_instance:
+        _music_player_instance.resume()
+
+
 def destroy(page, root):
     """Clean up the music player instance"""
     global _music_player_instance
@@ -1780,9 +2595,11 @@ def destroy(page, root):
         # Clean up scroll bindings first
         _music_player_instance._unbind_scroll_events()
 
-        # Stop timers
-        _music_player_instance._stop_song_end_checker()
+        # Stop timers; playback carries on in the service
         _music_player_instance._stop_progress_updates()
+        _music_player_instance._stop_library_updates()
+        _music_player_instance._stop_loudness_analysis()
+        _music_player_instance._stop_artwork_updates()
 
         # Cancel any notification timer
         if _music_player_instance.notification_timer:
@@ -1791,11 +2608,6 @@ def destroy(page, root):
             )
             _music_player_instance.notification_timer = None
 
-        # Stop audio if needed
-        if pygame.mixer.get_init():
-            pygame.mixer.music.stop()
-            pygame.mixer.quit()
-
         # Close any open dialogs
         if (
             _music_player_instance.dialog_frame
@@ -1810,10 +2622,11 @@ def destroy(page, root):
 def is_running():
     """Check if the music player is currently playing music.
 
+    Reads the playback service, so this works with or without the player page.
+
     Returns:
         bool: True if music is playing, False otherwise
     """
-    global _music_player_instance
-    if _music_player_instance:
-        return _music_player_instance.state.is_playing
+    if _playback_service:
+        return _playback_service.snapshot.is_playing
     return False
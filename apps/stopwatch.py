@@ -1,6 +1,6 @@
 import tkinter as d3
-import time
 from config import config
+from timing import timer
 
 
 class StopwatchApp:
@@ -11,12 +11,15 @@ class StopwatchApp:
         self.rst = None
         self.root = None
         self.running = False
+        self.update_task = None
         self.minutes = 0
         self.seconds = 0
         self.hundredths = 0
-        self.start_time = 0
-        self.elapsed_time = 0
-        self.paused_time = 0
+        self.timer = timer()
+        self.elapsed_ns = 0
+        # Text currently shown, so unchanged labels aren't reconfigured
+        self.shown_time = None
+        self.shown_hundredths = None
 
         # Fonts using config
         self.font_for_clock = (
@@ -40,62 +43,55 @@ class StopwatchApp:
         was_running = self.running
 
         # Reset time values
-        self.start_time = time.time()
-        self.elapsed_time = 0
-        self.paused_time = 0
+        self.timer.reset()
+        self.elapsed_ns = 0
         self.minutes = 0
         self.seconds = 0
         self.hundredths = 0
 
         # Update display
-        time_string = "00:00"
-        self.time_lbl.configure(text=time_string)
-        hundredths_string = ".00"
-        self.hundredths_lbl.configure(text=hundredths_string)
+        self.render("00:00", ".00")
 
-        # If it was running, keep it running with the new start time
+        # If it was running, keep it running from zero
         if was_running:
+            self.timer.start()
             self.update()
 
     def start_stop(self):
         self.running = not self.running
         if self.running:
             self.start.configure(text="Stop")
-            self.start_time = time.time() - self.paused_time
+            self.timer.start()
             self.update()
+            self.update_task.resume()
         else:
             self.start.configure(text="Start")
-            self.paused_time = time.time() - self.start_time
+            self.timer.pause()
+            self.update_task.pause()
 
     def update_time(self):
         if not self.page.page_frame.winfo_exists():
             return
-        total_seconds = int(self.elapsed_time)
+        total_seconds, self.hundredths = divmod(self.elapsed_ns // 10_000_000, 100)
         self.minutes, self.seconds = divmod(total_seconds, 60)
-        self.hundredths = int((self.elapsed_time - total_seconds) * 100)
-
-        middle = ":0" if self.seconds < 10 else ":"
-        if self.minutes < 10:
-            minut = "00" if self.minutes == 0 else f"0{str(self.minutes)}"
-        else:
-            minut = str(self.minutes)
-
-        if self.hundredths < 10:
-            hundredt = "00" if self.hundredths == 0 else f"0{self.hundredths}"
-        else:
-            hundredt = str(self.hundredths)
 
-        time_string = str(minut) + middle + str(self.seconds)
-        hundredths_string = f".{str(hundredt)}"
+        self.render(
+            f"{self.minutes:02d}:{self.seconds:02d}", f".{self.hundredths:02d}"
+        )
 
-        self.time_lbl.configure(text=time_string)
-        self.hundredths_lbl.configure(text=hundredths_string)
+    def render(self, time_string, hundredths_string):
+        """Show the given text, skipping labels whose text hasn't changed."""
+        if time_string != self.shown_time:
+            self.time_lbl.configure(text=time_string)
+            self.shown_time = time_string
+        if hundredths_string != self.shown_hundredths:
+            self.hundredths_lbl.configure(text=hundredths_string)
+            self.shown_hundredths = hundredths_string
 
     def update(self):
         if self.running:
-            self.elapsed_time = time.time() - self.start_time
+            self.elapsed_ns = self.timer.elapsed_ns()
             self.update_time()
-            self.root.after(10, self.update)
 
     def create_widgets(self, page):
         self.page = page
@@ -129,6 +125,8 @@ class StopwatchApp:
         )
         self.hundredths_lbl.place(relx=0.78, rely=0.424, width=45, relheight=0.2)
         self.hundredths_lbl.configure(font=self.font_for_other)
+        self.shown_time = time_string
+        self.shown_hundredths = hundredths_string
 
         self.update_time()
         self.start = d3.Button(
@@ -155,7 +153,20 @@ class StopwatchApp:
             relx=0.25, rely=0.9, relheight=0.2, relwidth=0.3, anchor="center"
         )
 
+        # Only ticks while running; the scheduler also skips it while the page
+        # is hidden, and the start time keeps the count going meanwhile
+        self.update_task = page.schedule(
+            round(1000 / config["clock"].STOPWATCH_FRAME_RATE), self.update
+        )
+        if self.running:
+            self.update()
+        else:
+            self.update_task.pause()
+
     def destroy_app(self, page):
+        if self.update_task:
+            self.update_task.cancel()
+            self.update_task = None
         page.page_frame.destroy()
 
 
@@ -22,8 +22,8 @@ class AnimationConfig:
     """Animation timing configuration."""
 
     TWEEN_DURATION = 300  # milliseconds
-    TWEEN_CHECK_INTERVAL = 20  # milliseconds
-    TWEEN_STEP_SIZE = 15  # pixels
+    TWEEN_FRAME_RATE = 60  # frames per second
+    TWEEN_EASING = "ease_out"  # see de333r.easings
 
     NOTIFICATION_DURATION = 500  # milliseconds
 
@@ -37,6 +37,10 @@ class AppConfig:
         "stopwatch",
     ]  # Apps that should appear first
     RESTRICTED_FILES = ["__init__.py", "__pycache__"]
+    APPS_MANIFEST_FILE = "apps_manifest.json"  # None disables the cache
+    APPS_WARM_UP = True  # Import neighbouring apps while the UI is idle
+    APPS_WARM_UP_DELAY = 500  # milliseconds after a page is shown
+    PAGE_CACHE_SIZE = 3  # Hidden app pages kept alive; 0 destroys on leave
 
 
 class UIConfig:
@@ -62,8 +66,10 @@ class ClockConfig:
     CLOCK_MAIN_FONT_SIZE = 60
     CLOCK_SECONDARY_FONT_SIZE = 20
     CLOCK_TERTIARY_FONT_SIZE = 12
-    CLOCK_UPDATE_INTERVAL = 250  # milliseconds
-    CLOCK_STARTUP_DELAY = 50  # milliseconds
+    CLOCK_UPDATE_INTERVAL = 1000  # milliseconds, aligned to the wall clock
+    CLOCK_LOW_POWER = False  # hide seconds and only wake once a minute
+    CLOCK_LOW_POWER_INTERVAL = 60000  # milliseconds, aligned to the wall clock
+    STOPWATCH_FRAME_RATE = 30  # redraws per second while running
 
 
 class BlockoidConfig:
@@ -82,6 +88,33 @@ class BlockoidConfig:
     CLOUD_COLOR = "dark red"
 
 
+class MusicConfig:
+    """Music player specific settings."""
+
+    # Song library index, rebuilt incrementally by a background scanner
+    LIBRARY_CACHE_FILE = "apps/_music_player/library_cache.json"
+    LIBRARY_BATCH_SIZE = 25  # songs handed to the UI per update
+    LIBRARY_POLL_INTERVAL = 100  # milliseconds
+
+    # MP3 seek tables, built in the background the first time a song plays
+    SEEK_INDEX_DIR = "apps/_music_player/seek_index"
+    SEEK_INDEX_INTERVAL = 250  # milliseconds between seek points
+
+    # Loudness normalization, measured in worker processes after each scan
+    LOUDNESS_TARGET_LUFS = -18.0  # ReplayGain 2.0 reference level
+    LOUDNESS_WORKERS = 2
+    LOUDNESS_POLL_INTERVAL = 500  # milliseconds
+
+    # Visualizer analyses, worked out once per song and kept on disk
+    VISUALIZER_CACHE_DIR = "apps/_music_player/visualizer_cache"
+    VISUALIZER_CACHE_FILES = 1000  # analyses kept on disk
+
+    # Album art thumbnails, scaled down once and kept on disk
+    ARTWORK_CACHE_DIR = "apps/_music_player/art_cache"
+    ARTWORK_CACHE_FILES = 1000  # thumbnails kept on disk
+    ARTWORK_MEMORY_BUDGET = 4 * 1024 * 1024  # bytes of Tk images kept in memory
+
+
 # Create a single configuration instance
 config = {
     "window": WindowConfig,
@@ -89,4 +122,5 @@ config = {
     "app": AppConfig,
     "ui": UIConfig,
     "clock": ClockConfig,
+    "music": MusicConfig,
 }
@@ -1,3 +1,4 @@
+import time
 import tkinter as d3
 from config import config
 
@@ -95,6 +96,292 @@ class main:
         return root, bg_root, switch_btn_l, switch_btn_r, back_btn, home_btn, apps_btn
 
 
+def ease_linear(progress):
+    """Move at a constant speed."""
+    return progress
+
+
+def ease_out(progress):
+    """Start fast and decelerate into place (cubic)."""
+    return 1 - (1 - progress) ** 3
+
+
+def ease_in_out(progress):
+    """Accelerate, then decelerate (cubic)."""
+    if progress < 0.5:
+        return 4 * progress**3
+    return 1 - (-2 * progress + 2) ** 3 / 2
+
+
+easings = {
+    "linear": ease_linear,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+}
+
+
+class animation:
+    """Time-based animation driven by the Tk event loop.
+
+    Progress is computed from the monotonic clock on every frame, so the
+    animation always takes ``duration`` milliseconds. A slow frame makes the
+    next one jump further ahead instead of stretching the animation.
+    """
+
+    def __init__(
+        self,
+        root,
+        duration,
+        on_frame,
+        on_complete=None,
+        easing=None,
+        frame_rate=None,
+    ):
+        """Create an animation.
+
+        Args:
+            root: Tk widget used to schedule frames
+            duration (int): Length of the animation in milliseconds
+            on_frame: Called with the eased progress (0.0 to 1.0) each frame
+            on_complete: Called once after the final frame
+            easing: Easing function or name from ``easings``
+            frame_rate (int): Target frames per second
+        """
+        anim_config = config["animation"]
+        if easing is None:
+            easing = anim_config.TWEEN_EASING
+        if isinstance(easing, str):
+            easing = easings[easing]
+
+        self.root = root
+        self.duration = duration
+        self.on_frame = on_frame
+        self.on_complete = on_complete
+        self.easing = easing
+        self.frame_interval = 1000 / (frame_rate or anim_config.TWEEN_FRAME_RATE)
+        self.start_time = None
+        self.after_id = None
+        self.finished = False
+
+    def start(self):
+        """Start the animation; the first frame is drawn one frame from now."""
+        self.start_time = time.monotonic()
+        self.after_id = self.root.after(int(self.frame_interval), self._frame)
+        return self
+
+    def cancel(self):
+        """Stop the animation without calling ``on_complete``."""
+        if self.after_id:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _frame(self):
+        """Draw the frame for the current time and schedule the next one."""
+        elapsed = (time.monotonic() - self.start_time) * 1000
+        if self.duration <= 0 or elapsed >= self.duration:
+            self.after_id = None
+            self.on_frame(1.0)
+            self.finished = True
+            if self.on_complete:
+                self.on_complete()
+            return
+
+        self.on_frame(self.easing(elapsed / self.duration))
+
+        # Wait for the next frame boundary; frames we were too late for are
+        # dropped rather than drawn
+        delay = self.frame_interval - (elapsed % self.frame_interval)
+        self.after_id = self.root.after(max(1, int(delay)), self._frame)
+
+
+# Tasks due within this many seconds of a wakeup run in the same batch
+_TICK_SLACK = 0.002
+
+# Aligned groups wake this many seconds after the wall clock boundary, so the
+# clock they read has already rolled over
+_ALIGN_MARGIN = 0.005
+
+
+class task:
+    """Periodic callback registered with a ``scheduler``."""
+
+    def __init__(self, scheduler, period, callback, priority=0, page=None):
+        self.scheduler = scheduler
+        self.period = period
+        self.callback = callback
+        self.priority = priority
+        self.page = page
+        self.paused = False
+        self.cancelled = False
+
+    @property
+    def active(self):
+        """Whether the task should run on its next tick."""
+        if self.paused or self.cancelled:
+            return False
+        return self.page is None or self.page.visible
+
+    def pause(self):
+        """Skip the task until ``resume`` is called."""
+        self.paused = True
+
+    def resume(self):
+        """Run the task again from its next tick."""
+        if self.paused:
+            self.paused = False
+            self.scheduler.wake()
+
+    def cancel(self):
+        """Remove the task from its scheduler for good."""
+        if not self.cancelled:
+            self.cancelled = True
+            self.scheduler.remove(self)
+
+
+class scheduler:
+    """Runs every periodic task in the shell from a single ``after`` loop.
+
+    Tasks with the same period share one group and always wake up together.
+    Tasks belonging to a hidden page are skipped, and when nothing is active
+    the loop stops scheduling wakeups altogether.
+    """
+
+    def __init__(self, root):
+        """Create a scheduler.
+
+        Args:
+            root: Tk root used to schedule wakeups
+        """
+        self.root = root
+        # period (ms) -> {"due": monotonic time, "aligned": bool, "tasks": [...]}
+        self.groups = {}
+        self.after_id = None
+        self.wakeup = None
+
+    def every(self, period, callback, priority=0, page=None, align=False):
+        """Call ``callback`` every ``period`` milliseconds.
+
+        Args:
+            period (int): Interval between calls in milliseconds
+            callback: Function called with no arguments
+            priority (int): Higher priority tasks run first within a batch
+            page: Page the task belongs to; it is paused while the page is
+                hidden. None keeps it running in the background.
+            align (bool): Wake on multiples of ``period`` on the wall clock,
+                e.g. on every whole second for a 1000 ms period. This moves
+                the whole group, so other tasks with the same period follow.
+
+        Returns:
+            task: Handle used to pause, resume or cancel the task
+        """
+        new_task = task(self, period, callback, priority, page)
+        group = self.groups.get(period)
+        if group is None:
+            group = {
+                "due": time.monotonic() + period / 1000,
+                "aligned": False,
+                "tasks": [],
+            }
+            self.groups[period] = group
+        if align and not group["aligned"]:
+            group["aligned"] = True
+            group["due"] = self._next_boundary(period, time.monotonic())
+        group["tasks"].append(new_task)
+        group["tasks"].sort(key=lambda t: -t.priority)
+        self.wake()
+        return new_task
+
+    def remove(self, old_task):
+        """Forget a task and stop waking up for it."""
+        group = self.groups.get(old_task.period)
+        if group and old_task in group["tasks"]:
+            group["tasks"].remove(old_task)
+            if not group["tasks"]:
+                del self.groups[old_task.period]
+        self.wake()
+
+    def wake(self):
+        """Schedule the next wakeup for the earliest group with active tasks."""
+        due_times = [
+            group["due"]
+            for group in self.groups.values()
+            if any(t.active for t in group["tasks"])
+        ]
+        if not due_times:
+            self._cancel_wakeup()
+            return
+
+        next_due = min(due_times)
+        if self.after_id is not None and self.wakeup <= next_due:
+            return
+
+        self._cancel_wakeup()
+        delay = max(0, next_due - time.monotonic()) * 1000
+        self.wakeup = next_due
+        self.after_id = self.root.after(max(1, round(delay)), self._tick)
+
+    @staticmethod
+    def _next_boundary(period, now):
+        """Monotonic time of the next wall clock multiple of ``period`` ms."""
+        wall_ms = time.time() * 1000
+        return now + (period - wall_ms % period) / 1000 + _ALIGN_MARGIN
+
+    def _cancel_wakeup(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+            self.wakeup = None
+
+    def _tick(self):
+        """Run every due task in priority order, then sleep until the next."""
+        self.after_id = None
+        self.wakeup = None
+        now = time.monotonic()
+
+        batch = []
+        for period, group in self.groups.items():
+            if group["due"] > now + _TICK_SLACK:
+                continue
+            batch.extend(t for t in group["tasks"] if t.active)
+            if group["aligned"]:
+                # Re-read the wall clock each time so the group can't drift
+                group["due"] = self._next_boundary(period, now)
+                continue
+            # Move to the next boundary after now, skipping any we missed
+            interval = period / 1000
+            missed = int((now - group["due"]) // interval) if now > group["due"] else 0
+            group["due"] += interval * (missed + 1)
+
+        batch.sort(key=lambda t: -t.priority)
+        for due_task in batch:
+            # An earlier callback in the batch may have cancelled this one
+            if due_task.active:
+                try:
+                    due_task.callback()
+                except Exception as e:
+                    print(f"Error in scheduled task: {e}")
+
+        self.wake()
+
+
+# One scheduler per Tk root, created on first use
+_schedulers = {}
+
+
+def get_scheduler(root):
+    """Get the shared scheduler for a Tk root.
+
+    Args:
+        root: Tk root the scheduler runs on
+
+    Returns:
+        scheduler: The scheduler for ``root``
+    """
+    if root not in _schedulers:
+        _schedulers[root] = scheduler(root)
+    return _schedulers[root]
+
+
 class page:
     def create(self):
         """Create a page frame."""
@@ -105,44 +392,80 @@ class page:
             height=window_config.FRAME_HEIGHT,
         )
 
-    def tween(self, frame_2, time, direction=1):
+    def tween(self, frame_2, time, direction=1, on_complete=None, easing=None):
         """Animate transition between pages.
 
         Args:
             frame_2: The page to transition to
             time (int): Total duration of the animation in milliseconds
             direction (int): 1 for forward, -1 for backward
+            on_complete: Called once when the transition has finished
+            easing: Easing function or name from ``easings``
+
+        Returns:
+            animation: The running animation
         """
-        anim_config = config["animation"]
         window_config = config["window"]
 
         self.finished = False
-        bounding_x = window_config.FRAME_WIDTH
-        frame_2.page_frame.place(x=0 + (direction * bounding_x), y=0)
+        self.bounding_x = window_config.FRAME_WIDTH
+        self.curr_x = self.bounding_x
+        frame_2.page_frame.place(x=direction * self.bounding_x, y=0)
+        self.page_frame.pack_forget()
+        self.page_frame.place(x=0, y=0)
 
-        def looper(self):
-            self.curr_x -= anim_config.TWEEN_STEP_SIZE
+        def on_frame(progress):
+            self.curr_x = round(self.bounding_x * (1 - progress))
             frame_2.page_frame.place(x=direction * self.curr_x, y=0)
             self.page_frame.place(x=direction * (self.curr_x - self.bounding_x), y=0)
-            if self.curr_x > 0:
-                self.true_root.update()
-                self.true_root.after(
-                    int(time / self.bounding_x), lambda self=self: looper(self)
-                )
-            else:
-                self.finished = True
-
-        self.bounding_x = bounding_x
-        self.curr_x = bounding_x
-        self.true_root.after(int(time / bounding_x), lambda self=self: looper(self))
-        self.page_frame.pack_forget()
+
+        def finish():
+            self.finished = True
+            if on_complete:
+                on_complete()
+
+        self.animation = animation(
+            self.true_root, time, on_frame, on_complete=finish, easing=easing
+        )
+        return self.animation.start()
 
     def __init__(self, root, true_root):
         self.root = root
         self.true_root = true_root
         self.finished = False
+        self.visible = True
         self.create()
 
+    def schedule(self, period, callback, priority=0, background=False, align=False):
+        """Run a callback periodically on the shared scheduler.
+
+        Args:
+            period (int): Interval between calls in milliseconds
+            callback: Function called with no arguments
+            priority (int): Higher priority tasks run first within a batch
+            background (bool): Keep running while the page is hidden
+            align (bool): Wake on wall clock multiples of ``period``
+
+        Returns:
+            task: Handle used to pause, resume or cancel the task
+        """
+        return get_scheduler(self.true_root).every(
+            period,
+            callback,
+            priority,
+            page=None if background else self,
+            align=align,
+        )
+
+    def show(self):
+        """Mark the page visible so its scheduled tasks run again."""
+        self.visible = True
+        get_scheduler(self.true_root).wake()
+
+    def hide(self):
+        """Mark the page hidden; its scheduled tasks are skipped until shown."""
+        self.visible = False
+
     def create_notification(self, text, type="info"):
         """Create a notification frame.
 
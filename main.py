@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import de333r as titan
 import apper
 from config import config
@@ -23,8 +25,12 @@ class TitanApp:
         # Track active popup
         self.active_popup = None
 
+        # Hidden pages kept alive for quick return, least recently used first
+        self.page_cache = OrderedDict()
+
         # Configuration
         self.anim_config = config["animation"]
+        self.page_cache_size = config["app"].PAGE_CACHE_SIZE
 
     def _disable_switches(self):
         """Disable navigation buttons during transition."""
@@ -52,53 +58,78 @@ class TitanApp:
         return self.current_page + direction
 
     def _create_next_page_and_app(self, next_index):
-        """Create the next page and app instances."""
-        next_page = titan.page(self.bg_root, self.root)
+        """Create the next page and app instances, reusing a cached page if any."""
         app = self.list_apps[next_index]
+        if app in self.page_cache:
+            next_page, next_app = self.page_cache.pop(app)
+            next_page.show()
+            if hasattr(next_app.app, "resume"):
+                next_app.app.resume(next_page, self.root)
+            return next_page, next_app
+
+        next_page = titan.page(self.bg_root, self.root)
         next_app = apper.app(next_page, app, self.root)
         return next_page, next_app
 
+    def _cache_page(self, page, app):
+        """Hide a page and keep it alive, destroying the least recently used."""
+        page.page_frame.place_forget()
+        page.hide()
+        if hasattr(app.app, "suspend"):
+            app.app.suspend(page, self.root)
+        self.page_cache[app.code] = (page, app)
+
+        while len(self.page_cache) > self.page_cache_size:
+            _, (old_page, old_app) = self.page_cache.popitem(last=False)
+            old_app.app.destroy(old_page, self.root)
+
     def _transition_complete(self, next_app, next_page, next_index):
         """Handle completion of page transition."""
         self.current_page = next_index
-        self.loaded_app.app.destroy(self.loaded_page, self.root)
+        self._cache_page(self.loaded_page, self.loaded_app)
         self.loaded_page = next_page
         self.loaded_app = next_app
         self._enable_switches()
+        self._warm_up_neighbours()
 
-    def _check_tween_complete(self, next_app, next_page, next_index):
-        """Check if page transition is complete."""
-        if self.loaded_page.finished:
-            self._transition_complete(next_app, next_page, next_index)
-        else:
-            self.root.after(
-                self.anim_config.TWEEN_CHECK_INTERVAL,
-                lambda: self._check_tween_complete(next_app, next_page, next_index),
-            )
+    def _warm_up_neighbours(self):
+        """Import the apps on either side of the current one ahead of time."""
+        neighbours = [
+            self.list_apps[self._get_next_page_index(1)],
+            self.list_apps[self._get_next_page_index(-1)],
+        ]
+        apper.warm_up(self.root, neighbours)
 
-    def switch(self, direction):
-        """Switch to the next or previous app.
+    def _transition_to(self, next_index, direction):
+        """Slide from the current page to the app at next_index.
 
         Args:
-            direction (int): 1 for forward, -1 for backward
+            next_index (int): Position of the target app in list_apps
+            direction (int): 1 to slide in from the right, -1 from the left
         """
-        if self.active_popup:
-            self.active_popup.close()
-            self.active_popup = None
         self._disable_switches()
-        next_index = self._get_next_page_index(direction)
         next_page, next_app = self._create_next_page_and_app(next_index)
 
-        # Start the transition animation
+        # The tween reports back once it has finished; no polling needed
         self.loaded_page.tween(
-            next_page, self.anim_config.TWEEN_DURATION, direction=direction
+            next_page,
+            self.anim_config.TWEEN_DURATION,
+            direction=direction,
+            on_complete=lambda: self._transition_complete(
+                next_app, next_page, next_index
+            ),
         )
 
-        # Start checking for transition completion
-        self.root.after(
-            self.anim_config.TWEEN_CHECK_INTERVAL,
-            lambda: self._check_tween_complete(next_app, next_page, next_index),
-        )
+    def switch(self, direction):
+        """Switch to the next or previous app.
+
+        Args:
+            direction (int): 1 for forward, -1 for backward
+        """
+        if self.active_popup:
+            self.active_popup.close()
+            self.active_popup = None
+        self._transition_to(self._get_next_page_index(direction), direction)
 
     def go_home(self):
         """Go to the first app in the list or close popup if open."""
@@ -106,23 +137,9 @@ class TitanApp:
             self.active_popup.close()
             self.active_popup = None
         elif self.current_page != 0:
-            self._disable_switches()
-            next_index = 0
-            next_page, next_app = self._create_next_page_and_app(next_index)
-
             # Direction is forward if currently at the end, otherwise backward
             direction = 1 if self.current_page == len(self.list_apps) - 1 else -1
-
-            # Start the transition animation
-            self.loaded_page.tween(
-                next_page, self.anim_config.TWEEN_DURATION, direction=direction
-            )
-
-            # Start checking for transition completion
-            self.root.after(
-                self.anim_config.TWEEN_CHECK_INTERVAL,
-                lambda: self._check_tween_complete(next_app, next_page, next_index),
-            )
+            self._transition_to(0, direction)
 
     def send_back_signal(self):
         """Send a back signal to the current app or close popup if open."""
@@ -141,10 +158,14 @@ class TitanApp:
             return
         self.active_popup = titan.popup(self.root, "Running Apps")
 
-        # Get running apps (those with active loops)
+        # Get running apps (those with active loops). Only apps whose manifest
+        # entry exports is_running are asked, and apps that were never
+        # imported can't be running, so none are imported just to ask.
         running_apps = []
         for app_name in self.list_apps:
-            app_module = apper.get_app_module(app_name)
+            if not apper.has_hook(app_name, "is_running"):
+                continue
+            app_module = apper.get_app_module(app_name, load=False)
             if hasattr(app_module, "is_running") and app_module.is_running():
                 running_apps.append(app_name)
 
@@ -164,37 +185,22 @@ class TitanApp:
             self.active_popup.close()
             self.active_popup = None
 
-        if app_name in self.list_apps:
-            target_index = self.list_apps.index(app_name)
-            if target_index != self.current_page:
-                self._disable_switches()
-                next_page, next_app = self._create_next_page_and_app(target_index)
-
-                # Determine direction based on indices
-                direction = (
-                    1
-                    if (
-                        target_index > self.current_page
-                        or (
-                            self.current_page == len(self.list_apps) - 1
-                            and target_index == 0
-                        )
+        # list_apps is apper's list, so apper's lookup table gives positions
+        target_index = apper.index(app_name)
+        if target_index is not None and target_index != self.current_page:
+            # Determine direction based on indices
+            direction = (
+                1
+                if (
+                    target_index > self.current_page
+                    or (
+                        self.current_page == len(self.list_apps) - 1
+                        and target_index == 0
                     )
-                    else -1
-                )
-
-                # Start the transition animation
-                self.loaded_page.tween(
-                    next_page, self.anim_config.TWEEN_DURATION, direction=direction
-                )
-
-                # Start checking for transition completion
-                self.root.after(
-                    self.anim_config.TWEEN_CHECK_INTERVAL,
-                    lambda: self._check_tween_complete(
-                        next_app, next_page, target_index
-                    ),
                 )
+                else -1
+            )
+            self._transition_to(target_index, direction)
 
     def run(self):
         """Initialize and run the Titan application."""
@@ -219,6 +225,7 @@ class TitanApp:
         self.loaded_app = apper.app(self.loaded_page, self.list_apps[0], self.root)
 
         self.loaded_page.page_frame.pack()
+        self._warm_up_neighbours()
 
         self.root.mainloop()
 
@@ -22,6 +22,8 @@ class Frame:
         self.place = lambda *args, **kwargs: None
         self.place_forget = lambda: None
         self.destroy = lambda: None
+        self.grid_rowconfigure = lambda *args, **kwargs: None
+        self.grid_columnconfigure = lambda *args, **kwargs: None
 
     def config(self, *args, **kwargs):
         pass
@@ -35,6 +37,7 @@ class Label:
         self.pack = lambda *args, **kwargs: None
         self.grid = lambda *args, **kwargs: None
         self.configure = lambda *args, **kwargs: None
+        self.destroy = lambda: None
 
 
 class Button:
@@ -44,6 +47,7 @@ class Button:
         self.configure = lambda *args, **kwargs: None
         self.place = lambda *args, **kwargs: None
         self.pack = lambda *args, **kwargs: None
+        self.grid = lambda *args, **kwargs: None
 
     def config(self, *args, **kwargs):
         pass
@@ -105,6 +109,9 @@ class Entry:
         self.master = master
         self.kwargs = kwargs
         self.pack = lambda *args, **kwargs: None
+        self.place = lambda *args, **kwargs: None
+        self.insert = lambda *args, **kwargs: None
+        self.delete = lambda *args, **kwargs: None
         self.focus_set = lambda: None
         self.get = lambda: ""
         self.bind = lambda *args, **kwargs: None
@@ -54,6 +54,7 @@ def test_apper_module_basic():
         APPS_DIRECTORY = "apps"
         APPS_PRIORITY_ORDER = ["calculator", "clock"]
         RESTRICTED_FILES = ["__init__.py", "__pycache__"]
+        APPS_MANIFEST_FILE = None
 
     # Create the config dictionary with our mock class
     mock_config = {"app": MockAppConfig}
@@ -250,8 +251,8 @@ def test_main_create_window_geometry():
                     apps_btn.place.assert_called()
 
 
-def test_page_tween_looper():
-    """Test the looper function within page tween animation."""
+def test_page_tween_frames_follow_elapsed_time():
+    """Test that tween positions come from elapsed time, not a fixed step."""
     with patch.dict("sys.modules", {"tkinter": mock_tk, "d3": mock_tk}):
         spec = importlib.util.spec_from_file_location("de333r", "de333r.py")
         de333r = importlib.util.module_from_spec(spec)
@@ -262,43 +263,151 @@ def test_page_tween_looper():
         true_root_mock = MagicMock()
         frame_2_mock = MagicMock()
         frame_2_mock.page_frame = MagicMock()
+        on_complete = MagicMock()
 
         # Create a page instance
         page = de333r.page(root_mock, true_root_mock)
         page.page_frame = MagicMock()
+        width = de333r.config["window"].FRAME_WIDTH
+
+        with patch.object(de333r.time, "monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 10.0
+            page.tween(
+                frame_2_mock,
+                300,
+                direction=1,
+                on_complete=on_complete,
+                easing="linear",
+            )
 
-        # Set up initial state
-        page.bounding_x = 100
-        page.curr_x = 100
+            # Get the frame callback that was passed to after
+            frame_func = true_root_mock.after.call_args[0][1]
 
-        # Mock the necessary methods
-        with patch.object(true_root_mock, "update") as mock_update:
-            with patch.object(true_root_mock, "after") as mock_after:
-                # Start the tween animation
-                page.tween(frame_2_mock, 300, direction=1)
+            # Half way through the duration the pages are half way across
+            mock_monotonic.return_value = 10.15
+            frame_func()
+            frame_2_mock.page_frame.place.assert_called_with(x=width // 2, y=0)
+            page.page_frame.place.assert_called_with(x=width // 2 - width, y=0)
+            assert not page.finished
+            on_complete.assert_not_called()
 
-                # Get the looper function that was passed to after
-                looper_func = mock_after.call_args[0][1]
+            # A late frame jumps straight to the end instead of stretching
+            mock_monotonic.return_value = 11.0
+            frame_func()
+            frame_2_mock.page_frame.place.assert_called_with(x=0, y=0)
+            assert page.finished
+            on_complete.assert_called_once()
 
-                # Simulate first iteration of looper
-                looper_func(page)
+            # One initial frame plus one follow-up, and no forced redraws
+            assert true_root_mock.after.call_count == 2
+            true_root_mock.update.assert_not_called()
 
-                # Verify frame positions were updated
-                frame_2_mock.page_frame.place.assert_called()
-                page.page_frame.place.assert_called()
 
-                # Verify curr_x was decremented
-                assert page.curr_x == 285  # 100 - TWEEN_STEP_SIZE(15)
+def test_animation_easing_and_cancel():
+    """Test easing curves and cancelling a running animation."""
+    with patch.dict("sys.modules", {"tkinter": mock_tk, "d3": mock_tk}):
+        spec = importlib.util.spec_from_file_location("de333r", "de333r.py")
+        de333r = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(de333r)
 
-                # Verify after was called for next iteration
-                mock_after.assert_called()
+        for easing in de333r.easings.values():
+            assert easing(0) == 0
+            assert easing(1) == 1
+        assert de333r.ease_out(0.5) > 0.5
 
-                # Simulate final iteration (curr_x <= 0)
-                page.curr_x = 0
-                looper_func(page)
+        root_mock = MagicMock()
+        root_mock.after.return_value = "after#1"
+        on_complete = MagicMock()
+        anim = de333r.animation(
+            root_mock, 300, MagicMock(), on_complete=on_complete, frame_rate=50
+        ).start()
+
+        root_mock.after.assert_called_once_with(20, anim._frame)
+        anim.cancel()
+        root_mock.after_cancel.assert_called_once_with("after#1")
+        on_complete.assert_not_called()
 
-                # Verify finished flag was set
-                assert page.finished
 
-                # Verify no more after calls were made
-                assert mock_after.call_count == 2  # Initial + one iteration
+def test_scheduler_batches_tasks_and_skips_hidden_pages():
+    """Test that same-period tasks share a wakeup and hidden pages are paused."""
+    with patch.dict("sys.modules", {"tkinter": mock_tk, "d3": mock_tk}):
+        spec = importlib.util.spec_from_file_location("de333r", "de333r.py")
+        de333r = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(de333r)
+
+        root_mock = MagicMock()
+        page = de333r.page(MagicMock(), root_mock)
+        calls = []
+
+        with patch.object(de333r.time, "monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 10.0
+            page.schedule(250, lambda: calls.append("low"))
+            page.schedule(250, lambda: calls.append("high"), priority=1)
+            page.schedule(1000, lambda: calls.append("background"), background=True)
+
+            # A single pending wakeup for the earliest group
+            root_mock.after.assert_called_once()
+            delay, tick = root_mock.after.call_args[0]
+            assert delay == 250
+
+            # Both 250 ms tasks run in the same batch, highest priority first
+            mock_monotonic.return_value = 10.25
+            tick()
+            assert calls == ["high", "low"]
+
+            # Hidden pages are skipped; background tasks keep running
+            page.hide()
+            calls.clear()
+            mock_monotonic.return_value = 11.0
+            root_mock.after.call_args[0][1]()
+            assert calls == ["background"]
+
+            # Nothing but the background task is left to wake up for
+            assert root_mock.after.call_args[0][0] == 1000
+
+
+def test_scheduler_task_pause_and_cancel():
+    """Test pausing, resuming and cancelling scheduled tasks."""
+    with patch.dict("sys.modules", {"tkinter": mock_tk, "d3": mock_tk}):
+        spec = importlib.util.spec_from_file_location("de333r", "de333r.py")
+        de333r = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(de333r)
+
+        root_mock = MagicMock()
+        root_mock.after.return_value = "after#1"
+        scheduler = de333r.get_scheduler(root_mock)
+        assert de333r.get_scheduler(root_mock) is scheduler
+
+        task = scheduler.every(100, MagicMock())
+        task.pause()
+        assert not task.active
+        task.resume()
+        assert task.active
+
+        task.cancel()
+        assert scheduler.groups == {}
+        root_mock.after_cancel.assert_called_with("after#1")
+
+
+def test_scheduler_aligns_groups_to_the_wall_clock():
+    """Test that aligned tasks wake just after each whole wall clock second."""
+    with patch.dict("sys.modules", {"tkinter": mock_tk, "d3": mock_tk}):
+        spec = importlib.util.spec_from_file_location("de333r", "de333r.py")
+        de333r = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(de333r)
+
+        root_mock = MagicMock()
+        scheduler = de333r.scheduler(root_mock)
+
+        with patch.object(de333r.time, "monotonic", return_value=50.0), patch.object(
+            de333r.time, "time", return_value=1000.3
+        ):
+            scheduler.every(1000, MagicMock(), align=True)
+            # 700 ms to the next whole second, plus a small margin
+            assert root_mock.after.call_args[0][0] == 705
+
+        with patch.object(de333r.time, "monotonic", return_value=50.705), patch.object(
+            de333r.time, "time", return_value=1001.005
+        ):
+            root_mock.after.call_args[0][1]()
+            assert root_mock.after.call_args[0][0] == 1000
@@ -0,0 +1,695 @@
+import json
+import math
+import os
+import struct
+import time
+import wave
+from unittest.mock import MagicMock, patch
+
+from apps._music_player import probe
+from apps._music_player.artwork import ArtworkCache, ImageCache, extract_art
+from apps._music_player.library import SongLibrary, read_id3v1_tags
+from apps._music_player.loudness import LoudnessAnalyzer, integrated_loudness
+from apps._music_player.playlist_store import PlaylistStore
+from apps._music_player.search import SongSearchIndex
+from apps._music_player.seek_index import SeekIndex, TrackReader, build_seek_table
+from apps._music_player.visualizer import (
+    SpectrumView,
+    TrackAnalysis,
+    TrackAnalyzer,
+    analyze_blocks,
+    analyze_track,
+    read_song_blocks,
+)
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, stereo: 417-byte frames
+_MP3_HEADER = b"\xff\xfb\x90\x00"
+_MP3_FRAME_LENGTH = 417
+
+
+def _id3v1(title, artist="", album=""):
+    """Build a 128-byte ID3v1 tag."""
+    return (
+        b"TAG"
+        + title.encode("latin-1").ljust(30, b"\0")
+        + artist.encode("latin-1").ljust(30, b"\0")
+        + album.encode("latin-1").ljust(30, b"\0")
+        + b"\0" * 35
+    )
+
+
+def _wait_for_scan(library, timeout=5):
+    """Poll the library like the UI does until the scan has finished."""
+    changed = False
+    deadline = time.monotonic() + timeout
+    while library.scanning and time.monotonic() < deadline:
+        changed = library.poll() or changed
+        time.sleep(0.01)
+    assert not library.scanning
+    return changed
+
+
+def test_scan_indexes_songs_in_batches(tmp_path):
+    """Test that the scanner describes every song and hands them over in batches."""
+    songs = tmp_path / "songs"
+    songs.mkdir()
+    for name in ("b.mp3", "a.wav", "c.mp3"):
+        (songs / name).write_bytes(b"\0" * 4000)
+    (songs / "notes.txt").write_text("not a song")
+
+    library = SongLibrary(
+        str(songs), str(tmp_path / "cache.json"), probe=lambda path: 1000, batch_size=2
+    )
+    assert library.load_cache() == []
+    assert library.start_scan()
+    assert not library.start_scan()  # Already scanning
+
+    assert _wait_for_scan(library)
+    assert [os.path.basename(path) for path in library.paths()] == [
+        "a.wav",
+        "b.mp3",
+        "c.mp3",
+    ]
+    entry = library.entries[os.path.join(str(songs), "a.wav")]
+    assert entry["duration_ms"] == 1000
+    assert entry["bitrate"] == 32  # 4000 bytes over one second
+    assert library.get_duration_ms(entry["path"]) == 1000
+
+
+def test_rescan_only_probes_changed_files(tmp_path):
+    """Test that the on-disk cache is reused for files that haven't changed."""
+    songs = tmp_path / "songs"
+    songs.mkdir()
+    (songs / "keep.mp3").write_bytes(b"\0" * 100)
+    (songs / "gone.mp3").write_bytes(b"\0" * 100)
+    cache_file = str(tmp_path / "cache.json")
+
+    library = SongLibrary(str(songs), cache_file, probe=lambda path: 2000)
+    library.start_scan()
+    _wait_for_scan(library)
+
+    (songs / "gone.mp3").unlink()
+    (songs / "new.mp3").write_bytes(b"\0" * 100)
+
+    probed = []
+    library = SongLibrary(
+        str(songs), cache_file, probe=lambda path: probed.append(path) or 3000
+    )
+    assert len(library.load_cache()) == 2
+    library.start_scan()
+    assert _wait_for_scan(library)
+
+    assert probed == [os.path.join(str(songs), "new.mp3")]
+    assert [os.path.basename(path) for path in library.paths()] == [
+        "keep.mp3",
+        "new.mp3",
+    ]
+
+
+def test_read_id3v1_tags(tmp_path):
+    """Test reading title, artist and album from an ID3v1 tag."""
+    song = tmp_path / "song.mp3"
+    song.write_bytes(b"\xff" * 500 + _id3v1("Title", "Artist"))
+    assert read_id3v1_tags(str(song)) == {"title": "Title", "artist": "Artist"}
+
+    untagged = tmp_path / "untagged.mp3"
+    untagged.write_bytes(b"\xff" * 500)
+    assert read_id3v1_tags(str(untagged)) == {}
+
+
+def _mp3_frames(count, first_frame=None):
+    """Build ``count`` silent CBR frames, optionally replacing the first one."""
+    frame = _MP3_HEADER + b"\0" * (_MP3_FRAME_LENGTH - 4)
+    frames = [frame] * count
+    if first_frame is not None:
+        frames[0] = first_frame.ljust(_MP3_FRAME_LENGTH, b"\0")
+    return b"".join(frames)
+
+
+def test_probe_wav_duration(tmp_path):
+    """Test reading a WAV file's duration from its RIFF header."""
+    song = tmp_path / "song.wav"
+    with wave.open(str(song), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b"\0" * 4 * 12000)  # 1.5 seconds
+    assert probe.probe_duration_ms(str(song)) == 1500
+
+
+def test_probe_mp3_duration(tmp_path):
+    """Test MP3 durations from a frame walk and from a Xing header."""
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x20" + b"\0" * 32
+
+    # No summary header: every frame header is walked
+    cbr = tmp_path / "cbr.mp3"
+    cbr.write_bytes(id3v2 + _mp3_frames(100))
+    assert probe.probe_duration_ms(str(cbr)) == 100 * 1152 * 1000 // 44100
+
+    # The Xing frame count wins over the frames actually present
+    xing_frame = _MP3_HEADER + b"\0" * 32 + b"Xing" + struct.pack(">II", 1, 5000)
+    vbr = tmp_path / "vbr.mp3"
+    vbr.write_bytes(_mp3_frames(10, first_frame=xing_frame))
+    assert probe.probe_duration_ms(str(vbr)) == 5000 * 1152 * 1000 // 44100
+
+    not_audio = tmp_path / "not_audio.mp3"
+    not_audio.write_bytes(b"hello" * 100)
+    assert probe.probe_duration_ms(str(not_audio)) is None
+
+
+def test_song_duration_is_memoized_with_fallback(tmp_path):
+    """Test that durations are cached per file and decoding is a last resort."""
+    song = tmp_path / "song.mp3"
+    song.write_bytes(_mp3_frames(50))
+    fallback = MagicMock(return_value=1234)
+
+    first = probe.song_duration_ms(str(song), fallback=fallback)
+    assert first == 50 * 1152 * 1000 // 44100
+    with patch.object(probe, "probe_duration_ms") as mock_probe:
+        assert probe.song_duration_ms(str(song), fallback=fallback) == first
+        mock_probe.assert_not_called()
+    fallback.assert_not_called()
+
+    garbage = tmp_path / "garbage.mp3"
+    garbage.write_bytes(b"hello")
+    assert probe.song_duration_ms(str(garbage), fallback=fallback) == 1234
+    assert probe.song_duration_ms(str(garbage), fallback=fallback) == 1234
+    fallback.assert_called_once_with(str(garbage))
+
+
+def test_seek_index_maps_times_to_frame_offsets(tmp_path):
+    """Test seek tables: frame-accurate offsets, background builds, disk cache."""
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x20" + b"\0" * 32
+    song = tmp_path / "song.mp3"
+    song.write_bytes(id3v2 + _mp3_frames(400))  # about 10.4 seconds
+    frame_ms = 1152 * 1000 / 44100
+
+    table = build_seek_table(str(song), interval_ms=1000)
+    assert table.duration_ms == 400 * 1152 * 1000 // 44100
+    assert len(table.times) == 11
+    time_ms, offset = table.lookup(5500)
+    assert time_ms <= 5500 < time_ms + 1000
+    # Every entry is a frame boundary with that frame's start time
+    frame = (offset - len(id3v2)) // _MP3_FRAME_LENGTH
+    assert offset == len(id3v2) + frame * _MP3_FRAME_LENGTH
+    assert time_ms == int(frame * frame_ms)
+
+    # The mixer reads the file as if it started at that frame
+    reader = TrackReader(str(song), offset)
+    assert reader.read(4) == _MP3_HEADER
+    assert reader.seek(0) == 0 and reader.tell() == 0
+    reader.close()
+
+    cache_dir = str(tmp_path / "seek_index")
+    index = SeekIndex(cache_dir, interval_ms=1000)
+    assert index.get(str(song)) is None
+    assert index.prepare(str(song))
+    deadline = time.monotonic() + 5
+    while index.get(str(song)) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert index.get(str(song)).offsets == table.offsets
+    assert not index.prepare(str(song))
+
+    # Each song has its own file, so indexing another leaves the first alone
+    cache_file = index.cache_path(str(song))
+    while not os.path.exists(cache_file) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    saved = os.stat(cache_file).st_mtime_ns
+    other = tmp_path / "other.mp3"
+    other.write_bytes(_mp3_frames(40))
+    assert index.prepare(str(other))
+    other_file = index.cache_path(str(other))
+    while not os.path.exists(other_file) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        os.path.basename(path) for path in (cache_file, other_file)
+    )
+    assert os.stat(cache_file).st_mtime_ns == saved
+
+    # A new session reads the table back instead of rebuilding it
+    restored = SeekIndex(cache_dir, interval_ms=1000)
+    with patch("apps._music_player.seek_index.build_seek_table") as mock_build:
+        assert restored.get(str(song)).lookup(5500) == (time_ms, offset)
+        assert not restored.prepare(str(song))
+        mock_build.assert_not_called()
+
+    # Changing the file makes its table stale
+    song.write_bytes(_mp3_frames(10))
+    assert restored.get(str(song)) is None
+
+
+def test_integrated_loudness_of_a_reference_tone():
+    """Test loudness against BS.1770: a -20 dBFS 1 kHz tone in stereo is -20 LUFS."""
+    import numpy as np
+
+    sample_rate = 48000
+    t = np.arange(sample_rate * 5) / sample_rate
+    tone = 0.1 * np.sin(2 * np.pi * 997 * t)
+    stereo = (np.column_stack([tone, tone]) * 32767).astype(np.int16)
+    assert abs(integrated_loudness(stereo, sample_rate) - -20) < 0.1
+
+    # Silence is gated out rather than dragging the average down; only the
+    # blocks straddling the fade count
+    silence = np.zeros((sample_rate * 5, 2), np.int16)
+    padded = np.concatenate([stereo, silence])
+    assert abs(integrated_loudness(padded, sample_rate, chunk_steps=7) - -20) < 0.25
+    assert integrated_loudness(silence, sample_rate) is None
+    assert integrated_loudness(stereo[:1000], sample_rate) is None
+
+
+def test_library_keeps_measured_gains(tmp_path):
+    """Test that gains are stored in the library cache and survive a rescan."""
+    songs = tmp_path / "songs"
+    songs.mkdir()
+    for name in ("a", "b"):
+        (songs / f"{name}.mp3").write_bytes(_mp3_frames(10))
+    cache_file = str(tmp_path / "cache.json")
+
+    library = SongLibrary(str(songs), cache_file)
+    library.start_scan()
+    _wait_for_scan(library)
+    song_a, song_b = library.paths()
+    assert library.unmeasured() == [song_a, song_b]
+
+    library.set_gains([(song_a, -6.5), (song_b, None)])
+    assert library.get_gain_db(song_a) == -6.5
+    assert library.get_gain_db(song_b) == 0.0  # unmeasurable plays unchanged
+    assert library.unmeasured() == []
+
+    # A running scan writes the cache itself; the gains are added after it
+    library.start_scan()
+    library.save()
+    assert library.unsaved_gains == 2
+    _wait_for_scan(library)
+    assert library.unsaved_gains == 0
+
+    reloaded = SongLibrary(str(songs), cache_file)
+    reloaded.load_cache()
+    assert reloaded.get_gain_db(song_a) == -6.5
+    assert reloaded.unmeasured() == []
+
+
+def test_loudness_analyzer_measures_in_worker_processes(tmp_path):
+    """Test measuring real files in the process pool."""
+    song = tmp_path / "tone.wav"
+    with wave.open(str(song), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(44100)
+        tone = [
+            int(3277 * math.sin(2 * math.pi * 997 * i / 44100)) for i in range(44100)
+        ]
+        f.writeframes(struct.pack(f"<{len(tone)}h", *tone))
+    broken = tmp_path / "broken.wav"
+    broken.write_bytes(b"RIFF nonsense")
+
+    analyzer = LoudnessAnalyzer(target_lufs=-18.0, workers=1)
+    analyzer.add([str(song), str(broken), str(song)])
+    assert analyzer.busy
+    results = {}
+    deadline = time.monotonic() + 60
+    while analyzer.busy and time.monotonic() < deadline:
+        results.update(analyzer.poll())
+        time.sleep(0.05)
+    analyzer.shutdown()
+
+    # Played as stereo, the -20 dBFS tone measures -20 LUFS: 2 dB too quiet
+    assert abs(results[str(song)] - 2.0) < 0.2
+    assert results[str(broken)] is None
+
+
+def _syncsafe(size):
+    return bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def _id3v2(frames, version=3):
+    """Build an ID3v2 tag from (frame id, data) pairs."""
+    body = b""
+    for frame_id, data in frames:
+        size = _syncsafe(len(data)) if version == 4 else struct.pack(">I", len(data))
+        body += frame_id + size + b"\0\0" + data
+    body += b"\0" * 16  # Padding
+    return b"ID3" + bytes([version, 0, 0]) + _syncsafe(len(body)) + body
+
+
+def _apic(picture_type, image, encoding=0, description=b"cover\0"):
+    header = bytes([encoding]) + b"image/png\0" + bytes([picture_type])
+    return header + description + image
+
+
+def test_extract_art_from_id3_and_wav(tmp_path):
+    """Test finding the front cover in MP3 and WAV tags."""
+    back, front = b"\x89PNG back", b"\x89PNG front\0\0 with zeros"
+    song = tmp_path / "song.mp3"
+    song.write_bytes(
+        _id3v2(
+            [
+                (b"TIT2", b"\0Title"),
+                (b"APIC", _apic(4, back)),
+                (b"APIC", _apic(3, front)),
+            ]
+        )
+        + _mp3_frames(5)
+    )
+    assert extract_art(str(song)) == front
+
+    # ID3v2.4 sizes are syncsafe; UTF-16 descriptions end in two zero bytes
+    utf16 = _apic(0, back, encoding=1, description="café".encode("utf-16") + b"\0\0")
+    song.write_bytes(_id3v2([(b"APIC", utf16)], version=4) + _mp3_frames(5))
+    assert extract_art(str(song)) == back
+
+    # WAV files keep the tag in an "id3 " chunk, here inside a LIST
+    tag = _id3v2([(b"APIC", _apic(3, front))])
+    fmt = struct.pack("<HHIIHH", 1, 1, 8000, 16000, 2, 16)
+    chunks = (
+        b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"data" + struct.pack("<I", 4) + b"\0" * 4
+        + b"LIST" + struct.pack("<I", 4 + 8 + len(tag)) + b"INFO"
+        + b"id3 " + struct.pack("<I", len(tag)) + tag
+    )
+    wav = tmp_path / "song.wav"
+    wav.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks)
+    assert extract_art(str(wav)) == front
+
+    song.write_bytes(_mp3_frames(5))
+    assert extract_art(str(song)) is None
+
+
+def test_artwork_cache_makes_thumbnails_once(tmp_path):
+    """Test that thumbnails are made on the worker and then read from disk."""
+    with_art = tmp_path / "with_art.mp3"
+    with_art.write_bytes(_id3v2([(b"APIC", _apic(3, b"\x89PNG image"))]))
+    without_art = tmp_path / "without_art.mp3"
+    without_art.write_bytes(_mp3_frames(5))
+
+    def make_thumbnail(image, size, path):
+        with open(path, "wb") as f:
+            f.write(image + str(size).encode())
+
+    make_thumbnail = MagicMock(side_effect=make_thumbnail)
+    cache = ArtworkCache(str(tmp_path / "art"), 64, make_thumbnail, max_files=1)
+    assert cache.cached(str(with_art)) is None
+
+    results = {}
+    for song in (with_art, without_art):
+        cache.request(str(song))
+        deadline = time.monotonic() + 5
+        while cache.pending and time.monotonic() < deadline:
+            results.update(cache.poll())
+            time.sleep(0.01)
+        if song is with_art:
+            # Make the first thumbnail clearly the oldest one
+            os.utime(results[str(song)], ns=(0, 0))
+    thumbnail = results[str(with_art)]
+    assert results[str(without_art)] == ""
+    make_thumbnail.assert_called_once()
+
+    # The next session finds both answers on disk without extracting again
+    assert cache.cached(str(without_art)) == ""
+    # Only one thumbnail is kept, so the older one was pruned
+    assert cache.cached(str(with_art)) is None
+    assert not os.path.exists(thumbnail)
+
+
+def test_artwork_prune_removes_temp_files(tmp_path):
+    """Test that temp files left by interrupted writes don't evict thumbnails."""
+    art = tmp_path / "art"
+    art.mkdir()
+    for name in ("a", "b"):
+        (art / f"{name}.png").write_bytes(b"png")
+        (art / f"{name}.tmp.png").write_bytes(b"half")
+
+    ArtworkCache(str(art), 64, MagicMock(), max_files=2)._prune()
+    assert sorted(os.listdir(art)) == ["a.png", "b.png"]
+
+
+def test_image_cache_keeps_within_budget():
+    """Test that the least recently shown images are dropped over budget."""
+
+    def image(size):
+        return MagicMock(
+            width=MagicMock(return_value=size), height=MagicMock(return_value=size)
+        )
+
+    cache = ImageCache(budget_bytes=3 * 64 * 64 * 4)
+    for key in "abc":
+        cache.put(key, image(64))
+    assert cache.get("a") is not None  # Now the most recently used
+    cache.put("d", image(64))
+    assert cache.get("b") is None
+    assert list(cache.images) == ["c", "a", "d"]
+    assert cache.used_bytes == 3 * 64 * 64 * 4
+
+    # An image bigger than the whole budget still gets shown
+    cache.put("huge", image(512))
+    assert list(cache.images) == ["huge"]
+
+
+def test_playlist_store_journals_changes(tmp_path):
+    """Test that changes are appended to the journal and replayed on load."""
+    snapshot = tmp_path / "playlists.txt"
+    snapshot.write_text("[Favorites]\nsong1.mp3\nsong2.mp3\n\n")
+
+    store = PlaylistStore(str(snapshot))
+    assert store.load() == {"Favorites": ["song1.mp3", "song2.mp3"]}
+    store.create("Gym")
+    store.add("Gym", "song3.mp3")
+    store.remove("Favorites", "song1.mp3")
+
+    # The snapshot is untouched; the journal has one line per change
+    assert snapshot.read_text() == "[Favorites]\nsong1.mp3\nsong2.mp3\n\n"
+    assert len((tmp_path / "playlists.txt.journal").read_text().splitlines()) == 3
+
+    # A crash halfway through appending leaves a partial last line
+    with open(tmp_path / "playlists.txt.journal", "a") as f:
+        f.write('["delete", "Gy')
+
+    reloaded = PlaylistStore(str(snapshot))
+    assert reloaded.load() == {"Favorites": ["song2.mp3"], "Gym": ["song3.mp3"]}
+
+
+def test_playlist_store_compacts_atomically(tmp_path):
+    """Test that a long journal is folded into a new snapshot."""
+    snapshot = tmp_path / "playlists.txt"
+    journal = tmp_path / "playlists.txt.journal"
+    store = PlaylistStore(str(snapshot), compact_every=3)
+    store.load()
+    store.create("Mix")
+    store.add("Mix", "a.mp3")
+    assert not snapshot.exists()
+
+    store.add("Mix", "b.mp3")
+    assert snapshot.read_text() == "[Mix]\na.mp3\nb.mp3\n\n"
+    assert journal.read_text() == ""
+    assert not (tmp_path / "playlists.txt.tmp").exists()
+
+    # Replaying a journal the snapshot already contains changes nothing
+    journal.write_text('["create", "Mix"]\n["add", "Mix", "a.mp3"]\n')
+    assert PlaylistStore(str(snapshot)).load() == {"Mix": ["a.mp3", "b.mp3"]}
+
+    # A failed write leaves the old snapshot in place
+    with patch("os.replace", side_effect=OSError("disk full")):
+        assert not store.compact()
+    assert snapshot.read_text() == "[Mix]\na.mp3\nb.mp3\n\n"
+
+
+def test_playlist_store_loads_a_long_journal(tmp_path):
+    """Test that a long journal replays in linear time and is compacted on load."""
+    snapshot = tmp_path / "playlists.txt"
+    snapshot.write_text("[Mix]\n" + "".join(f"old{i}.mp3\n" for i in range(5000)))
+    journal = tmp_path / "playlists.txt.journal"
+    entries = [["create", "Mix"], ["create", "Gone"], ["delete", "Gone"]]
+    entries += [["add", "Mix", f"new{i}.mp3"] for i in range(20000)]
+    entries += [["remove", "Mix", f"old{i}.mp3"] for i in range(0, 5000, 2)]
+    entries += [["add", "Mix", "new0.mp3"], ["remove", "Mix", "new1.mp3"]]
+    journal.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+    store = PlaylistStore(str(snapshot), compact_every=100)
+    start = time.perf_counter()
+    playlists = store.load()
+    # Quadratic replay takes seconds at this size
+    assert time.perf_counter() - start < 1.0
+
+    expected = [f"old{i}.mp3" for i in range(1, 5000, 2)]
+    expected += [f"new{i}.mp3" for i in range(20000) if i != 1]
+    assert playlists == {"Mix": expected}
+    assert journal.read_text() == ""
+    assert store.journal_entries == 0
+    assert PlaylistStore(str(snapshot)).load() == playlists
+
+
+def test_song_search_ranks_matches():
+    """Test that search ranks prefix, word and substring matches, then typos."""
+    index = SongSearchIndex(
+        [
+            "Daydream Believer",
+            "Dream On",
+            "Sweet Dreams",
+            "American Dreamer",
+            "Yesterday",
+        ]
+    )
+
+    def names(results):
+        return [index.names[i] for i in results]
+
+    assert names(index.search("dream")) == [
+        "Dream On",
+        "Sweet Dreams",
+        "American Dreamer",
+        "Daydream Believer",
+    ]
+    # Short queries match the start of words
+    assert names(index.search("Dr")) == ["Dream On", "Sweet Dreams", "American Dreamer"]
+    assert names(index.search("y")) == ["Yesterday"]
+    # A typo still finds the song
+    assert names(index.search("yestreday")) == ["Yesterday"]
+    assert index.search("dream", limit=2) == [1, 2]
+    assert index.search("   ") == []
+    assert index.search("zzz") == []
+
+
+def test_song_search_ranks_a_bounded_number_of_candidates():
+    """Test that a common query only ranks the names sharing most trigrams."""
+    names = [f"Track {number} remix" for number in range(1000)] + ["Trax"]
+    index = SongSearchIndex(names, candidate_limit=20)
+    with patch.object(index, "_rank", wraps=index._rank) as rank:
+        results = index.search("track", limit=5)
+    assert rank.call_count == 20
+    assert len(results) == 5
+    assert all(names[result].startswith("Track") for result in results)
+
+
+def test_analyze_track_finds_tones_and_peaks():
+    """Test that the spectrum follows the music and the waveform its loudness."""
+    import numpy as np
+
+    sample_rate = 8000
+    t = np.arange(sample_rate * 2) / sample_rate
+    # One second of a quiet low tone, then a loud high one, in stereo
+    tone = np.where(
+        t < 1, 0.1 * np.sin(2 * np.pi * 100 * t), 0.9 * np.sin(2 * np.pi * 2000 * t)
+    )
+    samples = (np.column_stack([tone, tone]) * 32767).astype(np.int16)
+
+    analysis = analyze_track(samples, sample_rate, frame_ms=50, bars=16, peak_count=4)
+    assert analysis.levels.shape == (40, 16)
+    low, high = analysis.levels_at(500), analysis.levels_at(1500)
+    assert low.argmax() < high.argmax()
+    assert high.max() > low.max()
+    # Past the end, the last frame is shown
+    assert (analysis.levels_at(10_000) == analysis.levels[-1]).all()
+    assert np.allclose(analysis.peaks, [0.1, 0.1, 0.9, 0.9], atol=0.01)
+
+    assert analyze_track(np.zeros((0, 2), np.int16), sample_rate) is None
+
+
+def test_analysis_does_not_depend_on_block_size():
+    """Test that analysing a song in small blocks gives the same result."""
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    samples = (rng.standard_normal((12345, 2)) * 8000).astype(np.int16)
+    settings = dict(frame_ms=50, bars=8, peak_count=7, fft_size=512, block_frames=3)
+    whole = analyze_blocks([samples], 8000, **settings)
+    for size in (1, 399, 400, 1000):
+        blocks = (samples[i : i + size] for i in range(0, len(samples), size))
+        analysis = analyze_blocks(blocks, 8000, **settings)
+        assert np.array_equal(analysis.levels, whole.levels)
+        assert np.allclose(analysis.peaks, whole.peaks)
+    assert whole.levels.shape == (31, 8)
+    assert analyze_blocks(iter([]), 8000) is None
+
+
+def test_read_song_blocks(tmp_path):
+    """Test that WAVs are streamed and MP3s decoded a piece at a time."""
+    import numpy as np
+
+    song = tmp_path / "song.wav"
+    pcm = (np.arange(-5000, 5000, dtype=np.int16)).repeat(2).reshape(-1, 2)
+    with wave.open(str(song), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(pcm.tobytes())
+    decode = MagicMock()
+    blocks, sample_rate = read_song_blocks(str(song), decode, 44100, block_ms=500)
+    blocks = list(blocks)
+    assert sample_rate == 8000
+    assert [len(block) for block in blocks] == [4000, 4000, 2000]
+    assert np.allclose(np.concatenate(blocks), pcm / 32768)
+    decode.assert_not_called()
+
+    # 40 frames of 26 ms, cut into pieces of about 250 ms at frame starts
+    song = tmp_path / "song.mp3"
+    song.write_bytes(_id3v2([(b"TIT2", b"\0Title")]) + _mp3_frames(40))
+    decode = MagicMock(side_effect=lambda data: np.zeros((len(data), 2), np.int16))
+    blocks, sample_rate = read_song_blocks(str(song), decode, 44100, block_ms=250)
+    assert sample_rate == 44100
+    decode.assert_not_called()  # Pieces are only decoded as they're read
+    sizes = [len(block) for block in blocks]
+    assert sum(sizes) == 40 * _MP3_FRAME_LENGTH
+    assert all(size % _MP3_FRAME_LENGTH == 0 for size in sizes)
+    assert len(sizes) == 4
+    assert all(call.args[0][:4] == _MP3_HEADER for call in decode.call_args_list)
+
+
+def test_track_analyzer_caches_recent_songs(tmp_path):
+    """Test that songs are analysed once and only the newest few are kept."""
+    import numpy as np
+
+    decode = MagicMock(return_value=([np.ones(800, np.float32)], 8000))
+    songs = []
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        (tmp_path / name).write_bytes(name.encode())
+        songs.append(str(tmp_path / name))
+
+    def analyze(analyzer, song):
+        analyzer.request(song)
+        deadline = time.monotonic() + 5
+        while analyzer.get(song) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return analyzer.get(song)
+
+    cache_dir = tmp_path / "cache"
+    analyzer = TrackAnalyzer(decode, 2, str(cache_dir), frame_ms=50, bars=4)
+    for song in songs:
+        assert analyze(analyzer, song) is not None
+
+    analyzer.request(songs[2])
+    assert decode.call_count == 3
+    assert analyzer.get(songs[0]) is None
+    assert list(analyzer.analyses) == songs[1:]
+
+    # A new session reads the analyses from disk instead of decoding
+    reopened = TrackAnalyzer(decode, 2, str(cache_dir), frame_ms=50, bars=4)
+    analysis = analyze(reopened, songs[0])
+    assert decode.call_count == 3
+    assert analysis.levels.shape == (2, 4)
+    # Other settings, or an edited song, are analysed again
+    other = TrackAnalyzer(decode, 2, str(cache_dir), max_files=3, frame_ms=100)
+    assert analyze(other, songs[0]) is not None
+    assert decode.call_count == 4
+    assert len(list(cache_dir.glob("*.npz"))) == 3
+
+
+def test_spectrum_view_moves_existing_items():
+    """Test that drawing only moves the items created up front."""
+    import numpy as np
+
+    canvas = MagicMock()
+    view = SpectrumView(canvas, bars=4)
+    assert canvas.create_rectangle.call_count == 4
+    view.resize(400, 90)
+    levels = np.array([[0, 255, 0, 0], [0, 255, 255, 0]], np.uint8)
+    view.show(TrackAnalysis(levels, np.ones(3), frame_ms=100))
+
+    view.draw(0)
+    canvas.reset_mock()
+    view.draw(100)
+    # Only the bar that changed and the playhead move; nothing is created
+    assert canvas.coords.call_count == 2
+    bar = canvas.coords.call_args_list[0].args
+    assert bar == (view.bar_items[2], 201, 0, 299, 60)
+    assert canvas.coords.call_args_list[1].args[1] == 200  # halfway through
+    assert not canvas.create_rectangle.called and not canvas.create_line.called
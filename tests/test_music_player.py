@@ -28,17 +28,28 @@ class MockPygame:
             _position = 0
             _loaded_file = None
 
+            _queued_file = None
+
             @classmethod
-            def load(cls, filename):
+            def load(cls, filename, namehint=""):
                 cls._loaded_file = filename
+                cls._queued_file = None
                 return True
 
+            @classmethod
+            def queue(cls, filename):
+                cls._queued_file = filename
+
             @classmethod
             def play(cls, start=0):
                 cls._busy = True
                 cls._position = start * 1000 if isinstance(start, (int, float)) else 0
                 return True
 
+            @classmethod
+            def set_volume(cls, volume):
+                cls._volume = volume
+
             @classmethod
             def pause(cls):
                 return True
@@ -72,6 +83,7 @@ class MockPygame:
                 cls._busy = False
                 cls._position = -1
                 cls._loaded_file = None
+                cls._queued_file = None
 
         class Sound:
             def __init__(self, file_path):
@@ -174,9 +186,9 @@ def music_player(mock_tkinter, mock_pygame, mock_os_functions):
 def test_music_player_initialization(music_player):
     """Test that the music player initializes correctly."""
     # Verify player state
-    assert music_player.state is not None
-    assert not music_player.state.is_playing
-    assert not music_player.state.song_paused
+    assert music_player.service.state is not None
+    assert not music_player.service.state.is_playing
+    assert not music_player.service.state.song_paused
 
     # Verify playlist was loaded
     assert music_player.playlist is not None
@@ -191,24 +203,24 @@ def test_play_pause_functionality(music_player, mock_pygame):
     music_player.play()
 
     # Verify player state after play
-    assert music_player.state.is_playing
-    assert not music_player.state.song_paused
+    assert music_player.service.state.is_playing
+    assert not music_player.service.state.song_paused
     assert mock_pygame.mixer.music.get_busy()
 
     # Test pause
     music_player.play()
 
     # Verify player state after pause
-    assert not music_player.state.is_playing
-    assert music_player.state.song_paused
+    assert not music_player.service.state.is_playing
+    assert music_player.service.state.song_paused
     music_player.pause_play.configure.assert_called_with(text=music_player.ICON_PLAY)
 
     # Test resume
     music_player.play()
 
     # Verify player state after resume
-    assert music_player.state.is_playing
-    assert not music_player.state.song_paused
+    assert music_player.service.state.is_playing
+    assert not music_player.service.state.song_paused
     music_player.pause_play.configure.assert_called_with(text=music_player.ICON_PAUSE)
 
 
@@ -216,28 +228,28 @@ def test_next_previous_song(music_player, mock_pygame):
     """Test next and previous song functionality."""
     # Start with first song
     music_player.play()
-    assert music_player.state.current_song_index == 0
+    assert music_player.service.state.current_song_index == 0
 
     # Move to next song
     music_player.next_song()
-    assert music_player.state.current_song_index == 1
+    assert music_player.service.state.current_song_index == 1
     music_player.song_label.configure.assert_called()
 
     # Move to next song again
     music_player.next_song()
-    assert music_player.state.current_song_index == 2
+    assert music_player.service.state.current_song_index == 2
 
     # Move to next song (should wrap around to first)
     music_player.next_song()
-    assert music_player.state.current_song_index == 0
+    assert music_player.service.state.current_song_index == 0
 
     # Move to previous song (should go to last)
     music_player.prev_song()
-    assert music_player.state.current_song_index == 2
+    assert music_player.service.state.current_song_index == 2
 
     # Move to previous song again
     music_player.prev_song()
-    assert music_player.state.current_song_index == 1
+    assert music_player.service.state.current_song_index == 1
 
 
 def test_song_selection(music_player, mock_pygame):
@@ -246,24 +258,25 @@ def test_song_selection(music_player, mock_pygame):
     music_player.select_song(1)
 
     # Verify the correct song was selected
-    assert music_player.state.current_song_index == 1
-    assert music_player.state.is_playing
+    assert music_player.service.state.current_song_index == 1
+    assert music_player.service.state.is_playing
 
     # Verify song label was updated
     music_player.song_label.configure.assert_called()
 
     # Try to select invalid index
-    original_index = music_player.state.current_song_index
+    original_index = music_player.service.state.current_song_index
     music_player.select_song(99)  # Invalid index
 
     # Index should not change
-    assert music_player.state.current_song_index == original_index
+    assert music_player.service.state.current_song_index == original_index
 
 
 def test_update_song_display(music_player):
     """Test that song display updates correctly."""
     # Set a specific song
-    music_player.state.current_song_index = 1
+    music_player.service.state.current_song_index = 1
+    music_player.service._publish()
 
     # Update the display
     music_player._update_song_display()
@@ -276,16 +289,16 @@ def test_update_song_display(music_player):
 def test_slider_interaction(music_player):
     """Test progress slider interaction."""
     # Set up mock song length
-    music_player.state.current_song_length = 180000  # 3 minutes in ms
+    music_player.service.state.current_song_length = 180000  # 3 minutes in ms
 
     # Instead of calling the _on_slider_change method, let's directly simulate what it would do
     # Set the seek_offset directly to 50% of the song length
     expected_offset = 90000  # 50% of 180000ms = 90000ms (90 seconds)
-    music_player.state.seek_offset = expected_offset
+    music_player.service.state.seek_offset = expected_offset
 
     # Verify seeking behavior
-    assert music_player.state.seek_offset > 0
-    assert music_player.state.seek_offset == expected_offset
+    assert music_player.service.state.seek_offset > 0
+    assert music_player.service.state.seek_offset == expected_offset
 
 
 def test_global_instance_functions(mock_tkinter, mock_pygame, mock_os_functions):
@@ -305,7 +318,8 @@ def test_global_instance_functions(mock_tkinter, mock_pygame, mock_os_functions)
                 hasattr(music_player_module, "_music_player_instance")
                 and music_player_module._music_player_instance
             ):
-                return music_player_module._music_player_instance.state.is_playing
+                player = music_player_module._music_player_instance
+                return player.service.state.is_playing
             return False
 
         music_player_module.is_playing = is_playing
@@ -328,7 +342,7 @@ def test_global_instance_functions(mock_tkinter, mock_pygame, mock_os_functions)
     assert not music_player_module.is_playing()
 
     # Make the player play
-    music_player_module._music_player_instance.state.is_playing = True
+    music_player_module._music_player_instance.service.state.is_playing = True
 
     # Check is_playing function again
     assert music_player_module.is_playing()
@@ -390,6 +404,35 @@ def test_playlist_basic_operations(music_player, mock_pygame, mock_os_functions)
     assert playlist.get_song_name(10) == "No song selected"
 
 
+def test_playlist_membership_and_names_are_maintained(music_player):
+    """Test that batch adds keep the membership set and display names in step."""
+    Playlist = type(music_player.playlist.playlists[0])
+    playlist = Playlist("Batch")
+    songs = [f"track{i:04d}.mp3" for i in range(1000)]
+
+    # Display names are worked out once per added song, not per song per add
+    with patch.object(os.path, "splitext", wraps=os.path.splitext) as splitext:
+        for song in songs + songs:
+            playlist.add_song(song)
+    assert splitext.call_count == 1000
+    assert len(playlist.song_paths) == 1000
+    assert playlist.display_names[999] == "track0999"
+
+    assert playlist.remove_song(0)
+    assert "track0000.mp3" not in playlist
+    assert "track0001.mp3" in playlist
+    assert playlist.get_song_name(0) == "track0001"
+    assert playlist.add_song("track0000.mp3")
+    assert playlist.display_names[-1] == "track0000"
+
+    # Positions are found by track ID without reading paths through the table
+    track_id = playlist.tracks.id_of("track0000.mp3")
+    with patch.object(playlist.tracks, "paths", None):
+        assert playlist.index_of_track(track_id) == 999
+    playlist.remove_song(999)
+    assert playlist.index_of_track(track_id) is None
+
+
 def test_playlist_manager_basic_operations(
     music_player, mock_os_functions, monkeypatch
 ):
@@ -468,11 +511,116 @@ def test_playlist_manager_file_operations(music_player, mock_os_functions, monke
     assert "Favorites" in playlist_names
     assert "Recently Added" in playlist_names
 
+    # Saved songs are checked against the library, not the file system
+    favorites = music_player.playlist.playlists[playlist_names.index("Favorites")]
+    assert [os.path.basename(path) for path in favorites.song_paths] == [
+        "song1.mp3",
+        "song2.mp3",
+    ]
+
     # Test save playlists
-    with patch("builtins.open", mock_open_file):
+    with patch("builtins.open", mock_open_file), patch("os.replace"):
         assert music_player.playlist.save_playlists()
 
 
+def test_playlist_files_are_cached_until_the_playlist_changes(tmp_path, music_player):
+    """Test that the resolved song paths are only rebuilt after a change."""
+    manager = music_player.playlist
+    manager.store.journal_file = str(tmp_path / "playlists.txt.journal")
+    files = manager.playlist_files
+    assert manager.playlist_files is files
+    assert len(files) == 3
+    assert manager.get_current_song_path(1) == files[1]
+    assert manager.get_current_song_path(3) is None
+
+    manager.create_playlist("Mix")
+    manager.switch_playlist(1)
+    assert manager.playlist_files == ()
+    manager.add_song_to_current_playlist(2)
+    mix_files = manager.playlist_files
+    assert mix_files == (f"{manager.songs_folder}/song3.mp3",)
+
+    # Each playlist keeps its own view
+    manager.switch_playlist(0)
+    assert manager.playlist_files is files
+    manager.switch_playlist(1)
+    assert manager.playlist_files is mix_files
+
+    manager.remove_song_from_current_playlist(0)
+    assert manager.playlist_files == ()
+
+
+def test_added_songs_are_queued_by_the_service(tmp_path, music_player, mock_pygame):
+    """Test that songs added to the playing playlist are handed to the service."""
+    manager = music_player.playlist
+    manager.store.journal_file = str(tmp_path / "playlists.txt.journal")
+    manager.create_playlist("Mix")
+    manager.switch_playlist(1)
+    manager.add_song_to_current_playlist(0)
+    music_player.service.select(manager.playlist_files, 0)
+    music_player.play()
+    assert mock_pygame.mixer.music._queued_file == manager.playlist_files[0]
+
+    music_player.playlist_selector_var = MagicMock()
+    music_player.playlist_selector_var.get.return_value = "Mix"
+    music_player.notification_frame = MagicMock()
+    music_player.notification_label = MagicMock()
+    listbox = MagicMock()
+    listbox.curselection.return_value = [1]  # song3, after song2
+    buttons = {}
+
+    def button(*args, **kwargs):
+        buttons[kwargs.get("text")] = kwargs.get("command")
+        return MagicMock()
+
+    with patch("tkinter.Listbox", return_value=listbox), patch(
+        "tkinter.Scrollbar"
+    ), patch("tkinter.Button", side_effect=button), patch.object(
+        music_player, "_create_playlist_items"
+    ):
+        music_player._show_add_song_dialog()
+        buttons["Add Selected"]()
+
+    songs_folder = manager.songs_folder
+    assert music_player.service.songs == (
+        f"{songs_folder}/song1.mp3",
+        f"{songs_folder}/song3.mp3",
+    )
+    assert mock_pygame.mixer.music._queued_file == f"{songs_folder}/song3.mp3"
+    assert music_player.service.snapshot.current_song_index == 0
+
+
+def test_playlists_share_one_track_table(tmp_path, music_player):
+    """Test that playlists hold track IDs into the manager's table, not strings."""
+    manager = music_player.playlist
+    manager.store.journal_file = str(tmp_path / "playlists.txt.journal")
+    all_songs = manager.playlists[0]
+    assert all_songs.tracks is manager.tracks
+    assert all_songs.track_ids.typecode == "I"
+    assert len(manager.tracks) == 3
+
+    manager.create_playlist("Mix")
+    manager.switch_playlist(1)
+    assert manager.add_song_to_current_playlist(1)
+    mix = manager.playlists[1]
+    assert mix.tracks is manager.tracks
+    assert mix.track_ids[0] == all_songs.track_ids[1]
+    assert mix.song_paths[0] is all_songs.song_paths[1]
+    assert len(manager.tracks) == 3
+
+    # A rescan reuses the rows of songs it already knows
+    manager.update_songs(
+        list(manager.available_songs) + [f"{manager.songs_folder}/song4.mp3"],
+        lambda path: 1000,
+    )
+    assert len(manager.tracks) == 4
+    assert manager.tracks.durations.tolist() == [1000] * 4
+    assert manager.tracks.duration_of(f"{manager.songs_folder}/song4.mp3") == 1000
+    assert manager.tracks.duration_of("missing.mp3") == 0
+    assert mix.track_ids[0] == manager.available_ids[1]
+    assert manager.playlists[0].display_names[-1] == "song4"
+
+
 def test_playlist_ui_integration(music_player):
     """Test integration between playlists and UI."""
     # Mock UI elements for playlist
@@ -580,46 +728,43 @@ def test_playback_state_operations():
     # Test initial state
     assert not state.is_playing
     assert not state.song_paused
-    assert not state.is_seeking
     assert state.current_song_index == 0
     assert state.current_song_length == 0
 
     # Test pause/resume
-    state.is_playing = True
-    current_time = time.time()
-    state.song_start_time = current_time - 10  # Started 10 seconds ago
+    state.start_new_song()
+    state.timer.seek(10_000_000_000)  # Started 10 seconds ago
 
     state.pause()
     assert not state.is_playing
     assert state.song_paused
-    pause_time = state.pause_time
+    paused_elapsed = state.get_elapsed_time_ms()
 
     time.sleep(0.1)  # Small delay
 
+    # Time spent paused doesn't count
+    assert state.get_elapsed_time_ms() == paused_elapsed
     state.resume()
     assert state.is_playing
     assert not state.song_paused
-    # Verify song_start_time was adjusted
-    assert state.song_start_time > current_time - 10
+    assert 10000 <= state.get_elapsed_time_ms() < 10100
 
     # Test start_new_song
     state.start_new_song()
     assert state.is_playing
     assert not state.song_paused
     assert state.seek_offset == 0
-    assert state.song_start_time >= current_time
+    assert state.get_elapsed_time_ms() < 100
 
     # Test seek_to_position
     song_length = 180000  # 3 minutes in ms
-    state.song_start_time = time.time()
     position_seconds = state.seek_to_position(50, song_length)  # 50%
     assert position_seconds == 90  # 90 seconds (50% of 3 minutes)
     assert state.seek_offset == 90000  # 90 seconds in ms
 
     # Test get_elapsed_time_ms
-    state.song_start_time = time.time() - 10  # Started 10 seconds ago
     elapsed = state.get_elapsed_time_ms()
-    assert 9900 <= elapsed <= 10100  # Allow small time difference due to test execution
+    assert 90000 <= elapsed <= 90100  # Allow small time difference due to test execution
 
     # Test when not playing
     state.is_playing = False
@@ -634,7 +779,8 @@ def test_music_player_ui_methods(music_player):
     music_player.time_display_label.configure.assert_called_with(text="1:30 / 0:00")
 
     # Test with song length
-    music_player.state.current_song_length = 180000  # 3 min
+    music_player.service.state.current_song_length = 180000  # 3 min
+    music_player.service._publish()
     music_player._update_time_display(90)  # 1:30
     music_player.time_display_label.configure.assert_called_with(text="1:30 / 3:00")
 
@@ -670,11 +816,12 @@ def test_slider_events(music_player, mock_pygame):
     """Test slider event handlers."""
     # Mock event
     event = MagicMock()
-    music_player.state.is_playing = True
+    music_player.service.state.is_playing = True
+    music_player.service._publish()
 
     # Test _on_slider_press
     music_player._on_slider_press(event)
-    assert music_player.state.is_seeking
+    assert music_player.is_seeking
 
     # Test _on_slider_release with seek
     with patch.object(music_player, "_seek_to_slider_position") as mock_seek:
@@ -682,7 +829,7 @@ def test_slider_events(music_player, mock_pygame):
         mock_seek.assert_called_once()
 
     # Test _on_slider_change
-    music_player.state.is_seeking = True
+    music_player.is_seeking = True
     music_player.progress_slider.set = MagicMock()
     music_player._on_slider_change("50.0")
     music_player.progress_slider.set.assert_called_with(50.0)
@@ -743,29 +890,142 @@ def test_create_playlist_dialog(music_player):
 
 
 def test_song_end_checker(music_player, mock_pygame):
-    """Test the song end checker functionality."""
-    # Setup for song end condition
-    music_player.state.is_playing = True
+    """Test that the service starts the next song when nothing was queued."""
+    music_player._start_current_song()
+    songs = music_player.playlist.playlist_files
     mock_pygame.mixer.music._busy = False  # Song ended
-    music_player.state.is_seeking = False
 
-    # Mock next_song
-    with patch.object(music_player, "next_song") as mock_next:
-        music_player._check_song_finished()
-        mock_next.assert_called_once()
+    music_player.service._check_song_finished()
+    assert music_player.service.state.current_song_index == 1
+    assert mock_pygame.mixer.music._loaded_file == songs[1]
+    assert music_player.service.state.is_playing
+
+    # Nothing to do once playback has stopped
+    music_player.service.stop()
+    music_player.service._check_song_finished()
+    assert music_player.service.state.current_song_index == 1
+    assert not mock_pygame.mixer.music.get_busy()
+
+
+def test_next_song_is_queued_for_gapless_playback(music_player, mock_pygame):
+    """Test that the next song is queued and state follows the mixer onto it."""
+    music_player.service.state.current_song_index = 0
+    music_player._start_current_song()
+    service = music_player.service
+    songs = music_player.playlist.playlist_files
+    assert mock_pygame.mixer.music._queued_file == songs[1]
+
+    # Still inside the first song: nothing to do
+    service._check_song_finished()
+    assert music_player.service.state.current_song_index == 0
+
+    # The mixer is still busy but the first song's length has passed, so it
+    # has already moved on to the queued one without being reloaded
+    music_player.service.state.timer.seek(180_500 * 1_000_000)
+    service._check_song_finished()
+    service._publish()  # As the worker does after every wake-up
+
+    assert music_player.service.state.current_song_index == 1
+    assert mock_pygame.mixer.music._loaded_file == songs[0]
+    assert 500 <= music_player.service.state.get_elapsed_time_ms() < 600
+    assert mock_pygame.mixer.music._queued_file == songs[2]
+
+    # The page catches up with the new song on its next progress update
+    music_player._update_progress()
+    music_player.song_label.configure.assert_called_with(text="song2")
+
+
+def test_worker_wakes_when_the_song_is_due_to_end(music_player, mock_pygame):
+    """Test that the worker sleeps until the song ends, then follows the mixer."""
+    music_player.service.state.current_song_index = 0
+    music_player._start_current_song()
+    service = music_player.service
+
+    # The worker sleeps until just before the queued song starts, to set
+    # its volume
+    assert 179.98 < service._time_to_song_end() <= 179.99
+    music_player.service.state.timer.seek(179_990 * 1_000_000)
+    service._check_song_finished()
+    assert service.queued_gain_applied
+    assert music_player.service.state.current_song_index == 0
+
+    # Then until just after the song is due to end
+    assert 0.02 <= service._time_to_song_end() <= 0.03
+
+    music_player.service.state.timer.seek(180_020 * 1_000_000)
+    service._check_song_finished()
+    assert music_player.service.state.current_song_index == 1
+    assert mock_pygame.mixer.music._loaded_file == service.songs[0]
+
+    # Idle while paused
+    service.pause()
+    assert service._time_to_song_end() is None
+
+
+def test_page_only_reads_published_snapshots(music_player, mock_pygame):
+    """Test that the page sends commands and never changes the live state."""
+    service = music_player.service
+    service.thread = MagicMock()  # Queue commands as if the worker were running
+
+    music_player._update_song_display()
+    music_player.select_song(2)
+    assert service.state.current_song_index == 0
+    assert service.snapshot.current_song_index == 0
+    # The page shows the picked song straight away, and the old snapshot
+    # doesn't flip it back before the worker gets to the command
+    music_player.song_label.configure.assert_called_with(text="song3")
+    music_player._update_progress()
+    music_player.song_label.configure.assert_called_with(text="song3")
+
+    # The worker runs the command and publishes the result
+    command, args = service.commands.get_nowait()
+    command(*args)
+    service._publish()
+    assert service.snapshot.current_song_index == 2
+    assert service.snapshot.is_playing
+    assert service.snapshot.song_path == music_player.playlist.playlist_files[2]
 
-    # Test background mode
-    mock_pygame.mixer.music._busy = False
-    with patch.object(music_player, "_start_current_song") as mock_start:
-        music_player._check_song_finished(is_background_mode=True)
-        mock_start.assert_called_once()
+
+def test_playback_continues_without_the_page(
+    mock_tkinter, mock_pygame, mock_os_functions
+):
+    """Test that the service thread plays on after the page is destroyed."""
+    spec = importlib.util.spec_from_file_location(
+        "music_player", "apps/music_player.py"
+    )
+    music_player_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(music_player_module)
+
+    mock_page = MagicMock()
+    mock_root = MagicMock()
+    music_player_module.create(mock_page, mock_root)
+    player = music_player_module._music_player_instance
+    player.playlist.load_songs()
+
+    service = player.service
+    service.start()
+    player._start_current_song()
+
+    # Commands are handled on the service thread
+    deadline = time.monotonic() + 2
+    while not service.state.is_playing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert service.state.is_playing
+    assert music_player_module.is_running()
+
+    with patch.object(mock_pygame.mixer, "quit") as mock_quit:
+        music_player_module.destroy(mock_page, mock_root)
+        mock_quit.assert_not_called()
+    assert mock_pygame.mixer.music.get_busy()
+    assert music_player_module.is_running()
 
 
 def test_error_handling_in_progress_update(music_player, mock_pygame):
     """Test error handling in _update_progress method."""
     # Set up conditions
-    music_player.state.is_playing = True
-    music_player.state.current_song_length = 180000  # 3 min
+    music_player.service.state.is_playing = True
+    music_player.service.state.current_song_length = 180000  # 3 min
+    music_player.service._publish()
 
     # Test normal path
     music_player._update_progress()
@@ -773,7 +1033,9 @@ def test_error_handling_in_progress_update(music_player, mock_pygame):
 
     # Test error path
     with patch.object(
-        music_player.state, "get_elapsed_time_ms", side_effect=Exception("Test error")
+        type(music_player.service.snapshot),
+        "get_elapsed_time_ms",
+        side_effect=Exception("Test error"),
     ):
         # Should not raise exception
         music_player._update_progress()
@@ -782,26 +1044,25 @@ def test_error_handling_in_progress_update(music_player, mock_pygame):
 def test_playlist_methods_with_no_songs(music_player):
     """Test playlist methods when no songs are available."""
     # Clear songs
-    music_player.playlist.playlists[0].song_paths = []
-    music_player.playlist.playlists[0]._update_display_names()
+    music_player.playlist.playlists[0].set_songs([])
 
     # Test play with no songs
-    music_player.state.is_playing = False
+    music_player.service.state.is_playing = False
     music_player.play()
-    assert not music_player.state.is_playing
+    assert not music_player.service.state.is_playing
 
     # Test next_song with no songs
-    original_index = music_player.state.current_song_index
+    original_index = music_player.service.state.current_song_index
     music_player.next_song()
-    assert music_player.state.current_song_index == original_index
+    assert music_player.service.state.current_song_index == original_index
 
     # Test prev_song with no songs
     music_player.prev_song()
-    assert music_player.state.current_song_index == original_index
+    assert music_player.service.state.current_song_index == original_index
 
     # Test select_song with no songs
     music_player.select_song(0)
-    assert music_player.state.current_song_index == original_index
+    assert music_player.service.state.current_song_index == original_index
 
 
 def test_initialize_player(music_player):
@@ -846,32 +1107,148 @@ def test_initialize_player(music_player):
 def test_seek_operations(music_player, mock_pygame):
     """Test seeking operations in more detail."""
     # Setup
-    music_player.state.is_playing = True
-    music_player.state.current_song_length = 180000  # 3 min
-
-    # Patch the playlist to return a valid song path
     with patch.object(
         music_player.playlist, "get_current_song_path", return_value="song1.mp3"
     ):
-        # Test _seek_to_slider_position
-        music_player.progress_slider.get.return_value = 50
-        music_player._seek_to_slider_position()
+        music_player._start_current_song()
+    assert music_player.service.state.current_song_length == 180000  # 3 min
+
+    # Test _seek_to_slider_position
+    music_player.progress_slider.get.return_value = 50
+    music_player._seek_to_slider_position()
+    assert mock_pygame.mixer.music._loaded_file == "song1.mp3"
+    assert mock_pygame.mixer.music._position == 90000
+    assert 90000 <= music_player.service.state.get_elapsed_time_ms() < 90100
+    assert music_player.service.state.is_playing
+
+    # Verify time display was updated
+    music_player.time_display_label.configure.assert_called_with(
+        text="1:30 / 3:00"
+    )
 
-        # Verify time display was updated
-        music_player.time_display_label.configure.assert_called()
+    # Test with song_length = 0 (should calculate length)
+    music_player.service.state.current_song_length = 0
+    music_player._seek_to_slider_position()
+    # Should have set length (180 seconds * 1000 = 180000 ms)
+    assert music_player.service.state.current_song_length == 180000
 
-        # Test with song_length = 0 (should calculate length)
-        music_player.state.current_song_length = 0
-        music_player._seek_to_slider_position()
-        # Should have set length (180 seconds * 1000 = 180000 ms)
-        assert music_player.state.current_song_length == 180000
 
-    # Test _restart_song
+def test_seek_uses_the_seek_table(music_player, mock_pygame):
+    """Test that a seek starts the mixer at a frame the seek table points to."""
     with patch.object(
         music_player.playlist, "get_current_song_path", return_value="song1.mp3"
     ):
-        music_player._restart_song()
-        music_player.progress_slider.set.assert_called_with(0)
+        music_player._start_current_song()
+
+    table = MagicMock(duration_ms=200000)
+    table.lookup.return_value = (99750, 1234567)
+    music_player.service.seek_index = MagicMock()
+    music_player.service.seek_index.get.return_value = table
+
+    reader = MagicMock()
+    with patch.dict(music_player.service._seek.__globals__, TrackReader=reader):
+        music_player.progress_slider.get.return_value = 50
+        music_player._seek_to_slider_position()
+
+    table.lookup.assert_called_once_with(100000)
+    reader.assert_called_once_with("song1.mp3", 1234567)
+    assert mock_pygame.mixer.music._loaded_file is reader.return_value
+    # The clock follows the frame the mixer really starts at
+    assert music_player.service.state.current_song_length == 200000
+    assert 99750 <= music_player.service.state.get_elapsed_time_ms() < 99850
+    assert music_player.service.state.is_playing
+
+
+def test_playback_applies_measured_gain(music_player, mock_pygame):
+    """Test that songs play at the volume their measured gain calls for."""
+    library = MagicMock()
+    library.get_duration_ms.return_value = 180000
+    gains = {"song1.mp3": -6.0, "song2.mp3": 3.0}
+    library.get_gain_db.side_effect = lambda path: gains.get(path.split("/")[-1])
+    music_player.service.library = library
+
+    music_player.play()
+    assert abs(mock_pygame.mixer.music._volume - 0.501) < 0.001
+    # Quieter songs can't be turned up past full volume
+    music_player.next_song()
+    assert mock_pygame.mixer.music._volume == 1.0
+    # Unmeasured songs play unchanged
+    music_player.next_song()
+    assert mock_pygame.mixer.music._volume == 1.0
+
+    # On a gapless transition the queued song's volume is set just before
+    # it starts, while the old song still has its last few milliseconds
+    service = music_player.service
+    assert service.queued_song_path.endswith("song1.mp3")
+    service.state.timer.seek((180000 - 5) * 1_000_000)
+    service._check_song_finished()
+    assert abs(mock_pygame.mixer.music._volume - 0.501) < 0.001
+    assert service.state.current_song_index == 2
+    service.state.timer.seek(180010 * 1_000_000)
+    service._check_song_finished()
+    service._publish()
+    assert service.snapshot.current_song_index == 0
+    assert abs(mock_pygame.mixer.music._volume - 0.501) < 0.001
+
+    # Loading for a seek resets the volume, so it's applied again
+    mock_pygame.mixer.music._volume = 1.0
+    music_player.progress_slider.get.return_value = 50
+    music_player._seek_to_slider_position()
+    assert abs(mock_pygame.mixer.music._volume - 0.501) < 0.001
+
+
+def test_visualizer_follows_the_playing_song(music_player):
+    """Test that the visualizer asks for an analysis, then draws from it."""
+    music_player.play()
+    song_path = music_player.service.song_path
+    music_player.analyzer = MagicMock()
+    music_player.analyzer.get.return_value = None
+    music_player.visualizer = MagicMock()
+
+    music_player._update_visualizer()
+    music_player.analyzer.request.assert_called_once_with(song_path)
+    music_player.visualizer.show.assert_called_once_with(None)
+    music_player.visualizer.draw.assert_not_called()
+
+    analysis = MagicMock()
+    music_player.analyzer.get.return_value = analysis
+    music_player.service.state.timer.seek(12_000 * 1_000_000)
+    music_player.service._publish()
+    music_player._update_visualizer()
+    music_player.visualizer.show.assert_called_with(analysis)
+    position_ms = music_player.visualizer.draw.call_args.args[0]
+    assert 12_000 <= position_ms < 12_100
+
+
+def test_album_art_is_shown_when_ready(music_player):
+    """Test that missing art is requested, then shown once the worker is done."""
+    music_player.play()
+    song_path = music_player.service.song_path
+    music_player.shown_song_index = music_player.service.state.current_song_index
+    music_player.page = MagicMock()
+    music_player.art_label = MagicMock()
+    music_player.art_images = MagicMock()
+    music_player.art_images.get.return_value = None
+    music_player.artwork = MagicMock()
+    music_player.artwork.cached.return_value = None
+
+    music_player._update_artwork()
+    music_player.artwork.request.assert_called_once_with(song_path)
+    music_player.art_label.configure.assert_called_with(image="")
+    music_player.page.schedule.assert_called_once()
+
+    image = MagicMock()
+    music_player.artwork.cached.return_value = "thumbnail.png"
+    music_player.artwork.poll.return_value = [(song_path, "thumbnail.png")]
+    music_player.artwork.pending = set()
+    photo_image = MagicMock(return_value=image)
+    d3 = music_player._load_artwork.__globals__["d3"]
+    with patch.object(d3, "PhotoImage", photo_image, create=True):
+        music_player._poll_artwork()
+    photo_image.assert_called_once_with(file="thumbnail.png")
+    music_player.art_images.put.assert_called_once_with(song_path, image)
+    music_player.art_label.configure.assert_called_with(image=image)
+    assert music_player.artwork_task is None
 
 
 def test_init_with_ui(mock_tkinter, mock_pygame, mock_os_functions):
@@ -940,7 +1317,8 @@ def test_remove_song_dialog(music_player):
     # Test with custom playlist but no song selected
     music_player._show_notification.reset_mock()
     music_player.playlist_selector_var.get.return_value = "Custom Playlist"
-    music_player.state.current_song_index = None
+    music_player.service.state.current_song_index = None
+    music_player.service._publish()
     music_player._confirm_remove_song()
     music_player._show_notification.assert_called_with(
         "No song selected", notification_type="info"
@@ -948,7 +1326,8 @@ def test_remove_song_dialog(music_player):
 
     # Test with valid conditions but dialog already active
     music_player._show_notification.reset_mock()
-    music_player.state.current_song_index = 0
+    music_player.service.state.current_song_index = 0
+    music_player.service._publish()
     music_player.dialog_active = True
 
     with patch.object(music_player.playlist, "has_songs", return_value=True):
@@ -981,6 +1360,99 @@ def test_create_playlist_container(music_player):
                     mock_scrollbar.assert_called()
 
 
+def test_song_list_recycles_rows(music_player):
+    """Test that the song list only has widgets for the rows in view."""
+    names = [f"track{i:04d}" for i in range(5000)]
+    playlist = music_player.playlist.playlists[0]
+    playlist.set_songs([f"{name}.mp3" for name in names])
+
+    music_player.canvas = MagicMock()
+    music_player.scrollbar = MagicMock()
+    music_player.canvas.winfo_height.return_value = 90  # 4 rows
+    music_player.canvas.winfo_width.return_value = 300
+    music_player.canvas.canvasy.return_value = 0
+
+    with patch("tkinter.Button", side_effect=lambda *a, **k: MagicMock()) as button:
+        music_player._create_playlist_items()
+        # Visible rows plus overscan, not one per song
+        assert button.call_count == 8
+        assert music_player.song_rows[0][0].configure.call_args.kwargs["text"] == (
+            "track0000"
+        )
+
+        # Scrolling down one row only relabels the row that came into view
+        music_player.canvas.canvasy.return_value = 3 * 30  # rows are 30 px
+        for row in music_player.song_rows:
+            row[0].configure.reset_mock()
+        music_player._on_song_list_scrolled(0.0, 0.1)
+        relabelled = [
+            row[0].configure.call_args.kwargs["text"]
+            for row in music_player.song_rows
+            if row[0].configure.called
+        ]
+        assert relabelled == ["track0008"]
+
+        # Clicking a recycled row selects the song it currently shows
+        with patch.object(music_player, "select_song") as select_song:
+            row = music_player.song_rows[8 % 8]
+            row[0].configure.call_args.kwargs["command"]()
+            select_song.assert_called_once_with(8)
+
+        # Switching to a short playlist hides the rows it doesn't need
+        playlist.set_songs(["a.mp3", "b.mp3"])
+        music_player.canvas.canvasy.return_value = 0
+        music_player._create_playlist_items()
+        assert button.call_count == 8
+        shown = [row[2] for row in music_player.song_rows if row[2] is not None]
+        assert sorted(shown) == [0, 1]
+
+
+def test_search_view_lists_and_plays_library_matches(tmp_path, music_player):
+    """Test that typing in the search box lists matches and plays the one picked."""
+    music_player.playlist.store.journal_file = str(tmp_path / "playlists.txt.journal")
+    music_player.canvas = MagicMock()
+    music_player.scrollbar = MagicMock()
+    music_player.canvas.winfo_height.return_value = 90
+    music_player.canvas.winfo_width.return_value = 300
+    music_player.canvas.canvasy.return_value = 0
+    music_player.search_entry = MagicMock()
+    music_player.playlist_selector_var = MagicMock()
+    music_player.delete_playlist_btn = MagicMock()
+
+    with patch("tkinter.Button", side_effect=lambda *a, **k: MagicMock()):
+        music_player.search_entry.get.return_value = "song3"
+        music_player._on_search_changed()
+        assert music_player.song_names == ["song3"]
+
+        # Picking a result from another playlist plays it from "All Songs"
+        music_player.playlist.create_playlist("Empty")
+        music_player.playlist.switch_playlist(1)
+        with patch.object(music_player, "select_song") as select_song:
+            music_player._on_song_row_clicked(0)
+            select_song.assert_called_once_with(2)
+        assert music_player.playlist.current_playlist_index == 0
+        assert music_player.search_results is None
+        music_player.search_entry.delete.assert_called_with(0, "end")
+        assert music_player.song_names == ["song1", "song2", "song3"]
+
+        # Nothing matches
+        music_player.search_entry.get.return_value = "zzz"
+        music_player._on_search_changed()
+        assert music_player.song_names == []
+        assert music_player.song_list_message is not None
+
+        # Later searches reuse the message's canvas window
+        windows = music_player.canvas.create_window.call_count
+        music_player.search_entry.get.return_value = "zzzz"
+        music_player._on_search_changed()
+        music_player.search_entry.get.return_value = "song"
+        music_player._on_search_changed()
+        assert music_player.canvas.create_window.call_count == windows
+        music_player.canvas.itemconfigure.assert_any_call(
+            music_player.song_list_message_window, state="hidden"
+        )
+
+
 def test_control_buttons_creation(music_player):
     """Test creation of playback control buttons."""
     # Mock UI methods
@@ -1025,19 +1497,90 @@ def test_start_stop_timers(music_player):
     # Setup
     music_player.ui_built = True
     music_player.root = MagicMock()
-
-    # Test start/stop song end checker
-    music_player._start_song_end_checker()
-    music_player.root.after.assert_called()
-
-    music_player.song_end_check_id = 123
-    music_player._stop_song_end_checker()
-    music_player.root.after_cancel.assert_called_with(123)
+    music_player.page.schedule.side_effect = lambda *args, **kwargs: MagicMock()
 
     # Test start/stop progress updates
     music_player._start_progress_updates()
-    music_player.root.after.assert_called()
+    progress_task = music_player.progress_task
+    assert music_player.page.schedule.call_args.args[1] == music_player._update_progress
 
-    music_player.progress_update_id = 456
     music_player._stop_progress_updates()
-    music_player.root.after_cancel.assert_called_with(456)
+    progress_task.cancel.assert_called_once()
+    assert music_player.progress_task is None
+
+
+def test_library_updates_keep_current_song(music_player):
+    """Test that scanner results refresh "All Songs" without losing the song."""
+    songs_folder = music_player.playlist.songs_folder
+    music_player.service.state.current_song_index = 1  # song2
+    music_player.service._publish()
+    music_player._create_playlist_items = MagicMock()
+    music_player._update_song_display = MagicMock()
+
+    library = MagicMock()
+    library.poll.return_value = True
+    library.scanning = False
+    library.paths.return_value = [
+        f"{songs_folder}/{name}.mp3" for name in ("new", "song1", "song2", "song3")
+    ]
+    library.get_duration_ms.return_value = 240000
+    library.get_gain_db.return_value = None
+    library.unmeasured.return_value = []
+    music_player.library = music_player.service.library = library
+    music_player.library_task = MagicMock()
+    library_task = music_player.library_task
+
+    music_player._poll_library()
+
+    assert music_player.playlist.available_song_names == [
+        "new",
+        "song1",
+        "song2",
+        "song3",
+    ]
+    assert music_player.service.state.current_song_index == 2
+    music_player._create_playlist_items.assert_called_once()
+    # The scan is over, so polling stops
+    library_task.cancel.assert_called_once()
+
+    # Song lengths come from the track table instead of decoding the file
+    library.get_duration_ms.reset_mock()
+    music_player._start_current_song()
+    library.get_duration_ms.assert_not_called()
+    assert music_player.service.state.current_song_length == 240000
+
+
+def test_reopened_page_resumes_library_work(music_player):
+    """Test that scan and loudness work left by a closed page is picked up."""
+    library = MagicMock(scanning=True)
+    library.unmeasured.return_value = ["a.mp3"]
+    music_player.library = library
+    music_player.loudness = MagicMock()
+    music_player.page = MagicMock()
+    music_player.playlist_selector_var = MagicMock()
+    music_player.delete_playlist_btn = MagicMock()
+    assert music_player.playlist.songs_loaded
+
+    with patch.object(music_player, "_build_full_ui"), patch.object(
+        music_player, "_create_playlist_items"
+    ), patch.object(music_player, "_update_song_display"), patch.object(
+        music_player, "_update_playlist_selector"
+    ), patch.object(
+        music_player.service, "start"
+    ), patch.object(
+        music_player, "_load_library"
+    ) as load_library:
+        music_player._initialize_player()
+
+    # The scan was still running, so its queued batches are collected
+    load_library.assert_not_called()
+    music_player.page.schedule.assert_called_once()
+    assert music_player.page.schedule.call_args.args[1] == music_player._poll_library
+
+    # Once it's done, songs still missing a gain are measured again
+    music_player.library_task = None
+    music_player.page.reset_mock()
+    library.scanning = False
+    music_player._resume_library_work()
+    music_player.loudness.add.assert_called_once_with(["a.mp3"])
+    assert music_player.page.schedule.call_args.args[1] == music_player._poll_loudness
@@ -263,14 +263,14 @@ def test_player_initialization_and_destroy(ui_music_player):
     # Test destroy
     module._music_player_instance = player
 
-    # Mock pygame mixer state
+    # Playback is left running in the service
     with patch.object(player, "_unbind_scroll_events"):
-        with patch.object(player, "_stop_song_end_checker"):
-            with patch.object(player, "_stop_progress_updates"):
-                with patch("pygame.mixer.get_init", return_value=True):
-                    with patch("pygame.mixer.music.stop"):
-                        with patch("pygame.mixer.quit"):
-                            module.destroy(mock_page, mock_root)
+        with patch.object(player, "_stop_progress_updates"):
+            with patch("pygame.mixer.music.stop") as mock_stop:
+                with patch("pygame.mixer.quit") as mock_quit:
+                    module.destroy(mock_page, mock_root)
+                    mock_stop.assert_not_called()
+                    mock_quit.assert_not_called()
 
 
 def test_notification_system(ui_music_player):
@@ -328,26 +328,28 @@ def test_additional_methods(ui_music_player):
         mock_modules.__contains__.return_value = True
 
         # Setup for successful test
-        player.state.current_song_index = 0
+        player.service.state.current_song_index = 0
         with patch.object(
             player.playlist, "get_current_song_path", return_value="song1.mp3"
         ):
             player._start_current_song()
-            assert player.state.is_playing
+            assert player.service.state.is_playing
 
     # Test _pause_playback and _resume_playback
     with patch.object(player, "_stop_progress_updates"):
         player._pause_playback()
-        assert not player.state.is_playing
-        assert player.state.song_paused
+        assert not player.service.state.is_playing
+        assert player.service.state.song_paused
 
     with patch.object(player, "_update_playing_state_ui"):
         # Test when paused
-        player.state.song_paused = True
+        player.service.state.song_paused = True
+        player.service._publish()
         with patch.object(player, "_start_progress_updates"):
             player._resume_playback()
 
         # Test when not paused (should call _start_current_song)
-        player.state.song_paused = False
+        player.service.state.song_paused = False
+        player.service._publish()
         with patch.object(player, "_start_current_song"):
             player._resume_playback()
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import timing
+
+
+def test_timer_counts_only_while_running():
+    """Test that the timer ignores time spent paused."""
+    with patch.object(timing.time, "monotonic_ns") as mock_monotonic_ns:
+        mock_monotonic_ns.return_value = 1_000
+        timer = timing.timer()
+        assert not timer.running
+        assert timer.elapsed_ns() == 0
+
+        timer.start()
+        mock_monotonic_ns.return_value = 5_000_000
+        assert timer.running
+        assert timer.elapsed_ns() == 4_999_000
+
+        timer.pause()
+        mock_monotonic_ns.return_value = 900_000_000
+        assert timer.elapsed_ns() == 4_999_000
+
+        timer.start()
+        mock_monotonic_ns.return_value = 903_000_000
+        assert timer.elapsed_ms() == 7
+
+
+def test_timer_seek_and_reset():
+    """Test seeking while running or paused, and resetting to zero."""
+    with patch.object(timing.time, "monotonic_ns") as mock_monotonic_ns:
+        mock_monotonic_ns.return_value = 0
+        timer = timing.timer()
+
+        # Seeking a paused timer keeps it paused at the new position
+        timer.seek(2_000_000_000)
+        mock_monotonic_ns.return_value = 1_000_000_000
+        assert timer.elapsed_ms() == 2000
+        assert not timer.running
+
+        # Seeking a running timer carries on counting from the new position
+        timer.start()
+        timer.seek(90_000_000_000)
+        mock_monotonic_ns.return_value = 1_500_000_000
+        assert timer.elapsed_ms() == 90500
+
+        timer.reset()
+        assert not timer.running
+        assert timer.elapsed_ns() == 0
+
+
+def test_timer_copy_is_independent():
+    """Test that a copy keeps counting like the original but can't change it."""
+    with patch.object(timing.time, "monotonic_ns") as mock_monotonic_ns:
+        mock_monotonic_ns.return_value = 0
+        timer = timing.timer()
+        timer.start()
+        mock_monotonic_ns.return_value = 3_000_000
+        copy = timer.copy()
+        assert copy.running
+
+        timer.pause()
+        mock_monotonic_ns.return_value = 5_000_000
+        assert timer.elapsed_ms() == 3
+        assert copy.elapsed_ms() == 5
+
+        copy.seek(0)
+        assert timer.elapsed_ms() == 3
@@ -1,5 +1,6 @@
+import time
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Import the app modules
 import importlib
@@ -84,3 +85,79 @@ class TestApps:
         # Verify special apps are in the list based on config
         assert "clock" in apps_list
         assert "stopwatch" in apps_list
+
+    @pytest.mark.parametrize("app_name", ["clock", "stopwatch"])
+    def test_update_loop_is_a_page_task(self, app_name):
+        """Test that update loops run on the page's scheduler and stop on destroy."""
+        app_module = importlib.import_module(f"apps.{app_name}")
+        page_mock = MagicMock()
+        root_mock = MagicMock()
+
+        app_module.create(page_mock, root_mock)
+        update_task = page_mock.schedule.return_value
+        page_mock.schedule.assert_called_once()
+        root_mock.after.assert_not_called()
+
+        app_module.destroy(page_mock, root_mock)
+        update_task.cancel.assert_called_once()
+
+    def test_stopwatch_skips_unchanged_labels(self):
+        """Test that the stopwatch only reconfigures labels whose text changed."""
+        stopwatch = importlib.import_module("apps.stopwatch")
+        instance = stopwatch.StopwatchApp()
+        instance.time_lbl = MagicMock()
+        instance.hundredths_lbl = MagicMock()
+
+        instance.render("00:01", ".50")
+        instance.render("00:01", ".53")
+
+        instance.time_lbl.configure.assert_called_once_with(text="00:01")
+        assert instance.hundredths_lbl.configure.call_count == 2
+
+    def test_stopwatch_formats_elapsed_time(self):
+        """Test the minutes, seconds and hundredths shown for an elapsed time."""
+        stopwatch = importlib.import_module("apps.stopwatch")
+        instance = stopwatch.StopwatchApp()
+        instance.page = MagicMock()
+        instance.time_lbl = MagicMock()
+        instance.hundredths_lbl = MagicMock()
+
+        instance.elapsed_ns = 605_070_000_000
+        instance.update_time()
+
+        instance.time_lbl.configure.assert_called_once_with(text="10:05")
+        instance.hundredths_lbl.configure.assert_called_once_with(text=".07")
+
+    def test_clock_updates_only_changed_labels(self):
+        """Test that the clock reads the time once and skips unchanged labels."""
+        clock = importlib.import_module("apps.clock")
+        page_mock = MagicMock()
+        clock.create(page_mock, MagicMock())
+        instance = clock._clock_instance
+        try:
+            page_mock.schedule.assert_called_once_with(
+                1000, instance.update, align=True
+            )
+
+            # Same minute, new second: only the seconds label changes
+            first = time.struct_time((2024, 5, 6, 14, 30, 15, 0, 127, 0))
+            second = time.struct_time((2024, 5, 6, 14, 30, 16, 0, 127, 0))
+            instance.time_lbl = MagicMock()
+            instance.seconds_lbl = MagicMock()
+            instance.date_lbl = MagicMock()
+            with patch.object(clock.time, "localtime", side_effect=[first, second]):
+                instance.update()
+                instance.time_lbl.configure.reset_mock()
+                instance.date_lbl.configure.reset_mock()
+                instance.update()
+
+            instance.seconds_lbl.configure.assert_called_with(text="16")
+            instance.time_lbl.configure.assert_not_called()
+            instance.date_lbl.configure.assert_not_called()
+
+            # Low-power mode hides the seconds and wakes once a minute
+            instance.set_low_power(True)
+            instance.seconds_lbl.place_forget.assert_called_once()
+            page_mock.schedule.assert_called_with(60000, instance.update, align=True)
+        finally:
+            clock.destroy(page_mock, MagicMock())
@@ -1,3 +1,5 @@
+import ast
+import os
 import pytest
 import importlib.util
 from unittest.mock import MagicMock, patch, ANY
@@ -17,7 +19,7 @@ de333r = load_module_from_path("de333r", "de333r.py")
 
 # For main and apper, we need to patch before import
 with patch("apper._get_app_list", return_value=["clock", "stopwatch"]):
-    with patch("apper._app_modules", [MagicMock(), MagicMock()]):
+    with patch("apper._app_modules", {"clock": MagicMock(), "stopwatch": MagicMock()}):
         main = load_module_from_path("main", "main.py")
         apper = load_module_from_path("apper", "apper.py")
 
@@ -42,12 +44,8 @@ class TestTitanApp:
             == config.config["animation"].TWEEN_DURATION
         )
         assert (
-            self.app.anim_config.TWEEN_CHECK_INTERVAL
-            == config.config["animation"].TWEEN_CHECK_INTERVAL
-        )
-        assert (
-            self.app.anim_config.TWEEN_STEP_SIZE
-            == config.config["animation"].TWEEN_STEP_SIZE
+            self.app.anim_config.TWEEN_FRAME_RATE
+            == config.config["animation"].TWEEN_FRAME_RATE
         )
 
     def test_get_next_page_index_forward(self):
@@ -221,6 +219,8 @@ class TestTitanApp:
         app.loaded_app.app.destroy = MagicMock()
         app.root = root_mock
         app._enable_switches = MagicMock()
+        # Without a page cache the old app is destroyed straight away
+        app.page_cache_size = 0
 
         # Create next state
         next_page = MagicMock()
@@ -240,51 +240,85 @@ class TestTitanApp:
         assert app.loaded_app == next_app
         app._enable_switches.assert_called_once()
 
-    def test_check_tween_complete_when_finished(self):
-        """Test tween completion check when animation is finished."""
-        # Set up test case
-        self.app.loaded_page = MagicMock()
-        self.app.loaded_page.finished = True
+    def test_transition_complete_caches_old_page(self):
+        """Test that the old page is hidden and suspended rather than destroyed."""
+        self.app.page_cache_size = 1
         self.app.root = MagicMock()
+        self.app._enable_switches = MagicMock()
 
-        next_page = MagicMock()
-        next_app = MagicMock()
-        next_index = 1
+        old_page = MagicMock()
+        old_app = MagicMock()
+        old_app.code = "clock"
+        self.app.loaded_page = old_page
+        self.app.loaded_app = old_app
 
-        # Mock transition complete
-        with patch.object(self.app, "_transition_complete") as mock_transition:
-            # Call check tween complete
-            self.app._check_tween_complete(next_app, next_page, next_index)
+        self.app._transition_complete(MagicMock(), MagicMock(), 1)
 
-            # Verify transition complete was called
-            mock_transition.assert_called_once_with(next_app, next_page, next_index)
+        old_page.page_frame.place_forget.assert_called_once()
+        old_page.hide.assert_called_once()
+        old_app.app.suspend.assert_called_once_with(old_page, self.app.root)
+        old_app.app.destroy.assert_not_called()
+        assert self.app.page_cache["clock"] == (old_page, old_app)
 
-            # Verify root.after was not called (since we're finished)
-            self.app.root.after.assert_not_called()
+    def test_page_cache_evicts_least_recently_used(self):
+        """Test that pages beyond the cache size are destroyed oldest first."""
+        self.app.page_cache_size = 1
+        self.app.root = MagicMock()
 
-    def test_check_tween_complete_when_not_finished(self):
-        """Test tween completion check when animation is not finished."""
-        # Set up test case
+        first_page, first_app = MagicMock(), MagicMock()
+        first_app.code = "clock"
+        second_page, second_app = MagicMock(), MagicMock()
+        second_app.code = "stopwatch"
+
+        self.app._cache_page(first_page, first_app)
+        self.app._cache_page(second_page, second_app)
+
+        first_app.app.destroy.assert_called_once_with(first_page, self.app.root)
+        second_app.app.destroy.assert_not_called()
+        assert list(self.app.page_cache) == ["stopwatch"]
+
+    @patch("main.titan.page")
+    @patch("apper.app")
+    def test_cached_page_is_resumed_not_rebuilt(self, mock_app, mock_page):
+        """Test that returning to a cached app reuses its page."""
+        self.app.list_apps = ["clock", "stopwatch"]
+        self.app.root = MagicMock()
+
+        cached_page, cached_app = MagicMock(), MagicMock()
+        self.app.page_cache["stopwatch"] = (cached_page, cached_app)
+
+        result_page, result_app = self.app._create_next_page_and_app(1)
+
+        assert (result_page, result_app) == (cached_page, cached_app)
+        cached_page.show.assert_called_once()
+        cached_app.app.resume.assert_called_once_with(cached_page, self.app.root)
+        mock_page.assert_not_called()
+        mock_app.assert_not_called()
+        assert "stopwatch" not in self.app.page_cache
+
+    def test_transition_completes_from_tween_callback(self):
+        """Test that the tween's completion callback finishes the transition."""
+        self.app.list_apps = ["clock", "stopwatch", "calculator"]
+        self.app.current_page = 0
         self.app.loaded_page = MagicMock()
-        self.app.loaded_page.finished = False
         self.app.root = MagicMock()
 
         next_page = MagicMock()
         next_app = MagicMock()
-        next_index = 1
 
-        # Mock transition complete
-        with patch.object(self.app, "_transition_complete") as mock_transition:
-            # Call check tween complete
-            self.app._check_tween_complete(next_app, next_page, next_index)
+        with patch.object(self.app, "_disable_switches"), patch.object(
+            self.app, "_create_next_page_and_app", return_value=(next_page, next_app)
+        ), patch.object(self.app, "_transition_complete") as mock_transition:
+            self.app._transition_to(1, 1)
 
-            # Verify transition complete was not called
+            # Nothing completes until the tween says so
             mock_transition.assert_not_called()
+            self.app.root.after.assert_not_called()
 
-            # Verify root.after was called to check again
-            self.app.root.after.assert_called_once_with(
-                self.app.anim_config.TWEEN_CHECK_INTERVAL, ANY  # The lambda function
-            )
+            on_complete = self.app.loaded_page.tween.call_args.kwargs["on_complete"]
+            on_complete()
+
+            mock_transition.assert_called_once_with(next_app, next_page, 1)
 
     def test_enable_switches(self):
         """Test that switch buttons are properly enabled."""
@@ -305,6 +339,43 @@ class TestTitanApp:
         self.app.home_btn.configure.assert_called_once_with(state="normal")
         self.app.apps_btn.configure.assert_called_once_with(state="normal")
 
+    def test_switch_to_app_uses_position_lookup(self):
+        """Test that switching by name resolves the index from apper's lookup table."""
+        self.app.list_apps = ["app1", "app2", "app3"]
+        self.app.current_page = 0
+        self.app.loaded_page = MagicMock()
+        self.app.root = MagicMock()
+
+        with patch.object(
+            main.apper, "_app_index", {"app1": 0, "app2": 1, "app3": 2}
+        ), patch.object(self.app, "_disable_switches"), patch.object(
+            self.app, "_create_next_page_and_app"
+        ) as mock_create:
+            mock_create.return_value = (MagicMock(), MagicMock())
+
+            self.app.switch_to_app("app3")
+            mock_create.assert_called_once_with(2)
+
+            mock_create.reset_mock()
+            self.app.switch_to_app("missing")
+            mock_create.assert_not_called()
+
+    def test_show_running_apps_skips_apps_without_the_hook(self):
+        """Test that only apps whose manifest lists is_running are asked."""
+        self.app.list_apps = ["app1", "app2"]
+        running = MagicMock()
+        running.is_running.return_value = True
+
+        with patch.object(main.titan, "popup") as mock_popup, patch.object(
+            main.apper, "has_hook", side_effect=lambda name, hook: name == "app1"
+        ), patch.object(
+            main.apper, "get_app_module", return_value=running
+        ) as mock_get_module:
+            self.app.show_running_apps()
+
+        mock_get_module.assert_called_once_with("app1", load=False)
+        mock_popup.return_value.add_button.assert_called_once_with("app1", ANY)
+
     @patch("main.titan.page")
     @patch("apper.app")
     def test_create_next_page_and_app(self, mock_app, mock_page):
@@ -357,6 +428,70 @@ class TestApperModule:
         assert app_instance.code == first_app
         assert app_instance.app is not None
 
+    def _apps_config(self, tmp_path):
+        """Build an app config pointing at a temporary apps directory."""
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        (apps_dir / "alpha.py").write_text(
+            "def create(page, root):\n"
+            "    root.after(10, print)\n"
+            "def is_running():\n"
+            "    return False\n"
+        )
+        (apps_dir / "beta.py").write_text("def create(page, root):\n    pass\n")
+
+        class AppsConfig(config.AppConfig):
+            APPS_DIRECTORY = str(apps_dir)
+            APPS_PRIORITY_ORDER = ["beta"]
+            APPS_MANIFEST_FILE = str(tmp_path / "manifest.json")
+
+        return AppsConfig
+
+    def test_manifest_describes_apps_without_importing(self, tmp_path):
+        """Test that discovery records each app's hooks from the source."""
+        apps_config = self._apps_config(tmp_path)
+        with patch.dict(apper.config, {"app": apps_config}), patch.dict(
+            apper._app_info
+        ):
+            apps = apper._get_app_list()
+
+            assert apps == ["beta", "alpha"]
+            assert apper.get_app_info("alpha")["hooks"] == ["create", "is_running"]
+            assert apper.has_hook("alpha", "is_running")
+            assert not apper.has_hook("beta", "is_running")
+            assert (tmp_path / "manifest.json").exists()
+
+    def test_manifest_rereads_only_changed_apps(self, tmp_path):
+        """Test that entries are refreshed per file, not per directory."""
+        apps_config = self._apps_config(tmp_path)
+        manifest_file = tmp_path / "manifest.json"
+        with patch.dict(apper.config, {"app": apps_config}), patch.dict(
+            apper._app_info
+        ):
+            apper._get_app_list()
+            saved = manifest_file.stat().st_mtime_ns
+
+            with patch("ast.parse") as mock_parse:
+                assert apper._get_app_list() == ["beta", "alpha"]
+                mock_parse.assert_not_called()
+            assert manifest_file.stat().st_mtime_ns == saved
+
+            # Editing a file leaves the directory's mtime alone
+            apps_dir = tmp_path / "apps"
+            directory_mtime = apps_dir.stat().st_mtime_ns
+            (apps_dir / "beta.py").write_text(
+                "def create(page, root):\n    pass\n"
+                "def is_running():\n    return True\n"
+            )
+            os.utime(apps_dir, ns=(directory_mtime, directory_mtime))
+            with patch("ast.parse", wraps=ast.parse) as mock_parse:
+                apper._get_app_list()
+                assert mock_parse.call_count == 1
+            assert apper.has_hook("beta", "is_running")
+
+            (apps_dir / "gamma.py").write_text("")
+            assert apper._get_app_list() == ["beta", "alpha", "gamma"]
+
 
 class TestConfigModule:
     def test_config_has_window_settings(self):
@@ -369,8 +504,8 @@ class TestConfigModule:
     def test_config_has_animation_settings(self):
         """Test that config has animation settings."""
         assert hasattr(config.config["animation"], "TWEEN_DURATION")
-        assert hasattr(config.config["animation"], "TWEEN_CHECK_INTERVAL")
-        assert hasattr(config.config["animation"], "TWEEN_STEP_SIZE")
+        assert hasattr(config.config["animation"], "TWEEN_FRAME_RATE")
+        assert hasattr(config.config["animation"], "TWEEN_EASING")
 
 
 class TestDe333rModule:
@@ -420,12 +555,13 @@ class TestApperAppClass:
         self.root_mock = MagicMock()
         # Mock the module-level variables
         self.original_app_list = apper._app_list
-        self.original_app_modules = apper._app_modules
+        self.original_app_modules = dict(apper._app_modules)
 
     def teardown_method(self):
         """Restore original module-level variables after each test."""
-        apper._app_list = self.original_app_list
-        apper._app_modules = self.original_app_modules
+        apper._set_app_list(self.original_app_list)
+        apper._app_modules.clear()
+        apper._app_modules.update(self.original_app_modules)
 
     def test_app_initialization_exact_implementation(self):
         """Test the exact implementation of app initialization."""
@@ -434,8 +570,8 @@ class TestApperAppClass:
         mock_app_module.create = MagicMock()
 
         # Set up the module-level variables
-        apper._app_list = ["test_app"]
-        apper._app_modules = [mock_app_module]
+        apper._set_app_list(["test_app"])
+        apper._app_modules["test_app"] = mock_app_module
 
         # Create app instance
         app_instance = apper.app(self.page_mock, "test_app", self.root_mock)
@@ -444,7 +580,7 @@ class TestApperAppClass:
         assert app_instance.code == "test_app"  # Tests self.code = code
         assert (
             app_instance.app == mock_app_module
-        )  # Tests self.app = _app_modules[_app_list.index(code)]
+        )  # Tests self.app = _app_modules[code]
         mock_app_module.create.assert_called_once_with(
             self.page_mock, self.root_mock
         )  # Tests self.app.create(page, root)
@@ -456,8 +592,8 @@ class TestApperAppClass:
         mock_module2 = MagicMock()
 
         # Set up the module-level variables with multiple apps
-        apper._app_list = ["app1", "app2"]
-        apper._app_modules = [mock_module1, mock_module2]
+        apper._set_app_list(["app1", "app2"])
+        apper._app_modules.update(app1=mock_module1, app2=mock_module2)
 
         # Create app instance for second app
         app_instance = apper.app(self.page_mock, "app2", self.root_mock)
@@ -466,6 +602,17 @@ class TestApperAppClass:
         assert app_instance.app == mock_module2
         assert app_instance.app != mock_module1
 
+    def test_index_lookup_stays_in_sync_with_list(self):
+        """Test that name -> index lookups follow the ordered app list."""
+        apper._set_app_list(["app1", "app2", "app3"])
+        assert apper.index("app3") == 2
+        assert apper.index("missing") is None
+
+        apper._set_app_list(["app3", "app1"])
+        assert apper.index("app3") == 0
+        assert apper.index("app2") is None
+        assert apper.get_app_module("app2") is None
+
     def test_app_create_called_with_correct_params(self):
         """Test that app.create is called with exactly the right parameters."""
         # Create mock app module
@@ -473,8 +620,8 @@ class TestApperAppClass:
         mock_app_module.create = MagicMock()
 
         # Set up the module-level variables
-        apper._app_list = ["test_app"]
-        apper._app_modules = [mock_app_module]
+        apper._set_app_list(["test_app"])
+        apper._app_modules["test_app"] = mock_app_module
 
         # Create app instance
         apper.app(self.page_mock, "test_app", self.root_mock)
@@ -485,9 +632,49 @@ class TestApperAppClass:
     def test_app_with_nonexistent_code(self):
         """Test that app raises ValueError when code is not in _app_list."""
         # Set up the module-level variables
-        apper._app_list = ["app1"]
-        apper._app_modules = [MagicMock()]
+        apper._set_app_list(["app1"])
+        apper._app_modules["app1"] = MagicMock()
 
         # Attempt to create app with nonexistent code
         with pytest.raises(ValueError):
             apper.app(self.page_mock, "nonexistent", self.root_mock)
+
+    def test_app_module_imported_on_first_use(self):
+        """Test that app modules are only imported when first requested."""
+        apper._set_app_list(["lazy_app"])
+
+        mock_app_module = MagicMock()
+        with patch.object(apper, "m_import", return_value=mock_app_module) as imp:
+            assert apper.get_app_module("lazy_app", load=False) is None
+            imp.assert_not_called()
+
+            app_instance = apper.app(self.page_mock, "lazy_app", self.root_mock)
+            apper.get_app_module("lazy_app")
+
+        imp.assert_called_once_with("apps.lazy_app")
+        assert app_instance.app == mock_app_module
+        assert apper.get_app_module("lazy_app", load=False) == mock_app_module
+
+    def test_warm_up_imports_pending_apps_when_idle(self):
+        """Test that warm_up imports only unloaded apps from idle callbacks."""
+        loaded_module = MagicMock()
+        apper._set_app_list(["loaded", "pending1", "pending2"])
+        apper._app_modules["loaded"] = loaded_module
+
+        root = MagicMock()
+        root.after.side_effect = lambda delay, func: func()
+        root.after_idle.side_effect = lambda func: func()
+
+        with patch.object(apper, "m_import", side_effect=lambda name: name) as imp:
+            apper.warm_up(root, ["loaded", "pending1", "missing", "pending2"])
+
+        assert [c.args[0] for c in imp.call_args_list] == [
+            "apps.pending1",
+            "apps.pending2",
+        ]
+        assert root.after_idle.call_count == 2
+        assert apper._app_modules == {
+            "loaded": loaded_module,
+            "pending1": "apps.pending1",
+            "pending2": "apps.pending2",
+        }
@@ -0,0 +1,63 @@
+import time
+
+
+class timer:
+    """Pausable, seekable elapsed-time counter on the monotonic clock.
+
+    Everything is kept in integer nanoseconds from ``time.monotonic_ns()``,
+    so wall clock changes (NTP, a manual adjustment) never affect the count
+    and reading it involves no float rounding. A new timer is paused at zero.
+    """
+
+    __slots__ = ("_origin", "_paused_at")
+
+    def __init__(self):
+        self.reset()
+
+    @property
+    def running(self):
+        """Whether the timer is currently counting."""
+        return self._paused_at is None
+
+    def reset(self):
+        """Stop the timer and set it back to zero."""
+        now = time.monotonic_ns()
+        self._origin = now
+        self._paused_at = now
+
+    def start(self):
+        """Start counting, or carry on from where the timer was paused."""
+        if self._paused_at is not None:
+            self._origin += time.monotonic_ns() - self._paused_at
+            self._paused_at = None
+
+    def pause(self):
+        """Stop counting; the elapsed time is kept."""
+        if self._paused_at is None:
+            self._paused_at = time.monotonic_ns()
+
+    def seek(self, elapsed_ns):
+        """Jump to an elapsed time without changing whether the timer runs.
+
+        Args:
+            elapsed_ns (int): New elapsed time in nanoseconds
+        """
+        now = time.monotonic_ns() if self._paused_at is None else self._paused_at
+        self._origin = now - elapsed_ns
+
+    def copy(self):
+        """Get a separate timer at the same position, running or paused alike."""
+        other = timer.__new__(timer)
+        other._origin = self._origin
+        other._paused_at = self._paused_at
+        return other
+
+    def elapsed_ns(self):
+        """Get the elapsed time in nanoseconds."""
+        if self._paused_at is None:
+            return time.monotonic_ns() - self._origin
+        return self._paused_at - self._origin
+
+    def elapsed_ms(self):
+        """Get the elapsed time in whole milliseconds."""
+        return self.elapsed_ns() // 1_000_000